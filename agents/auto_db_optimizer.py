@@ -11,6 +11,8 @@ from datetime import datetime
 import logging
 import json
 
+from db_index_advisor import DBIndexAdvisor, save_results
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("AutoDBOptimizer")
 
@@ -125,121 +127,28 @@ recorder:
             return False
     
     def create_database_guide(self) -> bool:
-        """Create SQL index creation guide."""
+        """Recommend database indexes measured on a copy of the recorder database."""
         
-        logger.info("📊 Creating database index guide...")
+        logger.info("📊 Running recorder index advisor...")
         
-        sql_guide = """-- ============================================================================
--- DATABASE INDEX OPTIMIZATION
--- Run these SQL commands on your Home Assistant database
--- Creates indexes optimized for 968 sensors, 449 switches, 256 binary sensors
--- ============================================================================
-
--- Index 1: Sensor entity_id + time queries (CRITICAL - 968 sensors!)
-CREATE INDEX IF NOT EXISTS idx_states_sensor_time 
-ON states (entity_id, last_updated) 
-WHERE entity_id LIKE 'sensor.%';
-
--- Index 2: Switch entity_id + state queries (449 switches)
-CREATE INDEX IF NOT EXISTS idx_states_switch 
-ON states (entity_id, state)
-WHERE entity_id LIKE 'switch.%';
-
--- Index 3: Binary sensor queries (256 binary sensors)
-CREATE INDEX IF NOT EXISTS idx_states_binary
-ON states (entity_id, last_updated, state)
-WHERE entity_id LIKE 'binary_sensor.%';
-
--- Index 4: General time-range queries (all entities)
-CREATE INDEX IF NOT EXISTS idx_states_time_range 
-ON states (last_updated, entity_id, state);
-
--- ============================================================================
--- HOW TO RUN THESE COMMANDS:
--- ============================================================================
--- Option 1: Via HA Terminal & SSH add-on
---   1. Install "Terminal & SSH" add-on
---   2. Open terminal
---   3. Run: ha database execute "COPY_SQL_HERE"
---
--- Option 2: Via Database Client (MySQL/MariaDB)
---   1. Connect to your HA database
---   2. Run each CREATE INDEX command
---   3. Verify with: SHOW INDEX FROM states;
---
--- Option 3: Via phpMyAdmin (if you have it)
---   1. Open phpMyAdmin
---   2. Select homeassistant database
---   3. Go to SQL tab
---   4. Paste and execute each command
--- ============================================================================
-
--- EXPECTED RESULTS:
--- - 10-100x faster entity history queries
--- - Dashboards load 5-10x faster
--- - Reduced CPU usage during queries
--- - Better overall system performance
--- ============================================================================
-"""
+        db_path = HA_SAMBA_PATH / "home-assistant_v2.db"
+        if not db_path.exists():
+            logger.warning("⚠️ Database not accessible via Samba")
+            logger.info("   Run agents/db_index_advisor.py on a copy of home-assistant_v2.db")
+            return False
         
         try:
-            sql_file = LOCAL_CONFIG_PATH / "database_indexes.sql"
-            
-            with open(sql_file, 'w') as f:
-                f.write(sql_guide)
-            
-            logger.info(f"✅ SQL guide created: {sql_file}")
-            
-            # Also create markdown guide
-            md_guide = f"""# Database Index Creation Guide
-
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Purpose
-Create optimized indexes for your 2,479-entity setup to improve query performance by 10-100x.
-
-## SQL File
-See: `database_indexes.sql`
-
-## How to Run
-
-### Option 1: HA Terminal (Easiest if you have Terminal & SSH add-on)
-```bash
-ha database execute "CREATE INDEX IF NOT EXISTS idx_states_sensor_time ON states (entity_id, last_updated) WHERE entity_id LIKE 'sensor.%';"
-```
-
-### Option 2: Direct Database Access
-1. Find your database connection details in configuration.yaml
-2. Connect with MySQL client or phpMyAdmin
-3. Run the SQL commands from database_indexes.sql
-
-### Option 3: Wait for SSH Access
-Once you enable SSH on HA, I can run these automatically.
-
-## Expected Impact
-- **Query Speed:** 10-100x faster
-- **Dashboard Load:** 5-10x faster  
-- **CPU Usage:** Significantly reduced
-- **User Experience:** Much smoother
-
-## Verification
-After creating indexes, check with:
-```sql
-SHOW INDEX FROM states;
-```
-
-You should see 4 new indexes: idx_states_sensor_time, idx_states_switch, idx_states_binary, idx_states_time_range
-"""
-            
-            md_file = LOCAL_CONFIG_PATH / "DATABASE_INDEX_GUIDE.md"
-            with open(md_file, 'w') as f:
-                f.write(md_guide)
-            
-            logger.info(f"✅ Guide created: {md_file}")
-            return True
+            advisor = DBIndexAdvisor(db_path)
+            advice = advisor.run_analysis(benchmark=True)
+            save_results(
+                advice,
+                LOCAL_CONFIG_PATH / "agents" / "reports" / "db_index_advice.json",
+                LOCAL_CONFIG_PATH / "database_indexes.sql",
+            )
+            return advice["success"]
             
         except Exception as e:
-            logger.error(f"❌ Error creating guide: {e}")
+            logger.error(f"❌ Error running index advisor: {e}")
             return False
     
     def run_optimization(self) -> dict:
@@ -271,14 +180,17 @@ You should see 4 new indexes: idx_states_sensor_time, idx_states_switch, idx_sta
         else:
             results["steps_failed"].append("Recorder optimization")
         
-        # Step 3: Create SQL index guide
+        # Step 3: Recommend indexes from measured query plans
         if self.create_database_guide():
-            results["steps_completed"].append("Database index guide created")
+            results["steps_completed"].append("Database index advice created")
             results["manual_steps_required"].append(
-                "Run SQL commands from database_indexes.sql (or wait for SSH access)"
+                "Review and run database_indexes.sql (see DATABASE_INDEX_GUIDE.md)"
             )
         else:
-            results["steps_failed"].append("Database guide creation")
+            results["steps_failed"].append("Database index advice")
+            results["manual_steps_required"].append(
+                "Run agents/db_index_advisor.py on home-assistant_v2.db"
+            )
         
         # Step 4: Recommend HA restart
         results["manual_steps_required"].append(
@@ -338,8 +250,8 @@ You should see 4 new indexes: idx_states_sensor_time, idx_states_switch, idx_sta
         print("\n📄 Files Created:")
         print("   - configuration.yaml (updated with recorder optimization)")
         print("   - configuration.yaml.bak-TIMESTAMP (backup)")
-        print("   - database_indexes.sql (SQL commands to run)")
-        print("   - DATABASE_INDEX_GUIDE.md (instructions)")
+        print("   - database_indexes.sql (measured index recommendations)")
+        print("   - agents/reports/db_index_advice.json (query plans and timings)")
         
         print("\n" + "="*70)
 
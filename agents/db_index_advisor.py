@@ -0,0 +1,764 @@
+#!/usr/bin/env python3
+"""
+Recorder Index Advisor
+Recommends indexes for the HA recorder database from measured query plans
+
+Works on a copy of home-assistant_v2.db: inspects the real schema, replays
+representative history, statistics and Grafana queries under EXPLAIN QUERY PLAN
+with timings, derives candidate indexes from the scans and sorts in the plans,
+and with --benchmark recommends the ones that measurably help, with before/after
+latency and the extra cost of inserts.
+"""
+
+import argparse
+import json
+import logging
+import re
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("DBIndexAdvisor")
+
+DEFAULT_DB_PATH = Path("/config/home-assistant_v2.db")
+REPORTS_DIR = Path(__file__).parent / "reports"
+
+# An index is recommended if it makes a query at least this much faster
+MIN_SPEEDUP = 1.2
+
+# ... and makes inserts into its table at most this much slower. states is written on every
+# state change, so an index there has to be cheaper to maintain than on the other tables.
+MAX_WRITE_AMPLIFICATION = 2.0
+MAX_WRITE_AMPLIFICATION_BY_TABLE = {
+    "states": 1.5,
+}
+
+# Rows inserted to measure the write cost of an index
+WRITE_SAMPLE_ROWS = 1000
+
+# Column holding the time of a row, shifted when copying rows for the write measurement
+TIME_COLUMNS = {
+    "states": "last_updated_ts",
+    "statistics": "start_ts",
+    "statistics_short_term": "start_ts",
+    "events": "time_fired_ts",
+}
+
+# Representative queries, written for the current schema (metadata_id, *_ts columns)
+QUERIES = [
+    {
+        "name": "history_period",
+        "category": "history",
+        "sql": "SELECT state, last_updated_ts FROM states "
+               "WHERE metadata_id = :metadata_id AND last_updated_ts >= :start AND last_updated_ts < :end "
+               "ORDER BY last_updated_ts",
+    },
+    {
+        "name": "history_state_before_period",
+        "category": "history",
+        "sql": "SELECT state, last_updated_ts FROM states "
+               "WHERE metadata_id = :metadata_id AND last_updated_ts < :start "
+               "ORDER BY last_updated_ts DESC LIMIT 1",
+    },
+    {
+        "name": "logbook_period",
+        "category": "history",
+        "sql": "SELECT metadata_id, state, last_updated_ts FROM states "
+               "WHERE last_updated_ts >= :start AND last_updated_ts < :end",
+    },
+    {
+        "name": "statistics_period",
+        "category": "statistics",
+        "sql": "SELECT start_ts, mean, min, max, state, sum FROM statistics "
+               "WHERE metadata_id = :statistic_metadata_id AND start_ts >= :statistics_start AND start_ts < :statistics_end "
+               "ORDER BY start_ts",
+    },
+    {
+        "name": "statistics_last",
+        "category": "statistics",
+        "sql": "SELECT start_ts, state, sum FROM statistics "
+               "WHERE metadata_id = :statistic_metadata_id ORDER BY start_ts DESC LIMIT 1",
+    },
+    {
+        "name": "statistics_short_term_period",
+        "category": "statistics",
+        "sql": "SELECT start_ts, mean, min, max, state, sum FROM statistics_short_term "
+               "WHERE metadata_id = :short_term_metadata_id AND start_ts >= :short_term_start AND start_ts < :short_term_end "
+               "ORDER BY start_ts",
+    },
+    {
+        "name": "grafana_latest_state",
+        "category": "grafana",
+        "sql": "SELECT s.state FROM states s JOIN states_meta m ON s.metadata_id = m.metadata_id "
+               "WHERE m.entity_id = :entity_id ORDER BY s.last_updated_ts DESC LIMIT 1",
+    },
+    {
+        "name": "grafana_sensor_changes_per_hour",
+        "category": "grafana",
+        "sql": "SELECT CAST(s.last_updated_ts / 3600 AS INTEGER) * 3600 AS time, COUNT(*) AS changes "
+               "FROM states s JOIN states_meta m ON s.metadata_id = m.metadata_id "
+               "WHERE m.entity_id LIKE 'sensor.%' AND s.last_updated_ts >= :start "
+               "GROUP BY 1 ORDER BY 1",
+    },
+    {
+        "name": "grafana_switch_state_counts",
+        "category": "grafana",
+        "sql": "SELECT s.state, COUNT(*) AS count "
+               "FROM states s JOIN states_meta m ON s.metadata_id = m.metadata_id "
+               "WHERE m.entity_id LIKE 'switch.%' GROUP BY s.state",
+    },
+]
+
+# A step of EXPLAIN QUERY PLAN reading a table, by the name the query uses for it (alias or table).
+# Older SQLite versions print "SCAN TABLE states AS s", newer ones "SCAN s".
+PLAN_STEP_PATTERN = re.compile(r"^(SCAN|SEARCH) (?:TABLE )?(\w+)(?: AS (\w+))?(?: USING (.*))?$")
+TEMP_BTREE_PATTERN = re.compile(r"^USE TEMP B-TREE FOR (?:(?:RIGHT PART|LAST TERM) OF )?(ORDER BY|GROUP BY)")
+
+CLAUSE_PATTERN = re.compile(r"\b(SELECT|FROM|JOIN|ON|WHERE|GROUP BY|ORDER BY|HAVING|LIMIT)\b", re.IGNORECASE)
+TABLE_REFERENCE_PATTERN = re.compile(r"^\s*(\w+)(?:\s+(?:AS\s+)?(\w+))?", re.IGNORECASE)
+COLUMN_PATTERN = re.compile(r"^(?:(\w+)\.)?(\w+)$")
+# column = value, column IN (...), column < value, column BETWEEN ..., or column = other.column for joins
+CONDITION_PATTERN = re.compile(
+    r"(?:\b(\w+)\.)?\b(\w+)\s*(=|==|\bIN\b|\bIS\b|>=|<=|<|>|\bBETWEEN\b)\s*(?:(\w+)\.(\w+)\b)?",
+    re.IGNORECASE,
+)
+EQUALITY_OPERATORS = ("=", "==", "IN", "IS")
+JOIN_KEYWORDS = ("INNER", "LEFT", "RIGHT", "FULL", "CROSS", "NATURAL", "OUTER")
+
+
+def summarize_plan(rows) -> dict:
+    """Summarize EXPLAIN QUERY PLAN rows: the steps, full table scans and temporary sorts."""
+
+    details = [row[3] for row in rows]
+    steps = [match.groups() for detail in details if (match := PLAN_STEP_PATTERN.match(detail))]
+    return {
+        "plan": details,
+        "full_scans": [alias or name for kind, name, alias, using in steps if kind == "SCAN" and not using],
+        "temp_btree": any("USE TEMP B-TREE" in detail for detail in details),
+    }
+
+
+def plan_problems(details) -> list:
+    """Return the plan steps an index could avoid, as (kind, table name or alias, detail).
+
+    kind is "scan" for a full table scan or a walk over a whole index, "automatic index" for an
+    index SQLite builds for this query only, and "order by"/"group by" for a temporary sort.
+    """
+
+    problems = []
+    for detail in details:
+        if match := PLAN_STEP_PATTERN.match(detail):
+            kind, name, alias, using = match.groups()
+            if kind == "SCAN" and (not using or "INDEX" in using):
+                problems.append(("scan", alias or name, detail))
+            elif using and using.startswith("AUTOMATIC"):
+                problems.append(("automatic index", alias or name, detail))
+        elif match := TEMP_BTREE_PATTERN.match(detail):
+            problems.append((match.group(1).lower(), None, detail))
+    return problems
+
+
+def split_clauses(sql: str) -> list:
+    """Split a query into (keyword, text) pairs, e.g. ("WHERE", "metadata_id = :metadata_id")."""
+
+    parts = CLAUSE_PATTERN.split(sql)
+    return [(parts[i].upper(), parts[i + 1].strip()) for i in range(1, len(parts) - 1, 2)]
+
+
+def analyze_query(sql: str, schema: dict) -> dict:
+    """Return the tables a query reads and, per table, the columns it filters and sorts on.
+
+    Columns are "equality" (=, IN, join conditions), "range" (<, >, BETWEEN) and "order" (the
+    GROUP BY columns, else the ORDER BY columns; None if those are expressions or span tables).
+    Unqualified columns belong to the only table of the query that has them.
+    """
+
+    clauses = split_clauses(sql)
+    references = {}
+    for keyword, text in clauses:
+        if keyword in ("FROM", "JOIN") and (match := TABLE_REFERENCE_PATTERN.match(text)):
+            table, alias = match.groups()
+            references[table] = table
+            if alias and alias.upper() not in JOIN_KEYWORDS:
+                references[alias] = table
+
+    tables = {table for table in references.values() if table in schema}
+
+    def resolve(qualifier, column):
+        if qualifier:
+            table = references.get(qualifier)
+            return table if table in tables else None
+        owners = [table for table in tables if column in schema[table]["columns"]]
+        return owners[0] if len(owners) == 1 else None
+
+    columns = {table: {"equality": [], "range": [], "order": []} for table in tables}
+
+    def add(table, key, column):
+        if table is not None and column in schema[table]["columns"] and column not in columns[table][key]:
+            columns[table][key].append(column)
+
+    order_clause = None
+    for keyword, text in clauses:
+        if keyword in ("WHERE", "ON"):
+            for qualifier, column, operator, other_qualifier, other_column in CONDITION_PATTERN.findall(text):
+                key = "equality" if operator.upper() in EQUALITY_OPERATORS else "range"
+                add(resolve(qualifier, column), key, column)
+                if other_qualifier and key == "equality":
+                    add(resolve(other_qualifier, other_column), key, other_column)
+        elif keyword == "GROUP BY" or (keyword == "ORDER BY" and order_clause is None):
+            order_clause = text
+
+    if order_clause is not None:
+        order = [COLUMN_PATTERN.match(re.sub(r"\s+(ASC|DESC)$", "", term.strip(), flags=re.IGNORECASE))
+                 for term in order_clause.split(",")]
+        owners = {resolve(*match.groups()) if match else None for match in order}
+        for table in tables:
+            if owners == {table}:
+                columns[table]["order"] = [match.group(2) for match in order]
+            else:
+                columns[table]["order"] = None
+
+    return {"references": references, "columns": columns}
+
+
+def candidate_columns(usage: dict) -> list:
+    """Return the columns of an index serving a table's usage: equality columns, then the sort
+    columns or else the first range column, the order in which SQLite can use them."""
+
+    columns = list(usage["equality"])
+    for column in usage["order"] or []:
+        if column not in columns:
+            columns.append(column)
+    if not usage["order"]:
+        columns.extend(column for column in usage["range"][:1] if column not in columns)
+    return columns
+
+
+class DBIndexAdvisor:
+    """Recommend recorder indexes from the query plans and timings on a copy of the database."""
+
+    def __init__(self, db_path: Path, queries: list = None, repeat: int = 5):
+        self.db_path = Path(db_path)
+        self.queries = queries if queries is not None else QUERIES
+        self.repeat = repeat
+        self.work_dir = None
+        self.copy_path = None
+        self.conn = None
+        self.schema = {}
+        self.params = {}
+
+    def open_copy(self) -> bool:
+        """Copy the database with the SQLite backup API, so a running recorder is not disturbed."""
+
+        logger.info(f"💾 Copying {self.db_path}...")
+
+        if not self.db_path.exists():
+            logger.error(f"❌ Database not found: {self.db_path}")
+            return False
+
+        try:
+            self.work_dir = Path(tempfile.mkdtemp(prefix="db_index_advisor-"))
+            self.copy_path = self.work_dir / self.db_path.name
+
+            source = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+            self.conn = sqlite3.connect(self.copy_path, isolation_level=None)
+            source.backup(self.conn)
+            source.close()
+
+            logger.info(f"✅ Working on copy: {self.copy_path}")
+            return True
+
+        except sqlite3.Error as e:
+            logger.error(f"❌ Copy failed: {e}")
+            return False
+
+    def inspect_schema(self) -> dict:
+        """Read the tables, columns, indexes and row counts of the copy."""
+
+        logger.info("🔍 Inspecting schema...")
+
+        tables = [row[0] for row in self.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+        )]
+
+        for table in tables:
+            info = list(self.conn.execute(f'PRAGMA table_info("{table}")'))
+            columns = [row[1] for row in info]
+            # A single INTEGER PRIMARY KEY column is the rowid, the table is ordered by it
+            primary_key = [row for row in info if row[5]]
+            rowid = primary_key[0][1] if len(primary_key) == 1 and primary_key[0][2].upper() == "INTEGER" else None
+            indexes = {
+                row[1]: [info[2] for info in self.conn.execute(f'PRAGMA index_info("{row[1]}")')]
+                for row in self.conn.execute(f'PRAGMA index_list("{table}")')
+            }
+            rows = self.conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+            self.schema[table] = {"columns": columns, "rowid": rowid, "indexes": indexes, "rows": rows}
+
+        schema_version = None
+        if "schema_changes" in self.schema:
+            schema_version = self.conn.execute("SELECT MAX(schema_version) FROM schema_changes").fetchone()[0]
+
+        states_columns = self.schema.get("states", {}).get("columns", [])
+        if "states" in self.schema and "metadata_id" not in states_columns:
+            logger.warning("⚠️ states has no metadata_id column - this is a pre-2023 recorder schema")
+
+        logger.info(f"✅ Schema version {schema_version}, {len(tables)} tables")
+        for table in ("states", "statistics", "statistics_short_term"):
+            if table in self.schema:
+                logger.info(f"   {table}: {self.schema[table]['rows']} rows, {len(self.schema[table]['indexes'])} indexes")
+
+        return {"schema_version": schema_version, "tables": self.schema}
+
+    def has_columns(self, table: str, columns) -> bool:
+        """Return True if the table exists with all the columns."""
+
+        return table in self.schema and all(column in self.schema[table]["columns"] for column in columns)
+
+    def sample_parameters(self) -> dict:
+        """Pick query parameters from the data: the busiest entity and statistics, the last day."""
+
+        logger.info("🎯 Sampling query parameters...")
+
+        if self.has_columns("states", ("metadata_id", "last_updated_ts")):
+            end = self.conn.execute("SELECT MAX(last_updated_ts) FROM states").fetchone()[0]
+            if end is not None:
+                self.params["end"] = end + 1
+                self.params["start"] = end - 86400
+                row = self.conn.execute(
+                    "SELECT metadata_id FROM states WHERE last_updated_ts >= ? "
+                    "GROUP BY metadata_id ORDER BY COUNT(*) DESC LIMIT 1",
+                    (self.params["start"],),
+                ).fetchone()
+                if row is not None:
+                    self.params["metadata_id"] = row[0]
+                    if self.has_columns("states_meta", ("metadata_id", "entity_id")):
+                        entity = self.conn.execute(
+                            "SELECT entity_id FROM states_meta WHERE metadata_id = ?", (row[0],)
+                        ).fetchone()
+                        if entity is not None:
+                            self.params["entity_id"] = entity[0]
+
+        for table, prefix, period in (
+            ("statistics", "statistic", 30 * 86400),
+            ("statistics_short_term", "short_term", 86400),
+        ):
+            if not self.has_columns(table, ("metadata_id", "start_ts")):
+                continue
+            end = self.conn.execute(f"SELECT MAX(start_ts) FROM {table}").fetchone()[0]
+            if end is None:
+                continue
+            row = self.conn.execute(
+                f"SELECT metadata_id FROM {table} GROUP BY metadata_id ORDER BY COUNT(*) DESC LIMIT 1"
+            ).fetchone()
+            self.params[f"{prefix}_metadata_id"] = row[0]
+            period_prefix = "statistics" if prefix == "statistic" else prefix
+            self.params[f"{period_prefix}_end"] = end + 1
+            self.params[f"{period_prefix}_start"] = end - period
+
+        logger.info(f"✅ Parameters: {self.params}")
+        return self.params
+
+    def explain(self, sql: str) -> dict:
+        """Return the summarized query plan."""
+
+        return summarize_plan(self.conn.execute(f"EXPLAIN QUERY PLAN {sql}", self.params).fetchall())
+
+    def time_query(self, sql: str) -> float:
+        """Return the median time in ms to run the query and fetch all rows, after a warm-up run."""
+
+        self.conn.execute(sql, self.params).fetchall()
+        timings = []
+        for _ in range(self.repeat):
+            started = time.perf_counter()
+            self.conn.execute(sql, self.params).fetchall()
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
+
+    def replay_queries(self, names=None) -> dict:
+        """Run the queries (or the named ones) and return their plans and timings by name."""
+
+        results = {}
+        for query in self.queries:
+            if names is not None and query["name"] not in names:
+                continue
+            try:
+                result = self.explain(query["sql"])
+                result["ms"] = round(self.time_query(query["sql"]), 3)
+            except sqlite3.Error as e:
+                # A missing table, column or sampled parameter
+                results[query["name"]] = {"skipped": str(e)}
+                continue
+            results[query["name"]] = result
+        return results
+
+    def existing_index_for(self, table: str, columns) -> str:
+        """Return the name of an existing index starting with the columns, None if there is none."""
+
+        if columns and columns[0] == self.schema[table]["rowid"]:
+            return "INTEGER PRIMARY KEY"
+        for name, index_columns in self.schema[table]["indexes"].items():
+            if tuple(index_columns[:len(columns)]) == tuple(columns):
+                return name
+        return None
+
+    def find_candidates(self, baseline: dict) -> dict:
+        """Return candidate indexes for the scans and sorts in the query plans, with the queries they serve.
+
+        A table that is scanned, or whose GROUP BY/ORDER BY needs a temporary sort, gets a candidate
+        on the columns the query filters and sorts it by, unless an existing index starts with them.
+        """
+
+        candidates = {}
+        for query in self.queries:
+            result = baseline.get(query["name"], {})
+            if "skipped" in result:
+                continue
+
+            usage = analyze_query(query["sql"], self.schema)
+            problems = {}
+            for kind, name, detail in plan_problems(result["plan"]):
+                if name is not None:
+                    tables = [usage["references"].get(name)]
+                else:
+                    # A sort can only be avoided by an index on the table all the sort columns are from
+                    tables = [table for table, columns in usage["columns"].items() if columns["order"]]
+                for table in tables:
+                    if table in usage["columns"]:
+                        problems.setdefault(table, []).append(detail)
+
+            for table, details in problems.items():
+                columns = candidate_columns(usage["columns"][table])
+                if not columns:
+                    logger.info(f"   {query['name']}: no filter or sort on {table} an index could serve")
+                    continue
+
+                existing = self.existing_index_for(table, columns)
+                if existing is not None:
+                    # Walking another index (e.g. for ORDER BY ... LIMIT) can be the better plan
+                    if result["full_scans"]:
+                        logger.warning(
+                            f"⚠️ {query['name']}: {existing} already covers ({', '.join(columns)}) "
+                            f"but the plan is: {'; '.join(result['plan'])}"
+                        )
+                    continue
+
+                candidate = candidates.setdefault(
+                    (table, tuple(columns)),
+                    {"table": table, "columns": columns, "queries": [], "plan_steps": {}},
+                )
+                candidate["queries"].append(query["name"])
+                candidate["plan_steps"][query["name"]] = details
+
+        return candidates
+
+    def used_pages(self) -> int:
+        """Return the number of pages in use, so dropped indexes do not count."""
+
+        page_count = self.conn.execute("PRAGMA page_count").fetchone()[0]
+        freelist_count = self.conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return page_count - freelist_count
+
+    def measure_insert_ms(self, table: str) -> float:
+        """Return the median time in ms to insert WRITE_SAMPLE_ROWS copies of the latest rows, rolled back."""
+
+        time_column = TIME_COLUMNS.get(table)
+        info = list(self.conn.execute(f'PRAGMA table_info("{table}")'))
+        # Let SQLite assign the INTEGER PRIMARY KEY, shift the time so unique indexes do not conflict
+        columns = [row[1] for row in info if not row[5]]
+        values = [f"{column} + 315360000" if column == time_column else column for column in columns]
+        sql = (
+            f'INSERT INTO "{table}" ({", ".join(columns)}) '
+            f'SELECT {", ".join(values)} FROM "{table}" ORDER BY rowid DESC LIMIT {WRITE_SAMPLE_ROWS}'
+        )
+
+        timings = []
+        for _ in range(3):
+            self.conn.execute("BEGIN")
+            try:
+                started = time.perf_counter()
+                self.conn.execute(sql)
+                timings.append((time.perf_counter() - started) * 1000)
+            finally:
+                self.conn.execute("ROLLBACK")
+        return statistics.median(timings)
+
+    def benchmark_candidate(self, candidate: dict, baseline: dict) -> dict:
+        """Create the index on the copy, measure the queries and inserts, then drop it again."""
+
+        table = candidate["table"]
+        name = f"ix_advisor_{table}_{'_'.join(candidate['columns'])}"
+        logger.info(f"⏱️ Benchmarking {name}...")
+
+        insert_before = self.measure_insert_ms(table)
+        pages_before = self.used_pages()
+
+        started = time.perf_counter()
+        self.conn.execute(f'CREATE INDEX "{name}" ON "{table}" ({", ".join(candidate["columns"])})')
+        build_ms = (time.perf_counter() - started) * 1000
+
+        try:
+            page_size = self.conn.execute("PRAGMA page_size").fetchone()[0]
+            index_kb = (self.used_pages() - pages_before) * page_size / 1024
+            after = self.replay_queries(candidate["queries"])
+            insert_after = self.measure_insert_ms(table)
+        finally:
+            self.conn.execute(f'DROP INDEX "{name}"')
+
+        queries = {}
+        for query_name in candidate["queries"]:
+            before_ms = baseline[query_name]["ms"]
+            after_ms = after[query_name]["ms"]
+            queries[query_name] = {
+                "before_ms": before_ms,
+                "after_ms": after_ms,
+                "speedup": round(before_ms / after_ms, 2) if after_ms else None,
+                "plan_after": after[query_name]["plan"],
+            }
+
+        return {
+            "index_name": name,
+            "build_ms": round(build_ms, 1),
+            "index_kb": round(index_kb, 1),
+            "insert_ms_per_1000_before": round(insert_before * 1000 / WRITE_SAMPLE_ROWS, 3),
+            "insert_ms_per_1000_after": round(insert_after * 1000 / WRITE_SAMPLE_ROWS, 3),
+            "write_amplification": round(insert_after / insert_before, 2) if insert_before else None,
+            "queries": queries,
+        }
+
+    def run_analysis(self, benchmark: bool = False) -> dict:
+        """Run the complete analysis."""
+
+        print("\n" + "="*70)
+        print("  RECORDER INDEX ADVISOR")
+        print(f"  {self.db_path}")
+        print("="*70 + "\n")
+
+        results = {
+            "success": False,
+            "database": str(self.db_path),
+            "schema_version": None,
+            "queries": {},
+            "recommendations": [],
+            "rejected": [],
+            "unverified": [],
+        }
+
+        if not self.open_copy():
+            return results
+
+        try:
+            schema = self.inspect_schema()
+            results["schema_version"] = schema["schema_version"]
+            results["tables"] = {
+                table: {"rows": info["rows"], "indexes": info["indexes"]}
+                for table, info in schema["tables"].items()
+                if table in TIME_COLUMNS or table.endswith("_meta")
+            }
+            results["parameters"] = self.sample_parameters()
+
+            logger.info("📊 Replaying queries...")
+            baseline = self.replay_queries()
+            results["queries"] = baseline
+            for name, result in baseline.items():
+                if "skipped" in result:
+                    logger.warning(f"   ⏭️ {name}: skipped ({result['skipped']})")
+                else:
+                    flags = " [full scan]" if result["full_scans"] else ""
+                    flags += " [temp sort]" if result["temp_btree"] else ""
+                    logger.info(f"   {name}: {result['ms']} ms{flags}")
+
+            for candidate in self.find_candidates(baseline).values():
+                logger.info(
+                    f"   candidate {candidate['table']} ({', '.join(candidate['columns'])}) "
+                    f"for {', '.join(candidate['queries'])}"
+                )
+                if not benchmark:
+                    results["unverified"].append(candidate)
+                    continue
+                candidate["benchmark"] = self.benchmark_candidate(candidate, baseline)
+                best = max(
+                    (query["speedup"] or 0 for query in candidate["benchmark"]["queries"].values()),
+                    default=0,
+                )
+                write_amplification = candidate["benchmark"]["write_amplification"] or 1
+                max_write_amplification = MAX_WRITE_AMPLIFICATION_BY_TABLE.get(
+                    candidate["table"], MAX_WRITE_AMPLIFICATION
+                )
+                if best < MIN_SPEEDUP:
+                    candidate["reason"] = f"queries only {best}x faster (less than {MIN_SPEEDUP}x)"
+                elif write_amplification > max_write_amplification:
+                    candidate["reason"] = (
+                        f"inserts {write_amplification}x slower "
+                        f"(more than {max_write_amplification}x on {candidate['table']})"
+                    )
+                if "reason" in candidate:
+                    results["rejected"].append(candidate)
+                    continue
+                results["recommendations"].append(candidate)
+
+            results["success"] = True
+
+        except sqlite3.Error as e:
+            logger.error(f"❌ Analysis failed: {e}")
+            results["error"] = str(e)
+
+        finally:
+            self.close()
+
+        return results
+
+    def close(self):
+        """Close and remove the copy."""
+
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+        if self.work_dir:
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+            self.work_dir = None
+
+
+def create_index_statement(candidate: dict) -> str:
+    """Return the CREATE INDEX statement for a candidate."""
+
+    table = candidate["table"]
+    columns = candidate["columns"]
+    return (
+        f"CREATE INDEX IF NOT EXISTS ix_advisor_{table}_{'_'.join(columns)} "
+        f"ON {table} ({', '.join(columns)});"
+    )
+
+
+def create_index_sql(results: dict) -> str:
+    """Return the CREATE INDEX statements of the benchmarked recommendations, with the measurements
+    as comments. Candidates that were not benchmarked or were rejected are only listed as comments."""
+
+    lines = [
+        "-- ============================================================================",
+        "-- RECORDER INDEX RECOMMENDATIONS",
+        f"-- Generated by agents/db_index_advisor.py on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"-- Database: {results['database']} (schema version {results['schema_version']})",
+        "-- Review before running; stop Home Assistant or run on a backup first.",
+        "-- ============================================================================",
+        "",
+    ]
+
+    if not results["recommendations"]:
+        if results["unverified"]:
+            lines.append(
+                f"-- No index recommended: {len(results['unverified'])} candidate(s) from the query plans "
+                "were not benchmarked (run with --benchmark to measure them)."
+            )
+        elif results["rejected"]:
+            lines.append(
+                f"-- No index recommended: the benchmark rejected all {len(results['rejected'])} "
+                "candidate(s) from the query plans."
+            )
+        else:
+            lines.append("-- No index recommended: no replayed query plan has a scan or sort a new index could serve.")
+        lines.append("")
+
+    for candidate in results["recommendations"]:
+        benchmark = candidate["benchmark"]
+        lines.append(f"-- Serves: {', '.join(candidate['queries'])}")
+        for name, query in benchmark["queries"].items():
+            lines.append(f"--   {name}: {query['before_ms']} ms -> {query['after_ms']} ms")
+        lines.append(
+            f"--   inserts: {benchmark['write_amplification']}x slower, "
+            f"size: {benchmark['index_kb']} KB"
+        )
+        lines.append(create_index_statement(candidate))
+        lines.append("")
+
+    if results["unverified"]:
+        lines.append("-- UNVERIFIED: candidates from the query plans, not benchmarked. They may not make the")
+        lines.append("-- queries faster and they make every insert slower; run with --benchmark before using them.")
+        for candidate in results["unverified"]:
+            lines.append(f"-- Serves: {', '.join(candidate['queries'])}")
+            lines.append(f"-- {create_index_statement(candidate)}")
+        lines.append("")
+
+    if results["rejected"]:
+        lines.append("-- REJECTED by the benchmark:")
+        for candidate in results["rejected"]:
+            lines.append(
+                f"--   {candidate['table']} ({', '.join(candidate['columns'])}) "
+                f"for {', '.join(candidate['queries'])}: {candidate['reason']}"
+            )
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def save_results(results: dict, report_file: Path, sql_file: Path = None):
+    """Save the report and print the summary."""
+
+    report_file.parent.mkdir(exist_ok=True, parents=True)
+    report = {
+        "phase": "Recorder Index Advisor",
+        "timestamp": datetime.now().isoformat(),
+        "results": results,
+    }
+    with open(report_file, 'w') as f:
+        json.dump(report, f, indent=2)
+    logger.info(f"💾 Results saved: {report_file}")
+
+    if sql_file is not None:
+        with open(sql_file, 'w') as f:
+            f.write(create_index_sql(results))
+        logger.info(f"💾 SQL saved: {sql_file}")
+
+    print("\n" + "="*70)
+    print("  INDEX ADVISOR RESULTS")
+    print("="*70)
+
+    print(f"\n✅ Recommended: {len(results['recommendations'])}")
+    for candidate in results["recommendations"]:
+        print(f"   - {candidate['table']} ({', '.join(candidate['columns'])}) for {', '.join(candidate['queries'])}")
+        benchmark = candidate["benchmark"]
+        for name, query in benchmark["queries"].items():
+            print(f"       {name}: {query['before_ms']} ms -> {query['after_ms']} ms")
+        print(f"       inserts {benchmark['write_amplification']}x, {benchmark['index_kb']} KB")
+
+    if results["unverified"]:
+        print(f"\n❔ Not benchmarked: {len(results['unverified'])} (run with --benchmark before creating them)")
+        for candidate in results["unverified"]:
+            print(f"   - {candidate['table']} ({', '.join(candidate['columns'])}) for {', '.join(candidate['queries'])}")
+
+    if results["rejected"]:
+        print(f"\n❌ Rejected: {len(results['rejected'])}")
+        for candidate in results["rejected"]:
+            print(f"   - {candidate['table']} ({', '.join(candidate['columns'])}): {candidate['reason']}")
+
+    print("\n" + "="*70)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recommend recorder indexes from measured query plans")
+    parser.add_argument("db", nargs="?", type=Path, default=DEFAULT_DB_PATH, help="Path to home-assistant_v2.db (it is copied, never modified)")
+    parser.add_argument("--benchmark", action="store_true", help="Create each candidate index on the copy and measure it")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per query (median is reported)")
+    parser.add_argument("--queries", type=Path, help="JSON file with extra queries: [{name, category, sql}]")
+    parser.add_argument("--report", type=Path, default=REPORTS_DIR / "db_index_advice.json", help="JSON report path")
+    parser.add_argument("--sql", type=Path, help="Write the CREATE INDEX statements of the benchmarked recommendations to this file")
+    args = parser.parse_args()
+
+    queries = list(QUERIES)
+    if args.queries:
+        with open(args.queries) as f:
+            queries.extend(json.load(f))
+
+    advisor = DBIndexAdvisor(args.db, queries, args.repeat)
+    results = advisor.run_analysis(benchmark=args.benchmark)
+    save_results(results, args.report, args.sql)
+    return 0 if results["success"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,12 +5,17 @@ Connects to HA via SSH and performs automated database optimization
 """
 
 import paramiko
+import json
+import shutil
+import tempfile
 import time
 import sys
 from pathlib import Path
 from datetime import datetime
 import logging
 
+from db_index_advisor import DBIndexAdvisor, save_results
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("SSHDBOptimizer")
 
@@ -145,16 +150,9 @@ recorder:
             return False
     
     def create_database_indexes(self) -> bool:
-        """Create optimized database indexes."""
-        
-        logger.info("📊 Creating database indexes...")
+        """Recommend database indexes measured on a copy of the recorder database."""
         
-        indexes = [
-            "CREATE INDEX IF NOT EXISTS idx_states_sensor_time ON states (entity_id, last_updated) WHERE entity_id LIKE 'sensor.%';",
-            "CREATE INDEX IF NOT EXISTS idx_states_switch ON states (entity_id, state) WHERE entity_id LIKE 'switch.%';",
-            "CREATE INDEX IF NOT EXISTS idx_states_binary ON states (entity_id, last_updated, state) WHERE entity_id LIKE 'binary_sensor.%';",
-            "CREATE INDEX IF NOT EXISTS idx_states_time_range ON states (last_updated, entity_id, state);"
-        ]
+        logger.info("📊 Running recorder index advisor...")
         
         try:
             # Get database type and connection
@@ -166,31 +164,45 @@ recorder:
             
             if 'mysql' in db_info or 'mariadb' in db_info:
                 logger.info("   Database: MySQL/MariaDB")
-                # Create indexes via SQL
-                for idx, index_sql in enumerate(indexes, 1):
-                    logger.info(f"   Creating index {idx}/4...")
-                    
-                    # Execute via ha command line
-                    stdin, stdout, stderr = self.ssh_client.exec_command(
-                        f"ha database execute \"{index_sql}\""
-                    )
-                    
-                    result = stdout.read().decode()
-                    if "error" not in result.lower():
-                        logger.info(f"   ✅ Index {idx} created")
-                    else:
-                        logger.warning(f"   ⚠️ Index {idx} may already exist")
-                
-                logger.info("✅ Database indexes created")
+                logger.warning("⚠️ The index advisor analyzes SQLite databases only - skipping")
                 return True
+            
+            logger.info("   Database: SQLite")
+            reports_dir = Path(__file__).parent / "reports"
+            local_db = Path(tempfile.mkdtemp(prefix="ssh_db_optimizer-")) / "home-assistant_v2.db"
+            
+            try:
+                # Copy with the SQLite backup API on the host, so the copy is consistent while HA writes
+                remote_copy = "/tmp/home-assistant_v2.advisor.db"
+                stdin, stdout, stderr = self.ssh_client.exec_command(
+                    f"sqlite3 {HA_CONFIG_PATH}/home-assistant_v2.db \".backup {remote_copy}\""
+                )
+                if stdout.channel.recv_exit_status() != 0:
+                    logger.error(f"❌ Database copy failed: {stderr.read().decode()}")
+                    return False
                 
-            else:
-                logger.info("   Database: SQLite (indexes not as critical)")
-                logger.info("   Skipping index creation for SQLite")
-                return True
+                sftp = self.ssh_client.open_sftp()
+                try:
+                    sftp.get(remote_copy, str(local_db))
+                    sftp.remove(remote_copy)
+                finally:
+                    sftp.close()
+                
+                advice = DBIndexAdvisor(local_db).run_analysis(benchmark=True)
+                save_results(
+                    advice,
+                    reports_dir / "db_index_advice.json",
+                    reports_dir / "database_indexes.sql",
+                )
+            finally:
+                shutil.rmtree(local_db.parent, ignore_errors=True)
+            
+            # Indexes are not created automatically: review reports/database_indexes.sql first
+            logger.info(f"✅ {len(advice['recommendations'])} indexes recommended")
+            return advice["success"]
                 
         except Exception as e:
-            logger.error(f"❌ Error creating indexes: {e}")
+            logger.error(f"❌ Error running index advisor: {e}")
             return False
     
     def restart_homeassistant(self) -> bool:
@@ -236,7 +248,6 @@ recorder:
         
         results = {
             "recorder_config_added": False,
-            "indexes_created": False,
             "ha_restarted": False,
             "config_valid": False
         }
@@ -254,7 +265,6 @@ recorder:
             results["ha_restarted"] = "running" in output.lower()
             
             results["config_valid"] = results["ha_restarted"]  # If running, config is valid
-            results["indexes_created"] = True  # Assume success if no errors
             
             logger.info("✅ Optimization verification complete")
             
@@ -306,11 +316,11 @@ recorder:
             else:
                 results["steps_failed"].append("Recorder optimization")
             
-            # Step 4: Create indexes
+            # Step 4: Recommend indexes
             if self.create_database_indexes():
-                results["steps_completed"].append("Database indexes")
+                results["steps_completed"].append("Database index advice")
             else:
-                results["steps_failed"].append("Database indexes")
+                results["steps_failed"].append("Database index advice")
             
             # Step 5: Restart HA
             if self.restart_homeassistant():
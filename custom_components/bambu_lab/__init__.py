@@ -46,6 +46,13 @@ class PrintHistoryAPIView(HomeAssistantView):
         try:
             # Get query parameters for filtering
             serial_filter = request.query.get('serial')  # Optional filter by serial
+            refresh = request.query.get('refresh', '').lower() == 'true'  # Optional rescan of the cache directory
+            try:
+                # Optional pagination of the newest first list
+                offset = max(0, int(request.query.get('offset', 0)))
+                limit = int(request.query['limit']) if 'limit' in request.query else None
+            except ValueError:
+                return web.json_response({"error": "offset and limit must be integers"}, status=400)
             
             all_files = []
             total_size_bytes = 0
@@ -64,6 +71,8 @@ class PrintHistoryAPIView(HomeAssistantView):
                 
                 # Get cached files for this printer
                 try:
+                    if refresh:
+                        await coordinator.rescan_file_cache()
                     files = await coordinator.get_cached_files(file_type='prints')
                     
                     # Get the device ID from the device registry
@@ -94,7 +103,7 @@ class PrintHistoryAPIView(HomeAssistantView):
             
             # Format the response
             response_data = {
-                "files": all_files,
+                "files": all_files[offset:] if limit is None else all_files[offset:offset + limit],
                 "total_files": len(all_files),
                 "total_size_bytes": total_size_bytes,
                 "total_printers": len(set(f["printer_serial"] for f in all_files)),
@@ -132,6 +141,13 @@ class VideoAPIView(HomeAssistantView):
         try:
             # Get query parameters for filtering
             serial_filter = request.query.get('serial')  # Optional filter by serial
+            refresh = request.query.get('refresh', '').lower() == 'true'  # Optional rescan of the cache directory
+            try:
+                # Optional pagination of the newest first list
+                offset = max(0, int(request.query.get('offset', 0)))
+                limit = int(request.query['limit']) if 'limit' in request.query else None
+            except ValueError:
+                return web.json_response({"error": "offset and limit must be integers"}, status=400)
             
             all_videos = []
             total_size_bytes = 0
@@ -150,6 +166,8 @@ class VideoAPIView(HomeAssistantView):
                 
                 # Get cached files for this printer (videos)
                 try:
+                    if refresh:
+                        await coordinator.rescan_file_cache()
                     files = await coordinator.get_cached_files(file_type='timelapse')
                     
                     # Get the device ID from the device registry
@@ -180,7 +198,7 @@ class VideoAPIView(HomeAssistantView):
             
             # Format the response
             response_data = {
-                "videos": all_videos,
+                "videos": all_videos[offset:] if limit is None else all_videos[offset:offset + limit],
                 "total_videos": len(all_videos),
                 "total_size_bytes": total_size_bytes,
                 "total_printers": len(set(v["printer_serial"] for v in all_videos)),
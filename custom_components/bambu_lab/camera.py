@@ -116,7 +116,12 @@ class BambuLabImageCamera(BambuLabEntity, Camera):
         Camera.__init__(self)
 
     def camera_image(self, width: int | None = None, height: int | None = None) -> bytes | None:
-        return self.coordinator.get_model().chamber_image.get_image()
+        chamber_image = self.coordinator.get_model().chamber_image
+        # Images are only received while someone is viewing them.
+        chamber_image.renew_lease()
+        if width is None and height is None:
+            return chamber_image.get_image()
+        return chamber_image.get_thumbnail(width, height)
 
     @property
     def is_streaming(self) -> bool:
@@ -22,7 +22,7 @@ from homeassistant.helpers.selector import (
     TextSelectorType,
 )
 
-from .const import DOMAIN, LOGGER
+from .const import DEFAULT_CAMERA_MAX_FPS, DEFAULT_UPDATE_COALESCE_WINDOW, DOMAIN, LOGGER
 from .pybambu import BambuClient, BambuCloud
 from .pybambu.bambu_cloud import (
     CloudflareError,
@@ -819,6 +819,8 @@ class BambuOptionsFlowHandler(config_entries.OptionsFlow):
                         options["usage_hours"] = float(user_input['usage_hours'])
                         options["disable_ssl_verify"] = user_input['advanced']['disable_ssl_verify']
                         options["enable_firmware_update"] = user_input['advanced']['enable_firmware_update']
+                        options["update_coalesce_window"] = max(0.0, float(user_input['advanced']['update_coalesce_window']))
+                        options["camera_max_fps"] = max(0.0, float(user_input['advanced']['camera_max_fps']))
                         options["print_cache_count"] = max(-1, int(user_input['print_cache_count']))
                         options["timelapse_cache_count"] = max(-1, int(user_input['timelapse_cache_count']))
                         options["force_ip"] = force_ip
@@ -856,6 +858,8 @@ class BambuOptionsFlowHandler(config_entries.OptionsFlow):
         default_usage_hours = str(self._config_entry.options.get('usage_hours', 0)) if user_input is None else user_input['usage_hours']
         default_disable_ssl_verify = self._config_entry.options.get('disable_ssl_verify', False) if user_input is None else user_input.get('advanced', {}).get('disable_ssl_verify', self._config_entry.options.get('disable_ssl_verify', ''))
         default_enable_firmware_update = self._config_entry.options.get('enable_firmware_update', False) if user_input is None else user_input.get('advanced', {}).get('enable_firmware_update', self._config_entry.options.get('enable_firmware_update', ''))
+        default_update_coalesce_window = self._config_entry.options.get('update_coalesce_window', DEFAULT_UPDATE_COALESCE_WINDOW) if user_input is None else user_input.get('advanced', {}).get('update_coalesce_window', self._config_entry.options.get('update_coalesce_window', DEFAULT_UPDATE_COALESCE_WINDOW))
+        default_camera_max_fps = self._config_entry.options.get('camera_max_fps', DEFAULT_CAMERA_MAX_FPS) if user_input is None else user_input.get('advanced', {}).get('camera_max_fps', self._config_entry.options.get('camera_max_fps', DEFAULT_CAMERA_MAX_FPS))
 
         # Build form
         fields: OrderedDict[vol.Marker, Any] = OrderedDict()
@@ -871,6 +875,8 @@ class BambuOptionsFlowHandler(config_entries.OptionsFlow):
             vol.Schema({
                 vol.Required('disable_ssl_verify', default=default_disable_ssl_verify): BOOLEAN_SELECTOR,
                 vol.Required('enable_firmware_update', default=default_enable_firmware_update): BOOLEAN_SELECTOR,
+                vol.Optional('update_coalesce_window', default=str(default_update_coalesce_window)): NUMBER_SELECTOR,
+                vol.Optional('camera_max_fps', default=str(default_camera_max_fps)): NUMBER_SELECTOR,
             }),
             {'collapsed': True},
         )
@@ -917,6 +923,8 @@ class BambuOptionsFlowHandler(config_entries.OptionsFlow):
                 options["usage_hours"] = float(user_input['usage_hours'])
                 options["disable_ssl_verify"] = user_input['advanced']['disable_ssl_verify']
                 options["enable_firmware_update"] = user_input['advanced']['enable_firmware_update']
+                options["update_coalesce_window"] = max(0.0, float(user_input['advanced']['update_coalesce_window']))
+                options["camera_max_fps"] = max(0.0, float(user_input['advanced']['camera_max_fps']))
                 options["force_ip"] = (user_input['host'] != bambu.get_device().info.ip_address)
 
                 title = self._config_entry.data['serial']
@@ -950,6 +958,8 @@ class BambuOptionsFlowHandler(config_entries.OptionsFlow):
         default_usage_hours = str(self._config_entry.options.get('usage_hours', 0)) if user_input is None else user_input['usage_hours']
         default_disable_ssl_verify = self._config_entry.options.get('disable_ssl_verify', False) if user_input is None else user_input.get('advanced', {}).get('disable_ssl_verify', self._config_entry.options.get('disable_ssl_verify', ''))
         default_enable_firmware_update = self._config_entry.options.get('enable_firmware_update', False) if user_input is None else user_input.get('advanced', {}).get('enable_firmware_update', self._config_entry.options.get('enable_firmware_update', ''))
+        default_update_coalesce_window = self._config_entry.options.get('update_coalesce_window', DEFAULT_UPDATE_COALESCE_WINDOW) if user_input is None else user_input.get('advanced', {}).get('update_coalesce_window', self._config_entry.options.get('update_coalesce_window', DEFAULT_UPDATE_COALESCE_WINDOW))
+        default_camera_max_fps = self._config_entry.options.get('camera_max_fps', DEFAULT_CAMERA_MAX_FPS) if user_input is None else user_input.get('advanced', {}).get('camera_max_fps', self._config_entry.options.get('camera_max_fps', DEFAULT_CAMERA_MAX_FPS))
 
         fields[vol.Required('host', default=default_host)] = TEXT_SELECTOR
         fields[vol.Required('access_code', default=default_access_code)] = TEXT_SELECTOR
@@ -960,6 +970,8 @@ class BambuOptionsFlowHandler(config_entries.OptionsFlow):
             vol.Schema({
                 vol.Required('disable_ssl_verify', default=default_disable_ssl_verify): BOOLEAN_SELECTOR,
                 vol.Required('enable_firmware_update', default=default_enable_firmware_update): BOOLEAN_SELECTOR,
+                vol.Optional('update_coalesce_window', default=str(default_update_coalesce_window)): NUMBER_SELECTOR,
+                vol.Optional('camera_max_fps', default=str(default_camera_max_fps)): NUMBER_SELECTOR,
             }),
             {'collapsed': True},
         )
@@ -19,6 +19,15 @@ LOGGERFORHA = logging.getLogger(f"{__package__}_HA")
 
 SERVICE_CALL_EVENT = "bambu_lab_service_call"
 
+# Seconds over which printer pushes are merged into a single entity update.
+# Can be overridden with the 'update_coalesce_window' option; 0 disables coalescing.
+DEFAULT_UPDATE_COALESCE_WINDOW = 1.0
+
+# Maximum chamber images per second decoded and delivered to the camera entities.
+# Can be overridden with the 'camera_max_fps' option; 0 delivers every image. The camera
+# proxy polls at most twice a second, so faster images would be decoded only to be dropped.
+DEFAULT_CAMERA_MAX_FPS = 2.0
+
 PLATFORMS = (
     Platform.BINARY_SENSOR,
     Platform.BUTTON,
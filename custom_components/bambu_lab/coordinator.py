@@ -30,6 +30,8 @@ from .const import (
     DOMAIN,
     LOGGER,
     LOGGERFORHA,
+    DEFAULT_CAMERA_MAX_FPS,
+    DEFAULT_UPDATE_COALESCE_WINDOW,
     Options,
     OPTION_NAME,
     PLATFORMS,
@@ -69,12 +71,19 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
         self.latest_usage_hours = float(entry.options.get('usage_hours', 0))
         config = entry.data.copy()
         config.update(entry.options.items())
+        config.setdefault('camera_max_fps', DEFAULT_CAMERA_MAX_FPS)
         config['user_language'] = hass.config.language
         config['file_cache_path'] = self.get_file_cache_directory(config['serial'])
         self.client = BambuClient(config)
             
         self._updatedDevice = False
         self._shutdown = False
+
+        # Data objects changed since the last listener notification. None means everything is treated as changed.
+        self._changed_parts: set[str] | None = None
+        self._pending_parts: set[str] | None = set()
+        self._pending_update: asyncio.TimerHandle | None = None
+        self._update_coalesce_window = float(entry.options.get('update_coalesce_window', DEFAULT_UPDATE_COALESCE_WINDOW))
         self.data = self.get_model()
         self._eventloop = asyncio.get_running_loop()
         # Pass LOGGERFORHA logger into HA as otherwise it generates a debug output line every single time we tell it we have an update
@@ -126,13 +135,14 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
             self._printer_ready()
 
         elif event == "event_light_update":
-            self._update_data()
+            self._update_data({"lights"})
 
         elif event == "event_speed_update":
-            self._update_data()
+            self._update_data({"speed"})
 
         elif event == "event_printer_data_update":
-            self._update_data()
+            # Bursts of printer pushes are coalesced so entities are written at most once per window.
+            self._update_data(self.get_model().pop_changed_parts(), coalesce=True)
 
             # Check is usage hours change and persist to config entry if it did.
             if self.latest_usage_hours != self.get_model().info.usage_hours:
@@ -148,15 +158,16 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
 
         elif event == "event_printer_chamber_image_update":
             if self.get_option_enabled(Options.IMAGECAMERA):
-                self._update_data()
+                self._update_data({"chamber_image"})
 
         elif event == "event_printer_cover_image_update":
-            self._update_data()
+            self._update_data({"cover_image"})
 
         elif event == "event_printer_error":
             self._update_printer_error()
 
         elif event == "event_print_error":
+            self._update_data({"print_error"})
             self._update_print_error()
 
         # event_print_started
@@ -178,6 +189,10 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
     def shutdown(self) -> None:
         """ Halt the MQTT listener thread """
         self._shutdown = True
+
+        if self._pending_update is not None:
+            self._pending_update.cancel()
+            self._pending_update = None
         
         # Remove event listeners
         self._service_call_listener()
@@ -678,7 +693,34 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
         device = self.get_model()
         return device
     
-    def _update_data(self):
+    def _update_data(self, parts: set[str] | None = None, coalesce: bool = False):
+        """Notify listeners that the given data objects changed. None means all of them."""
+        if parts is not None and len(parts) == 0:
+            # Nothing changed so there is nothing for the entities to write.
+            return
+
+        if parts is None or self._pending_parts is None:
+            self._pending_parts = None
+        else:
+            self._pending_parts |= parts
+
+        if coalesce and self._update_coalesce_window > 0:
+            if self._pending_update is None:
+                self._pending_update = self.hass.loop.call_later(self._update_coalesce_window, self._flush_update)
+            return
+
+        self._flush_update()
+
+    @callback
+    def _flush_update(self):
+        if self._pending_update is not None:
+            self._pending_update.cancel()
+            self._pending_update = None
+        if self._shutdown:
+            return
+
+        self._changed_parts = self._pending_parts
+        self._pending_parts = set()
         device = self.get_model()
         try:
             self.async_set_updated_data(device)
@@ -686,6 +728,15 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
             LOGGER.error("An exception occurred calling async_set_updated_data():")
             LOGGER.error(f"Exception type: {type(e)}")
             LOGGER.error(f"Exception data: {e}")
+        finally:
+            # Anything outside of a targeted flush (e.g. a refresh) updates every entity.
+            self._changed_parts = None
+
+    def is_data_changed(self, parts: tuple[str, ...] | None) -> bool:
+        """Return whether any of the given data objects changed in the update being dispatched."""
+        if parts is None or self._changed_parts is None:
+            return True
+        return not self._changed_parts.isdisjoint(parts)
 
     def _update_printer_error(self):
         dev_reg = device_registry.async_get(self._hass)
@@ -1010,97 +1061,43 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
             fallback_path.mkdir(parents=True, exist_ok=True)
             return str(fallback_path)
 
-    async def get_cached_files(self, file_type: str) -> List[Dict[str, Any]]:
-        """Get list of cached files with metadata."""
-        cache_dir = self.get_file_cache_directory()
-        if not cache_dir:
-            return []
-            
-        cache_dir = os.path.join(cache_dir, file_type)
-        if not os.path.exists(cache_dir):
-            return []
-        
+    async def get_cached_files(self, file_type: str, offset: int = 0, limit: int | None = None) -> List[Dict[str, Any]]:
+        """Get list of cached files with metadata, newest first."""
+        file_cache = self.client.file_cache
+        if not file_cache.loaded:
+            # First use since startup: read the persisted index, or rebuild it, off the event loop.
+            await self.hass.async_add_executor_job(file_cache.load)
+
+        serial = self.get_model().info.serial
         files = []
-        cache_path = Path(cache_dir)
-        cache_root = Path(self.get_file_cache_directory())  # Get the root cache directory
-        
-        # Define file type patterns
-        type_patterns = {
-            'prints': ['*.3mf'],
-            'gcode': ['*.gcode'],
-            'timelapse': ['*.mp4', '*.avi', '*.mov'],
-        }
-        
-        patterns = type_patterns.get(file_type, ['*'])
-        
-        for pattern in patterns:
-            for file_path in cache_path.rglob(pattern):
-                if file_path.is_file():
-                    # Get file stats
-                    stat = file_path.stat()
-                    
-                    # Determine file type
-                    file_ext = file_path.suffix.lower()
-                    if file_ext == '.3mf':
-                        detected_type = 'prints'
-                    elif file_ext == '.gcode':
-                        detected_type = 'gcode'
-                    elif file_ext in ['.mp4', '.avi', '.mov']:
-                        detected_type = 'timelapse'
-                    else:
-                        detected_type = 'unknown'
-                    
-                    if detected_type != file_type:
-                        continue
-                    
-                    # Look for thumbnail
-                    thumbnail_path = None
-                    if detected_type in ['timelapse', 'prints', 'gcode']:
-                        # Create thumbnail candidates relative to cache root
-                        file_relative_path = file_path.relative_to(cache_root)
-                        thumbnail_candidates = [
-                            cache_root / file_relative_path.parent / (file_path.stem + '.jpg'),
-                            cache_root / file_relative_path.parent / (file_path.stem + '.png'),
-                            cache_root / file_relative_path.parent / (file_path.stem + '.jpeg'),
-                        ]
-                        for thumb_path in thumbnail_candidates:
-                            if thumb_path.exists():
-                                thumbnail_path = thumb_path  # Store the real path
-                                break
-                    
-                    # Format file size
-                    size_bytes = stat.st_size
-                    if size_bytes < 1024:
-                        size_human = f"{size_bytes} B"
-                    elif size_bytes < 1024 * 1024:
-                        size_human = f"{size_bytes / 1024:.1f} KB"
-                    elif size_bytes < 1024 * 1024 * 1024:
-                        size_human = f"{size_bytes / (1024 * 1024):.1f} MB"
-                    else:
-                        size_human = f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
-
-                    # Build API path relative to cache root (preserves subdirs like 'cache/')
-                    api_path = f"{self.get_model().info.serial}/{file_path.relative_to(cache_root)}"
-                    api_thumbnail_path = None
-                    if thumbnail_path:
-                        api_thumbnail_path = f"{self.get_model().info.serial}/{thumbnail_path.relative_to(cache_root)}"
-
-                    file_info = {
-                        'filename': file_path.name,
-                        'path': api_path,
-                        'type': detected_type,
-                        'size': size_bytes,
-                        'size_human': size_human,
-                        'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        'thumbnail_path': api_thumbnail_path
-                    }
-                    
-                    files.append(file_info)
-        
-        # Sort by modification time (newest first)
-        files.sort(key=lambda x: x['modified'], reverse=True)
-        
+        for relative_path, entry in file_cache.files(file_type, offset, limit):
+            # Format file size
+            size_bytes = entry['size']
+            if size_bytes < 1024:
+                size_human = f"{size_bytes} B"
+            elif size_bytes < 1024 * 1024:
+                size_human = f"{size_bytes / 1024:.1f} KB"
+            elif size_bytes < 1024 * 1024 * 1024:
+                size_human = f"{size_bytes / (1024 * 1024):.1f} MB"
+            else:
+                size_human = f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+
+            # API paths are relative to the cache root (preserves subdirs like 'cache/')
+            files.append({
+                'filename': os.path.basename(relative_path),
+                'path': f"{serial}/{relative_path}",
+                'type': entry['type'],
+                'size': size_bytes,
+                'size_human': size_human,
+                'modified': datetime.fromtimestamp(entry['mtime']).isoformat(),
+                'thumbnail_path': f"{serial}/{entry['thumbnail']}" if entry['thumbnail'] else None
+            })
+
         return files
+
+    async def rescan_file_cache(self) -> None:
+        """Rebuild the cached file index from the cache directory."""
+        await self.hass.async_add_executor_job(self.client.file_cache.rescan)
     
     async def clear_file_cache(self, file_type: str = 'all') -> Dict[str, Any]:
         """Clear the file cache."""
@@ -1109,29 +1106,7 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
             return {"success": False, "error": "File cache not enabled or directory not found"}
         
         try:
-            cache_path = Path(cache_dir)
-            deleted_count = 0
-            
-            if file_type == 'all':
-                # Delete all files in cache directory
-                for file_path in cache_path.rglob('*'):
-                    if file_path.is_file():
-                        file_path.unlink()
-                        deleted_count += 1
-            else:
-                # Delete only specific file type
-                type_patterns = {
-                    'prints': ['*.3mf'],
-                    'gcode': ['*.gcode'],
-                    'timelapse': ['*.mp4', '*.avi', '*.mov'],
-                }
-                
-                patterns = type_patterns.get(file_type, [])
-                for pattern in patterns:
-                    for file_path in cache_path.rglob(pattern):
-                        if file_path.is_file():
-                            file_path.unlink()
-                            deleted_count += 1
+            deleted_count = await self.hass.async_add_executor_job(self._clear_file_cache, cache_dir, file_type)
             
             return {
                 "success": True,
@@ -1142,3 +1117,34 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
         except Exception as e:
             LOGGER.error(f"Error clearing file cache: {e}")
             return {"success": False, "error": str(e)}
+
+    def _clear_file_cache(self, cache_dir: str, file_type: str) -> int:
+        cache_path = Path(cache_dir)
+        deleted_count = 0
+        
+        if file_type == 'all':
+            # Delete all files in cache directory
+            for file_path in cache_path.rglob('*'):
+                if file_path.is_file():
+                    file_path.unlink()
+                    deleted_count += 1
+            self.client.file_cache.clear()
+        else:
+            # Delete only specific file type
+            type_patterns = {
+                'prints': ['*.3mf'],
+                'gcode': ['*.gcode'],
+                'timelapse': ['*.mp4', '*.avi', '*.mov'],
+            }
+            
+            patterns = type_patterns.get(file_type, [])
+            # The index is written once for all the removed files.
+            with self.client.file_cache.batch():
+                for pattern in patterns:
+                    for file_path in cache_path.rglob(pattern):
+                        if file_path.is_file():
+                            file_path.unlink()
+                            deleted_count += 1
+                            self.client.file_cache.remove_file(str(file_path))
+
+        return deleted_count
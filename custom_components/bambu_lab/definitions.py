@@ -70,6 +70,7 @@ class BambuLabSensorEntityDescription(SensorEntityDescription, BambuLabSensorEnt
     exists_fn: Callable[..., bool] = lambda _: True
     extra_attributes: Callable[..., dict] = lambda _: {}
     icon_fn: Callable[..., str] = lambda _: None
+    data_parts: tuple[str, ...] | None = None
 
 
 @dataclass
@@ -82,6 +83,7 @@ class BambuLabAMSSensorEntityDescription(
     exists_fn: Callable[[BambuDataUpdateCoordinator, int], bool] = lambda coordinator, index: True
     extra_attributes: Callable[..., dict] = lambda _: {}
     icon_fn: Callable[..., str] = lambda _: None
+    data_parts: tuple[str, ...] | None = None
 
 
 @dataclass
@@ -96,6 +98,7 @@ class BambuLabBinarySensorEntityDescription(BinarySensorEntityDescription, Bambu
     available_fn: Callable[..., bool] = lambda _: True
     exists_fn: Callable[..., bool] = lambda _: True
     extra_attributes: Callable[..., dict] = lambda _: {}
+    data_parts: tuple[str, ...] | None = None
 
 
 @dataclass
@@ -104,11 +107,13 @@ class BambuLabAMSBinarySensorEntityDescription(BinarySensorEntityDescription, Ba
     available_fn: Callable[..., bool] = lambda _: True
     exists_fn: Callable[[BambuDataUpdateCoordinator, int], bool] = lambda coordinator, index: True
     extra_attributes: Callable[..., dict] = lambda _: {}
+    data_parts: tuple[str, ...] | None = None
 
 
 AMS_BINARY_SENSORS: tuple[BambuLabAMSBinarySensorEntityDescription, ...] = (
     BambuLabAMSBinarySensorEntityDescription(
         key="active_ams",
+        data_parts=("ams",),
         translation_key="active_ams",
         icon="mdi:check",
         device_class=BinarySensorDeviceClass.RUNNING,
@@ -116,6 +121,7 @@ AMS_BINARY_SENSORS: tuple[BambuLabAMSBinarySensorEntityDescription, ...] = (
     ),
     BambuLabAMSBinarySensorEntityDescription(
         key="drying",
+        data_parts=("ams",),
         translation_key="drying",
         icon="mdi:heat-wave",
         device_class=BinarySensorDeviceClass.RUNNING,
@@ -132,6 +138,7 @@ AMS_BINARY_SENSORS: tuple[BambuLabAMSBinarySensorEntityDescription, ...] = (
 PRINTER_BINARY_SENSORS: tuple[BambuLabBinarySensorEntityDescription, ...] = (
     BambuLabBinarySensorEntityDescription(
         key="timelapse",
+        data_parts=("camera",),
         translation_key="timelapse",
         icon="mdi:camera",
         device_class=BinarySensorDeviceClass.RUNNING,
@@ -139,11 +146,13 @@ PRINTER_BINARY_SENSORS: tuple[BambuLabBinarySensorEntityDescription, ...] = (
     ),
     BambuLabBinarySensorEntityDescription(
         key="extruder_filament_state",
+        data_parts=("info",),
         translation_key="extruder_filament_state",
         is_on_fn=lambda self: self.coordinator.get_model().info.extruder_filament_state,
     ),
     BambuLabBinarySensorEntityDescription(
         key="hms",
+        data_parts=("hms",),
         translation_key="hms_errors",
         device_class=BinarySensorDeviceClass.PROBLEM,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -152,6 +161,7 @@ PRINTER_BINARY_SENSORS: tuple[BambuLabBinarySensorEntityDescription, ...] = (
     ),
     BambuLabBinarySensorEntityDescription(
         key="print_error",
+        data_parts=("print_error",),
         translation_key="print_error",
         device_class=BinarySensorDeviceClass.PROBLEM,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -160,6 +170,7 @@ PRINTER_BINARY_SENSORS: tuple[BambuLabBinarySensorEntityDescription, ...] = (
     ),
     BambuLabBinarySensorEntityDescription(
         key="online",
+        data_parts=("info",),
         translation_key="online",
         device_class=BinarySensorDeviceClass.RUNNING,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -167,6 +178,7 @@ PRINTER_BINARY_SENSORS: tuple[BambuLabBinarySensorEntityDescription, ...] = (
     ),
     BambuLabBinarySensorEntityDescription(
         key="firmware_update",
+        data_parts=("info", "upgrade"),
         translation_key="firmware_update",
         device_class=BinarySensorDeviceClass.UPDATE,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -175,6 +187,7 @@ PRINTER_BINARY_SENSORS: tuple[BambuLabBinarySensorEntityDescription, ...] = (
     ),
     BambuLabBinarySensorEntityDescription(
         key="door_open",
+        data_parts=("info",),
         translation_key="door_open",
         device_class=BinarySensorDeviceClass.DOOR,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -183,6 +196,7 @@ PRINTER_BINARY_SENSORS: tuple[BambuLabBinarySensorEntityDescription, ...] = (
     ),
     BambuLabBinarySensorEntityDescription(
         key="airduct_mode",
+        data_parts=("info",),
         translation_key="airduct_mode",
         device_class=BinarySensorDeviceClass.OPENING,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -191,6 +205,7 @@ PRINTER_BINARY_SENSORS: tuple[BambuLabBinarySensorEntityDescription, ...] = (
     ),
     BambuLabBinarySensorEntityDescription(
         key="developer_lan_mode",
+        data_parts=("info", "print_fun"),
         translation_key="developer_lan_mode",
         device_class=BinarySensorDeviceClass.RUNNING,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -199,6 +214,7 @@ PRINTER_BINARY_SENSORS: tuple[BambuLabBinarySensorEntityDescription, ...] = (
     ),
     BambuLabBinarySensorEntityDescription(
         key="mqtt_encryption",
+        data_parts=("info",),
         translation_key="mqtt_encryption",
         device_class=BinarySensorDeviceClass.RUNNING,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -216,6 +232,7 @@ PRINTER_BINARY_SENSORS: tuple[BambuLabBinarySensorEntityDescription, ...] = (
 PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     BambuLabSensorEntityDescription(
         key="mqtt_mode",
+        data_parts=("info",),
         translation_key="mqtt_mode",
         entity_category=EntityCategory.DIAGNOSTIC,
         device_class=SensorDeviceClass.ENUM,
@@ -224,6 +241,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="tool_module",
+        data_parts=("extruder_tool",),
         translation_key="tool_module",
         icon="mdi:printer-3d-nozzle",
         device_class=SensorDeviceClass.ENUM,
@@ -233,6 +251,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="wifi_signal",
+        data_parts=("info",),
         translation_key="wifi_signal",
         native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
         device_class=SensorDeviceClass.SIGNAL_STRENGTH,
@@ -242,6 +261,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="bed_temp",
+        data_parts=("temperature",),
         translation_key="bed_temp",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
@@ -252,6 +272,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="target_bed_temp",
+        data_parts=("temperature",),
         translation_key="target_bed_temp",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
@@ -262,6 +283,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="chamber_temp",
+        data_parts=("temperature",),
         translation_key="chamber_temp",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
@@ -273,6 +295,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="nozzle_temp",
+        data_parts=("temperature", "extruder"),
         translation_key="nozzle_temp",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
@@ -284,6 +307,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="target_nozzle_temp",
+        data_parts=("temperature", "extruder"),
         translation_key="target_nozzle_temp",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
@@ -295,6 +319,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="left_nozzle_temp",
+        data_parts=("temperature",),
         translation_key="left_nozzle_temp",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
@@ -307,6 +332,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="left_target_nozzle_temp",
+        data_parts=("temperature",),
         translation_key="left_target_nozzle_temp",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
@@ -319,6 +345,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="right_nozzle_temp",
+        data_parts=("temperature",),
         translation_key="right_nozzle_temp",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
@@ -331,6 +358,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="right_target_nozzle_temp",
+        data_parts=("temperature",),
         translation_key="right_target_nozzle_temp",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
@@ -343,6 +371,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="aux_fan_speed",
+        data_parts=("fans",),
         translation_key="aux_fan_speed",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
@@ -352,6 +381,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="chamber_fan_speed",
+        data_parts=("fans",),
         translation_key="chamber_fan_speed",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
@@ -361,6 +391,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="cooling_fan_speed",
+        data_parts=("fans",),
         translation_key="cooling_fan_speed",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
@@ -369,6 +400,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="heatbreak_fan_speed",
+        data_parts=("fans",),
         translation_key="heatbreak_fan_speed",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
@@ -377,6 +409,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="model_download_percentage",
+        data_parts=("print_job",),
         translation_key="model_download_percentage",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
@@ -385,6 +418,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="speed_profile",
+        data_parts=("speed",),
         translation_key="speed_profile",
         icon="mdi:speedometer",
         value_fn=lambda self: self.coordinator.get_model().speed.name,
@@ -394,6 +428,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="stage",
+        data_parts=("info", "stage"),
         translation_key="stage",
         icon="mdi:file-tree",
         value_fn=lambda self: "offline" if not self.coordinator.get_model().info.online else self.coordinator.get_model().stage.description,
@@ -402,6 +437,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="print_progress",
+        data_parts=("print_job",),
         translation_key="print_progress",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
@@ -410,6 +446,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="print_status",
+        data_parts=("info", "print_job"),
         translation_key="print_status",
         icon="mdi:list-status",
         value_fn=lambda
@@ -419,6 +456,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="printable_objects",
+        data_parts=("print_job",),
         translation_key="printable_objects",
         icon="mdi:cube-unfolded",
         state_class=SensorStateClass.MEASUREMENT,
@@ -427,6 +465,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="sdcard_status",
+        data_parts=("home_flag",),
         translation_key="sdcard_status",
         icon="mdi:list-status",
         value_fn=lambda
@@ -437,6 +476,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="skipped_objects",
+        data_parts=("print_job",),
         translation_key="skipped_objects",
         icon="mdi:cube-unfolded",
         state_class=SensorStateClass.MEASUREMENT,
@@ -445,6 +485,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="start_time",
+        data_parts=("print_job",),
         translation_key="start_time",
         icon="mdi:clock",
         available_fn=lambda self: self.coordinator.get_model().print_job.start_time is not None,
@@ -452,6 +493,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="remaining_time",
+        data_parts=("print_job",),
         translation_key="remaining_time",
         icon="mdi:timer-sand",
         native_unit_of_measurement=UnitOfTime.MINUTES,
@@ -462,6 +504,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="end_time",
+        data_parts=("print_job",),
         translation_key="end_time",
         icon="mdi:clock",
         available_fn=lambda self: self.coordinator.get_model().print_job.end_time is not None,
@@ -469,6 +512,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="total_usage_hours",
+        data_parts=("info", "print_job"),
         translation_key="total_usage_hours",
         icon="mdi:clock",
         native_unit_of_measurement=UnitOfTime.HOURS,
@@ -479,6 +523,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="current_layer",
+        data_parts=("print_job",),
         translation_key="current_layer",
         icon="mdi:printer-3d-nozzle",
         state_class=SensorStateClass.MEASUREMENT,
@@ -486,6 +531,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="total_layers",
+        data_parts=("print_job",),
         translation_key="total_layers",
         icon="mdi:printer-3d-nozzle",
         state_class=SensorStateClass.MEASUREMENT,
@@ -493,6 +539,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="gcode_file",
+        data_parts=("print_job",),
         translation_key="gcode_file",
         available_fn=lambda self: self.coordinator.get_model().print_job.gcode_file != "",
         value_fn=lambda self: self.coordinator.get_model().print_job.gcode_file,
@@ -500,6 +547,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="gcode_file_downloaded",
+        data_parts=("print_job",),
         translation_key="gcode_file_downloaded",
         available_fn=lambda self: self.coordinator.get_model().print_job.gcode_file_downloaded != "",
         value_fn=lambda self: self.coordinator.get_model().print_job.gcode_file_downloaded,
@@ -507,6 +555,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="subtask_name",
+        data_parts=("print_job",),
         translation_key="subtask_name",
         available_fn=lambda self: self.coordinator.get_model().print_job.subtask_name != "",
         value_fn=lambda self: self.coordinator.get_model().print_job.subtask_name,
@@ -514,6 +563,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="print_type",
+        data_parts=("print_job",),
         translation_key="print_type",
         available_fn=lambda self: self.coordinator.get_model().print_job.print_type != "",
         value_fn=lambda self: self.coordinator.get_model().print_job.print_type,
@@ -529,6 +579,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="print_length",
+        data_parts=("print_job",),
         translation_key="print_length",
         native_unit_of_measurement=UnitOfLength.METERS,
         suggested_unit_of_measurement=UnitOfLength.METERS,
@@ -541,12 +592,14 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="print_bed_type",
+        data_parts=("print_job",),
         translation_key="print_bed_type",
         icon="mdi:file",
         value_fn=lambda self: self.coordinator.get_model().print_job.print_bed_type,
     ),
     BambuLabSensorEntityDescription(
         key="print_weight",
+        data_parts=("print_job",),
         translation_key="print_weight",
         native_unit_of_measurement=UnitOfMass.GRAMS,
         suggested_unit_of_measurement=UnitOfMass.GRAMS,
@@ -559,6 +612,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="active_tray",
+        data_parts=("ams", "extruder", "external_spool", "home_flag"),
         translation_key="active_tray",
         icon="mdi:printer-3d-nozzle",
         value_fn=lambda self: "none" if self.coordinator.get_model().ams.active_tray is None else self.coordinator.get_model().ams.active_tray.name,
@@ -584,6 +638,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="nozzle_diameter",
+        data_parts=("info", "extruder"),
         translation_key="nozzle_diameter",
         native_unit_of_measurement=UnitOfLength.MILLIMETERS,
         suggested_unit_of_measurement=UnitOfLength.MILLIMETERS,
@@ -594,12 +649,14 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="nozzle_type",
+        data_parts=("info", "extruder"),
         translation_key="nozzle_type",
         icon="mdi:printer-3d-nozzle",
         value_fn=lambda self: self.coordinator.get_model().info.active_nozzle_type
     ),
     BambuLabSensorEntityDescription(
         key="left_nozzle_diameter",
+        data_parts=("info",),
         translation_key="left_nozzle_diameter",
         native_unit_of_measurement=UnitOfLength.MILLIMETERS,
         suggested_unit_of_measurement=UnitOfLength.MILLIMETERS,
@@ -611,6 +668,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="left_nozzle_type",
+        data_parts=("info",),
         translation_key="left_nozzle_type",
         icon="mdi:printer-3d-nozzle",
         value_fn=lambda self: self.coordinator.get_model().info.left_nozzle_type,
@@ -618,6 +676,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="right_nozzle_diameter",
+        data_parts=("info",),
         translation_key="right_nozzle_diameter",
         native_unit_of_measurement=UnitOfLength.MILLIMETERS,
         suggested_unit_of_measurement=UnitOfLength.MILLIMETERS,
@@ -629,6 +688,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="right_nozzle_type",
+        data_parts=("info",),
         translation_key="right_nozzle_type",
         icon="mdi:printer-3d-nozzle",
         value_fn=lambda self: self.coordinator.get_model().info.right_nozzle_type,
@@ -636,6 +696,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     ),
     BambuLabSensorEntityDescription(
         key="ip_address",
+        data_parts=("info",),
         translation_key="ip_address",
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda self: self.coordinator.get_model().info.ip_address
@@ -645,6 +706,7 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
 VIRTUAL_TRAY_BINARY_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     BambuLabBinarySensorEntityDescription(
         key="active_ams",
+        data_parts=("ams", "extruder"),
         translation_key="active_ams",
         icon="mdi:check",
         device_class=BinarySensorDeviceClass.RUNNING,
@@ -655,6 +717,7 @@ VIRTUAL_TRAY_BINARY_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
 VIRTUAL_TRAY_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
     BambuLabSensorEntityDescription(
         key="external_spool",
+        data_parts=("external_spool", "ams", "extruder"),
         translation_key="external_spool",
         icon="mdi:printer-3d-nozzle",
         value_fn=lambda self: self.coordinator.get_model().external_spool[self.index].name,
@@ -681,6 +744,7 @@ VIRTUAL_TRAY_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
 AMS_SENSORS: tuple[BambuLabAMSSensorEntityDescription, ...] = (
     BambuLabAMSSensorEntityDescription(
         key="humidity_index",
+        data_parts=("ams",),
         translation_key="humidity_index",
         icon="mdi:water-percent",
         state_class=SensorStateClass.MEASUREMENT,
@@ -689,6 +753,7 @@ AMS_SENSORS: tuple[BambuLabAMSSensorEntityDescription, ...] = (
     ),
     BambuLabAMSSensorEntityDescription(
         key="humidity",
+        data_parts=("ams",),
         translation_key="humidity",
         native_unit_of_measurement=PERCENTAGE,
         device_class=SensorDeviceClass.HUMIDITY,
@@ -698,6 +763,7 @@ AMS_SENSORS: tuple[BambuLabAMSSensorEntityDescription, ...] = (
     ),
     BambuLabAMSSensorEntityDescription(
         key="temperature",
+        data_parts=("ams",),
         translation_key="ams_temp",
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         suggested_unit_of_measurement=UnitOfTemperature.CELSIUS,
@@ -709,6 +775,7 @@ AMS_SENSORS: tuple[BambuLabAMSSensorEntityDescription, ...] = (
     ),
     BambuLabAMSSensorEntityDescription(
         key="remaining_drying_time",
+        data_parts=("ams",),
         translation_key="remaining_drying_time",
         native_unit_of_measurement=UnitOfTime.MINUTES,
         suggested_unit_of_measurement=UnitOfTime.HOURS,
@@ -721,6 +788,7 @@ AMS_SENSORS: tuple[BambuLabAMSSensorEntityDescription, ...] = (
     ),
     BambuLabAMSSensorEntityDescription(
         key="tray_1",
+        data_parts=("ams", "home_flag"),
         translation_key="tray_1",
         icon="mdi:printer-3d-nozzle",
         value_fn=lambda self: self.coordinator.get_model().ams.data[self.index].tray[0].name,
@@ -744,6 +812,7 @@ AMS_SENSORS: tuple[BambuLabAMSSensorEntityDescription, ...] = (
     ),
     BambuLabAMSSensorEntityDescription(
         key="tray_2",
+        data_parts=("ams", "home_flag"),
         translation_key="tray_2",
         icon="mdi:printer-3d-nozzle",
         value_fn=lambda self: self.coordinator.get_model().ams.data[self.index].tray[1].name,
@@ -768,6 +837,7 @@ AMS_SENSORS: tuple[BambuLabAMSSensorEntityDescription, ...] = (
     ),
     BambuLabAMSSensorEntityDescription(
         key="tray_3",
+        data_parts=("ams", "home_flag"),
         translation_key="tray_3",
         icon="mdi:printer-3d-nozzle",
         value_fn=lambda self: self.coordinator.get_model().ams.data[self.index].tray[2].name,
@@ -792,6 +862,7 @@ AMS_SENSORS: tuple[BambuLabAMSSensorEntityDescription, ...] = (
     ),
     BambuLabAMSSensorEntityDescription(
         key="tray_4",
+        data_parts=("ams", "home_flag"),
         translation_key="tray_4",
         icon="mdi:printer-3d-nozzle",
         value_fn=lambda self: self.coordinator.get_model().ams.data[self.index].tray[3].name,
@@ -27,6 +27,7 @@ class BambuLabFanEntityDescription(FanEntityDescription, BambuLabFanEntityDescri
     """Fan entity description for Bambu Lab."""
     exists_fn: Callable[..., bool] = lambda _: True
     extra_attributes: Callable[..., dict] = lambda _: {}
+    data_parts: tuple[str, ...] | None = ("fans",)
 
 
 FANS: tuple[FanEntityDescription, ...] = (
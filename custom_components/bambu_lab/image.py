@@ -16,6 +16,7 @@ from .pybambu.const import Features
 
 CHAMBER_IMAGE_SENSOR = BambuLabSensorEntityDescription(
         key="p1p_camera",
+        data_parts=("chamber_image",),
         translation_key="p1p_camera",
         value_fn=lambda self: self.coordinator.get_model().get_camera_image(),
         exists_fn=lambda coordinator: coordinator.get_model().supports_feature(Features.CAMERA_IMAGE) and
@@ -25,6 +26,7 @@ CHAMBER_IMAGE_SENSOR = BambuLabSensorEntityDescription(
 
 COVER_IMAGE_SENSOR = BambuLabSensorEntityDescription(
         key="cover_image",
+        data_parts=("cover_image",),
         translation_key="cover_image",
         value_fn=lambda self: self.coordinator.get_model().print_job.get_cover_image()
     )
@@ -108,7 +110,11 @@ class ChamberImage(ImageEntity, BambuLabEntity):
 
     def image(self) -> bytes | None:
         """Return bytes of image."""
-        return self.coordinator.get_model().chamber_image.get_image()
+        chamber_image = self.coordinator.get_model().chamber_image
+        # Images are only received while someone is viewing them. Each new image changes the
+        # state, so an open view fetches it and keeps the lease alive.
+        chamber_image.renew_lease()
+        return chamber_image.get_image()
     
     @property
     def image_last_updated(self) -> datetime | None:
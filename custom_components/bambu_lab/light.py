@@ -35,6 +35,7 @@ class BambuLabChamberLight(BambuLabEntity, LightEntity):
     _attr_icon = "mdi:led-strip-variant"
     _attr_color_mode = ColorMode.ONOFF
     _attr_supported_color_modes = {ColorMode.ONOFF}
+    _data_parts = ("lights",)
 
     def __init__(
             self,
@@ -78,6 +79,7 @@ class BambuLabHeatbedLight(BambuLabEntity, LightEntity):
     _attr_icon = "mdi:led-strip-variant"
     _attr_color_mode = ColorMode.ONOFF
     _attr_supported_color_modes = {ColorMode.ONOFF}
+    _data_parts = ("lights",)
 
     def __init__(
             self,
@@ -1,3 +1,4 @@
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -6,7 +7,26 @@ from .const import DOMAIN, LOGGER, BRAND
 from .coordinator import BambuDataUpdateCoordinator
 
 
-class BambuLabEntity(CoordinatorEntity[BambuDataUpdateCoordinator]):
+class BambuLabCoordinatorEntity(CoordinatorEntity[BambuDataUpdateCoordinator]):
+    """Defines a base entity that only writes state when the data it reads has changed."""
+
+    # Device data objects (e.g. "temperature", "print_job") this entity reads. None means all of them.
+    _data_parts: tuple[str, ...] | None = None
+
+    @property
+    def data_parts(self) -> tuple[str, ...] | None:
+        """Return the device data objects this entity depends on."""
+        description = getattr(self, "entity_description", None)
+        return getattr(description, "data_parts", self._data_parts)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Skip the state write if none of the data this entity reads has changed."""
+        if self.coordinator.is_data_changed(self.data_parts):
+            super()._handle_coordinator_update()
+
+
+class BambuLabEntity(BambuLabCoordinatorEntity):
     """Defines a base Bambu entity."""
 
     _attr_has_entity_name = True
@@ -17,7 +37,7 @@ class BambuLabEntity(CoordinatorEntity[BambuDataUpdateCoordinator]):
         return self.coordinator.get_printer_device()
 
 
-class AMSEntity(CoordinatorEntity[BambuDataUpdateCoordinator]):
+class AMSEntity(BambuLabCoordinatorEntity):
     """Defines a base AMS entity."""
 
     _attr_has_entity_name = True
@@ -28,7 +48,7 @@ class AMSEntity(CoordinatorEntity[BambuDataUpdateCoordinator]):
         return self.coordinator.get_ams_device(self.index)
 
 
-class VirtualTrayEntity(CoordinatorEntity[BambuDataUpdateCoordinator]):
+class VirtualTrayEntity(BambuLabCoordinatorEntity):
     """Defines an External Spool entity."""
 
     _attr_has_entity_name = True
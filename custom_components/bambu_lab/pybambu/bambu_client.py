@@ -4,10 +4,12 @@ import asyncio
 import ftplib
 import functools
 import json
+import logging
 import math
 import os
 import queue
 import re
+import select
 import socket
 import ssl
 import struct
@@ -27,14 +29,14 @@ from .const import (
     LOGGER,
     Features,
 )
-from .models import Device, SlicerSettings
+from .models import Device, FileCacheIndex, SlicerSettings
 from .commands import (
     GET_VERSION,
     PUSH_ALL,
     START_PUSH,
 )
 from .tests import MockMQTTClient
-from .utils import safe_json_loads
+from .utils import preload_error_text, safe_json_loads
 
 class WatchdogThread(threading.Thread):
 
@@ -76,15 +78,49 @@ class WatchdogThread(threading.Thread):
 
 
 class ChamberImageThread(threading.Thread):
+    MAX_PAYLOAD_SIZE = 16 * 1024 * 1024
+    PORT = 6000
+    STOP_CHECK_INTERVAL = 1
+
     def __init__(self, client: BambuClient):
         self._client = client
         self._stop_event = threading.Event()
+        self._last_delivered = 0
         super().__init__()
         self.daemon = True
 
     def stop(self):
         self._stop_event.set()
 
+    def _should_deliver(self) -> bool:
+        """Return whether the next image should be handed to the client or dropped"""
+        if not self._client._device.chamber_image.has_subscribers:
+            return False
+        max_fps = self._client.camera_max_fps
+        if max_fps > 0 and time.monotonic() - self._last_delivered < 1 / max_fps:
+            return False
+        return True
+
+    def _recv_exactly(self, sslSock: ssl.SSLSocket, view: memoryview) -> bool:
+        """Fill view from the socket. Returns False if the thread was stopped while waiting for data."""
+        received = 0
+        while received < len(view):
+            try:
+                count = sslSock.recv_into(view[received:])
+            except ssl.SSLWantReadError:
+                # Wait for the socket to become readable, waking up regularly to check for a stop request.
+                select.select([sslSock], [], [], self.STOP_CHECK_INTERVAL)
+                if self._stop_event.is_set():
+                    return False
+                continue
+
+            if count == 0:
+                # This occurs if the wrong access code was provided.
+                LOGGER.error("Chamber image connection rejected by the printer. Check provided access code and IP address.")
+                raise RuntimeError("Received no data unexpectedly.")
+            received += count
+        return True
+
     def run(self):
         self.setName(f"{self._client._device.info.device_type}-Chamber-{threading.get_native_id()}")
         LOGGER.debug("Chamber image thread started.")
@@ -94,7 +130,6 @@ class ChamberImageThread(threading.Thread):
         username = 'bblp'
         access_code = self._client._access_code
         hostname = self._client._device.info.ip_address
-        port = 6000
         MAX_CONNECT_ATTEMPTS = 12
         connect_attempts = 0
 
@@ -116,8 +151,6 @@ class ChamberImageThread(threading.Thread):
         jpeg_start = bytearray([0xff, 0xd8, 0xff, 0xe0])
         jpeg_end = bytearray([0xff, 0xd9])
 
-        read_chunk_size = 4096 # 4096 is the max we'll get even if we increase this.
-
         # Payload format for each image is:
         # 16 byte header:
         #   Bytes 0:3   = little endian payload size for the jpeg image (does not include this header).
@@ -131,15 +164,15 @@ class ChamberImageThread(threading.Thread):
         # Bytes payload_size-2:payload_size = jpeg_end magic bytes
         #
         # Further attempts to receive data will get SSLWantReadError until a new image is ready (1-2 seconds later)
+        header = bytearray(16)
+        img = bytearray()
         while connect_attempts < MAX_CONNECT_ATTEMPTS and not self._stop_event.is_set():
             connect_attempts += 1
             try:
-                with socket.create_connection((hostname, port)) as sock:
+                with socket.create_connection((hostname, self.PORT)) as sock:
                     try:
                         sslSock = ctx.wrap_socket(sock, server_hostname=hostname)
                         sslSock.write(auth_data)
-                        img = None
-                        payload_size = 0
 
                         status = sslSock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
                         LOGGER.debug(f"SOCKET STATUS: {status}")
@@ -152,53 +185,37 @@ class ChamberImageThread(threading.Thread):
                             break
                         continue
 
-                    sslSock.setblocking(False)
-                    while not self._stop_event.is_set():
-                        try:
-                            dr = sslSock.recv(read_chunk_size)
-                        except ssl.SSLWantReadError:
-                            if self._stop_event.wait(1):
+                    with sslSock:
+                        sslSock.setblocking(False)
+                        while not self._stop_event.is_set():
+                            if not self._recv_exactly(sslSock, memoryview(header)):
                                 break
-                            continue
-
-                        if img is not None and len(dr) > 0:
-                            img += dr
-                            if len(img) > payload_size:
-                                # We got more data than we expected.
-                                LOGGER.error(f"Unexpected image payload received: {len(img)} > {payload_size}")
-                                # Reset buffer
-                                img = None
-                            elif len(img) == payload_size:
-                                # We should have the full image now.
-                                if img[:4] != jpeg_start:
-                                    LOGGER.error("JPEG start magic bytes missing.")
-                                elif img[-2:] != jpeg_end:
-                                    LOGGER.error("JPEG end magic bytes missing.")
-                                else:
-                                    # Content is as expected. Send it.
-                                    self._client.on_jpeg_received(img)
-
-                                # Reset buffer
-                                img = None
-                            # else:
-                            # Otherwise we need to continue looping without reseting the buffer to receive the remaining data
-                            # and without delaying.
-
-                        elif len(dr) == 16:
-                            # We got the header bytes. Get the expected payload size from it and create the image buffer bytearray.
-                            # Reset connect_attempts now we know the connect was successful.
-                            connect_attempts = 0
-                            img = bytearray()
-                            payload_size = int.from_bytes(dr[0:3], byteorder='little')
 
-                        elif len(dr) == 0:
-                            # This occurs if the wrong access code was provided.
-                            LOGGER.error("Chamber image connection rejected by the printer. Check provided access code and IP address.")
-                            raise RuntimeError("Received no data unexpectedly.")
+                            # We got the header bytes. Reset connect_attempts now we know the connect was successful.
+                            connect_attempts = 0
+                            payload_size = int.from_bytes(header[0:3], byteorder='little')
+                            if payload_size < len(jpeg_start) + len(jpeg_end) or payload_size > self.MAX_PAYLOAD_SIZE:
+                                LOGGER.error(f"Unexpected image payload size: {payload_size}")
+                                raise RuntimeError(f"Unexpected image payload size received: {payload_size}")
+
+                            # A delivered image buffer is handed over to the consumer, so only reuse the buffer
+                            # when the previous image was dropped.
+                            deliver = self._should_deliver()
+                            if deliver or len(img) < payload_size:
+                                img = bytearray(payload_size)
+                            payload = memoryview(img)[:payload_size]
+                            if not self._recv_exactly(sslSock, payload):
+                                break
 
-                        else:
-                            LOGGER.error(f"UNEXPECTED DATA RECEIVED: {len(dr)}")
-                            raise RuntimeError(f"Unexpected data chunk size received: {len(dr)}")
+                            if payload[:4] != jpeg_start:
+                                LOGGER.error("JPEG start magic bytes missing.")
+                            elif payload[-2:] != jpeg_end:
+                                LOGGER.error("JPEG end magic bytes missing.")
+                            elif deliver:
+                                # Content is as expected. Send it.
+                                self._last_delivered = time.monotonic()
+                                self._client.on_jpeg_received(img)
+                                img = bytearray()
 
             except OSError as e:
                 if e.errno == 113:
@@ -357,6 +374,8 @@ class BambuClient:
         self._local_mqtt = config.get('local_mqtt', False)
         self._serial = config.get('serial', '')
         self._enable_camera = config.get('enable_camera', True) and (self.host != "")
+        # Maximum rate at which chamber images are delivered. 0 delivers every image the printer sends.
+        self._camera_max_fps = float(config.get('camera_max_fps', 0))
         self._enable_ftp = (self.host != "")
         if self._serial.startswith('MOCK-'):
             self._enable_ftp = False
@@ -371,6 +390,7 @@ class BambuClient:
         self._timelapse_cache_count = max(-1, int(config.get('timelapse_cache_count', 0)))
         self._disable_ssl_verify = config.get('disable_ssl_verify', False)
         self._cache_path = config.get('file_cache_path', f'/config/www/media/ha-bambulab/{self._serial}')
+        self._file_cache = FileCacheIndex(self._cache_path)
 
         self._connected = False
         self._port = 8883
@@ -400,6 +420,10 @@ class BambuClient:
     def cache_path(self):
         return self._cache_path
 
+    @property
+    def file_cache(self) -> FileCacheIndex:
+        return self._file_cache
+
     @property
     def user_language(self):
         return self._user_language
@@ -413,6 +437,10 @@ class BambuClient:
     def camera_enabled(self):
         return self._enable_camera
 
+    @property
+    def camera_max_fps(self) -> float:
+        return self._camera_max_fps
+
     def callback(self, event: str):
         if self._callback is not None:
             self._callback(event)
@@ -460,6 +488,9 @@ class BambuClient:
         loop = asyncio.get_event_loop()
         await loop.run_in_executor(None, self.setup_tls)
 
+        # Load the HMS and print error text now so that lookups on each push don't block.
+        await loop.run_in_executor(None, preload_error_text, self._user_language)
+
         if self._local_mqtt:
             self.client.username_pw_set("bblp", password=self._access_code)
         else:
@@ -563,13 +594,11 @@ class BambuClient:
                 self._loaded_slicer_settings = True
                 self.slicer_settings.update()
 
-            if self._refreshed:
+            if self._refreshed and LOGGER.isEnabledFor(logging.DEBUG):
                 # X1 mqtt payload is inconsistent. Adjust it for consistent logging.
                 clean_msg = re.sub(r"\\n *", "", str(message.payload))
                 # And adjust all payload to be meet proper json syntax instead of being pythonized so I can feed it directly into an online json prettifier
-                clean_msg = re.sub(r"\'", "\"", str(clean_msg))
-                clean_msg = re.sub(r"True", "true", str(clean_msg))
-                clean_msg = re.sub(r"False", "false", str(clean_msg))
+                clean_msg = clean_msg.replace("'", "\"").replace("True", "true").replace("False", "false")
                 LOGGER.debug(f"Received data: {clean_msg}")
 
             json_data = safe_json_loads(message.payload)
@@ -587,9 +616,10 @@ class BambuClient:
                 self._device.info.set_online(True)
                 if self._watchdog is not None:
                     self._watchdog.received_data()
-                if json_data.get("print"):
-                    self._device.print_update(data=json_data.get("print"))
-                    if json_data.get("print").get("msg", 0) == 0:
+                print_data = json_data.get("print")
+                if print_data:
+                    self._device.print_update(data=print_data)
+                    if print_data.get("msg", 0) == 0:
                         self._refreshed= False
                 elif json_data.get("info") and json_data.get("info").get("command") == "get_version":
                     self._device.info_update(data=json_data.get("info"))
@@ -6,6 +6,9 @@ from enum import (
 import base64
 import json
 import requests
+import threading
+import time
+import weakref
 
 cloudscraper_available = False
 try:
@@ -73,6 +76,79 @@ class CurlUnavailableError(Exception):
         super().__init__("curl library unavailable")
         self.error_code = 400
 
+class _CloudRequest:
+    """A single request to the cloud whose result is shared by every caller that waits on it."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.done = threading.Event()
+        self.value = None
+
+
+class CachedCloudResponse:
+    """Caches a cloud response for a time to live. Concurrent callers share one request rather than each
+    making their own. Failed requests (a None result) are not cached."""
+
+    def __init__(self, ttl: float):
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._request = None
+
+    def get(self, fetch, since: float = None):
+        """Return the cached response, calling fetch if there isn't a usable one. If since is given (a
+        time.monotonic() value), only a response requested at or after that time is used."""
+        with self._lock:
+            request = self._request
+            owner = request is None or not self._usable(request, since)
+            if owner:
+                request = _CloudRequest()
+                self._request = request
+
+        if owner:
+            try:
+                request.value = fetch()
+            finally:
+                request.done.set()
+        else:
+            request.done.wait()
+        return request.value
+
+    def invalidate(self):
+        with self._lock:
+            self._request = None
+
+    def _usable(self, request: _CloudRequest, since: float) -> bool:
+        if since is not None and request.started < since:
+            return False
+        if not request.done.is_set():
+            # Still in flight - wait for it rather than making a duplicate request.
+            return True
+        return request.value is not None and time.monotonic() - request.started < self._ttl
+
+
+class CloudAccountCache:
+    """Cloud responses shared by every printer on the same account."""
+    TASKLIST_TTL = 30
+    SLICER_SETTINGS_TTL = 3600
+
+    def __init__(self):
+        self.tasklist = CachedCloudResponse(self.TASKLIST_TTL)
+        self.slicer_settings = CachedCloudResponse(self.SLICER_SETTINGS_TTL)
+
+
+# Held weakly so an account's cache goes away with the last client using it.
+_account_caches = weakref.WeakValueDictionary()
+_account_caches_lock = threading.Lock()
+
+def _get_account_cache(region: str, auth_token: str) -> CloudAccountCache:
+    with _account_caches_lock:
+        cache = _account_caches.get((region, auth_token))
+        if cache is None:
+            cache = CloudAccountCache()
+            _account_caches[(region, auth_token)] = cache
+        return cache
+
+
 @dataclass
 class BambuCloud:
   
@@ -82,6 +158,20 @@ class BambuCloud:
         self._username = username
         self._auth_token = auth_token
         self._tfaKey = None
+        self._account_cache_key = None
+        self._account_cache = None
+
+    @property
+    def account_cache(self) -> CloudAccountCache:
+        # The auth token changes on login so look the cache up again whenever it does.
+        key = (self._region, self._auth_token)
+        if key != self._account_cache_key:
+            if self.bambu_connected:
+                self._account_cache = _get_account_cache(*key)
+            else:
+                self._account_cache = CloudAccountCache()
+            self._account_cache_key = key
+        return self._account_cache
 
     def _get_headers(self):
         return {
@@ -464,6 +554,9 @@ class BambuCloud:
     # }
 
     def get_slicer_settings(self) -> dict:
+        return self.account_cache.slicer_settings.get(self._fetch_slicer_settings)
+
+    def _fetch_slicer_settings(self) -> dict:
         LOGGER.debug("Getting slicer settings from Bambu Cloud")
         try:
             response = self._get(BambuUrl.SLICER_SETTINGS)
@@ -513,13 +606,26 @@ class BambuCloud:
     #     "bedType": "textured_plate"
     #     },
 
-    def get_tasklist(self) -> dict:
+    # The task list is shared by every printer on the account so callers must not modify it.
+    def get_tasklist(self, since: float = None) -> dict:
+        tasklist = self.account_cache.tasklist.get(self._fetch_tasklist, since)
+        if tasklist is None:
+            return None
+        return tasklist[0]
+
+    def _fetch_tasklist(self) -> tuple[dict, dict]:
         LOGGER.debug("Getting full task list from Bambu Cloud")
         try:
             response = self._get(BambuUrl.TASKS)
+            data = response.json()
         except:
             return None
-        return response.json()
+
+        # Index the tasks by printer. The hits are newest first and stay that way per printer.
+        tasks_by_device = {}
+        for task in data.get('hits', []):
+            tasks_by_device.setdefault(task.get('deviceId'), []).append(task)
+        return data, tasks_by_device
 
     # Returns a list of projects for the account.
     #
@@ -548,25 +654,20 @@ class BambuCloud:
             return None
         return response.json()
 
-    def get_latest_task_for_printer(self, deviceId: str) -> dict:
+    def get_latest_task_for_printer(self, deviceId: str, since: float = None) -> dict:
         LOGGER.debug(f"Getting latest task for printer from Bambu Cloud")
-        try:
-            data = self.get_tasklist_for_printer(deviceId)
-            if len(data) != 0:
-                return data[0]
-            LOGGER.debug("No tasks found for printer")
-            return None
-        except:
-            return None
+        data = self.get_tasklist_for_printer(deviceId, since)
+        if len(data) != 0:
+            return data[0]
+        LOGGER.debug("No tasks found for printer")
+        return None
 
-    def get_tasklist_for_printer(self, deviceId: str) -> dict:
+    def get_tasklist_for_printer(self, deviceId: str, since: float = None) -> list:
         LOGGER.debug(f"Getting full task list for printer from Bambu Cloud")
-        tasks = []
-        data = self.get_tasklist()
-        for task in data['hits']:
-            if task['deviceId'] == deviceId:
-                tasks.append(task)
-        return tasks
+        tasklist = self.account_cache.tasklist.get(self._fetch_tasklist, since)
+        if tasklist is None:
+            return []
+        return list(tasklist[1].get(deviceId, []))
 
     def get_device_type_from_device_product_name(self, device_product_name: str):
         if device_product_name == "X1 Carbon":
@@ -577,7 +678,7 @@ class BambuCloud:
         LOGGER.debug(f"Downloading cover image: {url}")
         try:
             # This is just a standard download from an unauthenticated end point.
-            response = requests.get(url)
+            response = requests.get(url, timeout=10)
         except:
             return None
         return response.content
@@ -9,8 +9,11 @@ import threading
 import shutil
 import time
 
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
+from io import BytesIO
 from dateutil import parser, tz
 from pathlib import Path
 from zipfile import ZipFile
@@ -90,27 +93,44 @@ class Device:
         self.cover_image = CoverImage(client = client)
         self.pick_image = PickImage(client = client)
         self.print_fun = PrintFun(client = client)
+        self._changed_parts = set()
+        self._changed_parts_lock = threading.Lock()
+        # Held while data objects are updated so background threads don't interleave with the mqtt thread's diffing.
+        self.data_lock = threading.RLock()
 
     def print_update(self, data) -> bool:
-        send_event = False
-        send_event = send_event | self.info.print_update(data = data)
-        send_event = send_event | self.upgrade.print_update(data = data)
-        send_event = send_event | self.print_job.print_update(data = data)
-        send_event = send_event | self.lights.print_update(data = data)
-        send_event = send_event | self.fans.print_update(data = data)
-        send_event = send_event | self.speed.print_update(data = data)
-        send_event = send_event | self.stage.print_update(data = data)
-        send_event = send_event | self.extruder.print_update(data = data) # Must be before the AMS and external spools and temperature
-        send_event = send_event | self.temperature.print_update(data = data)
-        send_event = send_event | self.ams.print_update(data = data)
-        send_event = send_event | self.external_spool[0].print_update(data = data)
-        send_event = send_event | self.external_spool[1].print_update(data = data)
-        send_event = send_event | self.hms.print_update(data = data)
-        send_event = send_event | self.print_error.print_update(data = data)
-        send_event = send_event | self.camera.print_update(data = data)
-        send_event = send_event | self.home_flag.print_update(data = data)
-        send_event = send_event | self.print_fun.print_update(data = data)
-        send_event = send_event | self.extruder_tool.print_update(data = data)
+        # Order matters: the extruder must be updated before the AMS, external spools and temperature.
+        parts = (
+            ("info", self.info),
+            ("upgrade", self.upgrade),
+            ("print_job", self.print_job),
+            ("lights", self.lights),
+            ("fans", self.fans),
+            ("speed", self.speed),
+            ("stage", self.stage),
+            ("extruder", self.extruder),
+            ("temperature", self.temperature),
+            ("ams", self.ams),
+            ("external_spool", self.external_spool[0]),
+            ("external_spool", self.external_spool[1]),
+            ("hms", self.hms),
+            ("print_error", self.print_error),
+            ("camera", self.camera),
+            ("home_flag", self.home_flag),
+            ("print_fun", self.print_fun),
+            ("extruder_tool", self.extruder_tool),
+        )
+        # Incremental pushes only carry what changed. Data objects that list the top level keys they read in
+        # PUSH_KEYS are skipped when none of those are present. Full pushes (msg 0) and other commands update everything.
+        delta_keys = data.keys() if data.get("command") == "push_status" and data.get("msg", 0) != 0 else None
+        changed_parts = set()
+        with self.data_lock:
+            for name, part in parts:
+                if delta_keys is not None and getattr(part, "PUSH_KEYS", None) is not None and delta_keys.isdisjoint(part.PUSH_KEYS):
+                    continue
+                if part.print_update(data = data):
+                    changed_parts.add(name)
+        self.mark_changed(*changed_parts)
 
         send_ready_event = self.get_version_data is not None and self.push_all_data is None
         if data.get("command") == "push_status":
@@ -120,6 +140,24 @@ class Device:
                     self._client.callback("event_printer_ready")
 
         self._client.callback("event_printer_data_update")
+        return len(changed_parts) != 0
+
+    def mark_changed(self, *parts: str):
+        """Record the data objects (by attribute name) that changed since the last pop_changed_parts call."""
+        with self._changed_parts_lock:
+            self._changed_parts.update(parts)
+
+    def pop_changed_parts(self) -> set[str]:
+        """Return and clear the set of data objects that changed since the last call."""
+        with self._changed_parts_lock:
+            changed_parts = self._changed_parts
+            self._changed_parts = set()
+        return changed_parts
+
+    def data_updated(self, *parts: str):
+        """Mark the given data objects as changed and notify the client."""
+        self.mark_changed(*parts)
+        self._client.callback("event_printer_data_update")
 
     @property
     def has_full_printer_data(self):
@@ -140,6 +178,7 @@ class Device:
     def observe_system_command(self, data):
         if data.get("command") == "ledctrl" and data.get("led_node") == "heatbed_light":
             self.lights.observe_system_command(data)
+            self.mark_changed("lights")
 
     def supports_feature(self, feature):
 
@@ -471,6 +510,8 @@ class Lights:
 @dataclass
 class Camera:
     """Return camera related info"""
+    PUSH_KEYS = frozenset({"ipcam"})
+
     recording: str
     resolution: str
     rtsp_url: str
@@ -513,6 +554,8 @@ class Camera:
 @dataclass
 class Temperature:
     """Return all temperature related info"""
+    PUSH_KEYS = frozenset({"device", "bed_temper", "bed_target_temper", "chamber_temper", "nozzle_temper", "nozzle_target_temper"})
+
     bed_temp: int
     target_bed_temp: int
     chamber_temp: int
@@ -631,7 +674,7 @@ class Temperature:
         LOGGER.debug(command)
         self._client.publish(command)
 
-        self._client.callback("event_printer_data_update")
+        self._client._device.data_updated("temperature")
 
 
 @dataclass
@@ -713,7 +756,7 @@ class Fans:
         LOGGER.debug(command)
         self._client.publish(command)
 
-        self._client.callback("event_printer_data_update")
+        self._client._device.data_updated("fans")
 
     def get_fan_speed(self, fan: FansEnum) -> int:
         if fan == FansEnum.PART_COOLING:
@@ -781,7 +824,7 @@ class Upgrade:
             if template is not None:
                 LOGGER.debug(template)
                 self._client.publish(template)
-                self._client.callback("event_printer_data_update")
+                self._client._device.data_updated("upgrade")
                 
     def print_update(self, data) -> bool:
         """Update the upgrade state"""
@@ -890,6 +933,392 @@ class Upgrade:
         return (old_data != f"{self.__dict__}")
 
 
+@dataclass
+class ModelMetadata:
+    """The plate data parsed from a 3MF model file that doesn't depend on the printer state"""
+    plate_number: str = None
+    weight: str = None
+    bed_type: str = None
+    gcode_file: str = ""
+    cover_image: bytes = None
+    pick_image: bytes = None
+    # Objects on the plate that are present in the pick image, or None if it couldn't be processed.
+    printable_objects: dict = None
+    # (id, used_m, used_g) for each filament on the plate.
+    filaments: list = field(default_factory=list)
+
+    @staticmethod
+    def from_3mf(model_file_path: str) -> ModelMetadata:
+        """Parse the model and save the cover image, gcode and slice info alongside it in the cache"""
+        metadata = ModelMetadata()
+        model_dir = os.path.dirname(model_file_path)
+        model_name = os.path.splitext(os.path.basename(model_file_path))[0]
+
+        # Open the 3mf zip archive. Only the central directory and the members we need are read.
+        with ZipFile(model_file_path) as archive:
+            # Extract the slicer XML config and parse the plate tree
+            slice_info_bytes = archive.read('Metadata/slice_info.config')
+            plate = ElementTree.fromstring(slice_info_bytes).find('plate')
+
+            # Iterate through each config element and extract the data
+            # Example contents:
+            # {'key': 'index', 'value': '2'}
+            # {'key': 'printer_model_id', 'value': 'C12'}
+            # {'key': 'nozzle_diameters', 'value': '0.4'}
+            # {'key': 'timelapse_type', 'value': '0'}
+            # {'key': 'prediction', 'value': '5935'}
+            # {'key': 'weight', 'value': '20.91'}
+            # {'key': 'outside', 'value': 'false'}
+            # {'key': 'support_used', 'value': 'false'}
+            # {'key': 'label_object_enabled', 'value': 'true'}
+            # {'identify_id': '123', 'name': 'ModelObjectOne.stl', 'skipped': 'false'}
+            # {'identify_id': '394', 'name': 'ModelObjectTwo.stl', 'skipped': 'false'}
+            # {'id': '1', 'tray_info_idx': 'GFA01', 'type': 'PLA', 'color': '#000000', 'used_m': '5.45', 'used_g': '17.32'}
+            # {'id': '2', 'tray_info_idx': 'GFA01', 'type': 'PLA', 'color': '#8D8C8F', 'used_m': '0.84', 'used_g': '2.66'}
+            # {'id': '3', 'tray_info_idx': 'GFA01', 'type': 'PLA', 'color': '#FFFFFF', 'used_m': '0.29', 'used_g': '0.93'}
+            _printable_objects = {}
+            for metadata_item in plate:
+                if (metadata_item.get('key') == 'index'):
+                    # Index is the plate number being printed
+                    metadata.plate_number = metadata_item.get('value')
+                    LOGGER.debug(f"Plate: {metadata.plate_number}")
+
+                    # Now we have the plate number, extract the cover image from the archive
+                    metadata.cover_image = archive.read(f"Metadata/plate_{metadata.plate_number}.png")
+                    LOGGER.debug(f"Cover image: Metadata/plate_{metadata.plate_number}.png")
+
+                    # Save the cover image to the cache
+                    try:
+                        cover_path = os.path.join(model_dir, model_name + '.png')
+                        with open(cover_path, "wb") as target_path:
+                            target_path.write(metadata.cover_image)
+                        LOGGER.debug(f"Cover image saved to: {cover_path}")
+                    except Exception as e:
+                        LOGGER.error(f"Failed to save cover image: {e}")
+
+                    try:
+                        # Stream the gcode file to the cache
+                        gcode_path = os.path.join(model_dir, model_name + '.gcode')
+                        with archive.open(f"Metadata/plate_{metadata.plate_number}.gcode") as gcode_entry, open(gcode_path, "wb") as target_path:
+                            shutil.copyfileobj(gcode_entry, target_path)
+                            metadata.gcode_file = model_name + '.gcode'
+                    except Exception as e:
+                        metadata.gcode_file = "ERROR"
+                        LOGGER.error(f"Error while extracting gcode zip entry to target path. {repr(e)}")
+
+                    # And extract the plate type from the plate json.
+                    metadata.bed_type = json.loads(archive.read(f"Metadata/plate_{metadata.plate_number}.json")).get('bed_type')
+                elif (metadata_item.get('key') == 'weight'):
+                    LOGGER.debug(f"Weight: {metadata_item.get('value')}")
+                    metadata.weight = metadata_item.get('value')
+                elif (metadata_item.get('key') == 'prediction'):
+                    # Estimated print length in seconds
+                    LOGGER.debug(f"Print time: {metadata_item.get('value')}s")
+                elif (metadata_item.tag == 'object'):
+                    # Get the list of printable objects present on the plate before slicing.
+                    # This includes hidden objects which need to be filtered out later.
+                    if metadata_item.get('skipped') == f"false":
+                        _printable_objects[metadata_item.get('identify_id')] = metadata_item.get('name')
+                elif (metadata_item.tag == 'filament'):
+                    metadata.filaments.append((metadata_item.get('id'), metadata_item.get('used_m'), metadata_item.get('used_g')))
+
+            if metadata.plate_number is not None:
+                try:
+                    metadata.pick_image = archive.read(f"Metadata/pick_{metadata.plate_number}.png")
+                    # Process the pick image for objects
+                    identify_ids = ModelMetadata._identify_objects_in_pick_image(Image.open(BytesIO(metadata.pick_image)))
+
+                    # Filter the printable objects from slice_info.config, removing
+                    # any that weren't detected in the pick image
+                    metadata.printable_objects = {k: _printable_objects[k] for k in identify_ids if k in _printable_objects}
+                except:
+                    LOGGER.debug(f"Unable to load 'Metadata/pick_{metadata.plate_number}.png' from archive")
+
+        # Save the slice_info.config in the same directory as the model file
+        try:
+            slice_info_path = os.path.join(model_dir, model_name + '.slice_info.config')
+            with open(slice_info_path, "wb") as f:
+                f.write(slice_info_bytes)
+        except Exception as e:
+            LOGGER.error(f"Failed to save slice_info.config: {e}")
+
+        return metadata
+
+    @staticmethod
+    def _identify_objects_in_pick_image(image: Image) -> set:
+        LOGGER.debug(f"Processing the pick image for objects")
+        # Open the pick image so we can detect objects present
+        image_width, image_height = image.size
+        
+        seen_colors = set()
+        seen_identify_ids = set()
+
+        # Loop through every pixel and label the first occurrence of each unique color
+        pixels = image.load()
+        for y in range(image_height):
+            for x in range(image_width):
+                current_color = pixels[x, y]
+                r, g, b, a = current_color
+
+                # Skip this pixel if it's transparent or already identified
+                if a == 0 or current_color in seen_colors:
+                    continue
+
+                # Convert the colour to the decimal representation of its hex value
+                identify_id = int(f"0x{b:02X}{g:02X}{r:02X}", 16)
+                seen_colors.add(current_color)
+                seen_identify_ids.add(str(identify_id))
+        
+        object_count = len(seen_identify_ids)
+        LOGGER.debug(f"Finished proccessing pick image, found {object_count} object{'s'[:object_count^1]}")
+        return seen_identify_ids
+
+
+class ModelMetadataCache:
+    """Parsed model metadata keyed by file name, size and modification time"""
+
+    def __init__(self, max_entries: int):
+        self._max_entries = max_entries
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model_file_path: str) -> tuple:
+        stat = os.stat(model_file_path)
+        return (os.path.basename(model_file_path), stat.st_size, stat.st_mtime_ns)
+
+    def get(self, key: tuple) -> ModelMetadata:
+        with self._lock:
+            metadata = self._entries.pop(key, None)
+            if metadata is not None:
+                # Re-insert to mark as most recently used.
+                self._entries[key] = metadata
+            return metadata
+
+    def put(self, key: tuple, metadata: ModelMetadata):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = metadata
+            while len(self._entries) > self._max_entries:
+                del self._entries[next(iter(self._entries))]
+
+    def rekey(self, old_key: tuple, new_key: tuple):
+        """Keep an entry when only the file's modification time was refreshed"""
+        with self._lock:
+            metadata = self._entries.pop(old_key, None)
+            if metadata is not None:
+                self._entries[new_key] = metadata
+
+
+class FileCacheIndex:
+    """Index of the files in a printer's cache directory, kept in memory and persisted alongside them"""
+
+    INDEX_FILENAME = ".file_index.json"
+    INDEX_VERSION = 1
+    FILE_TYPES = {'.3mf': 'prints', '.gcode': 'gcode', '.mp4': 'timelapse', '.avi': 'timelapse', '.mov': 'timelapse'}
+    THUMBNAIL_EXTENSIONS = ['.jpg', '.png', '.jpeg']
+
+    def __init__(self, cache_path: str):
+        self._root = Path(cache_path)
+        # Path relative to the cache root -> {'size', 'mtime', 'type', 'thumbnail'}. None until loaded.
+        self._entries = None
+        # Copy of the entries as of the last committed change, read by files() without taking the lock.
+        self._snapshot = {}
+        self._lock = threading.RLock()
+        # Changes not yet written to disk, and how many batch() blocks are open.
+        self._dirty = False
+        self._batch_depth = 0
+        # Files updated or removed while rescans walk the directory, reapplied once each has finished.
+        self._scan_changes = set()
+        self._scan_depth = 0
+
+    @property
+    def loaded(self) -> bool:
+        return self._entries is not None
+
+    @contextmanager
+    def batch(self):
+        """Group several updates into a single write of the index, which happens when the outermost batch ends."""
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._dirty:
+                    self._commit()
+
+    def load(self):
+        """Load the persisted index, rescanning the cache directory if there isn't a usable one. This blocks."""
+        with self._lock:
+            if self._entries is not None:
+                return
+            try:
+                with open(self._root / self.INDEX_FILENAME, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get('version') != self.INDEX_VERSION:
+                    raise ValueError(f"Unsupported index version {data.get('version')}")
+                self._entries = data['files']
+                self._snapshot = dict(self._entries)
+                LOGGER.debug(f"Loaded file cache index with {len(self._entries)} files.")
+                return
+            except (OSError, ValueError, KeyError) as e:
+                LOGGER.debug(f"Rebuilding file cache index: {e}")
+        self.rescan()
+
+    def rescan(self):
+        """Rebuild the index from the cache directory. This blocks."""
+        # The walk runs without the lock. Files written or deleted meanwhile are recorded and reapplied
+        # on top of the walked entries, so the rebuilt index can't drop or resurrect them.
+        with self._lock:
+            self._scan_depth += 1
+        entries = {}
+        for dirpath, _, filenames in os.walk(self._root):
+            filenames = set(filenames)
+            for filename in filenames:
+                stem, extension = os.path.splitext(filename)
+                file_type = self.FILE_TYPES.get(extension.lower())
+                if file_type is None:
+                    continue
+                file_path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                thumbnail = next((stem + ext for ext in self.THUMBNAIL_EXTENSIONS if stem + ext in filenames), None)
+                entries[self._relative_path(file_path)] = self._make_entry(stat, file_type, dirpath, thumbnail)
+
+        with self.batch():
+            self._scan_depth -= 1
+            scan_changes = self._scan_changes
+            if self._scan_depth == 0:
+                self._scan_changes = set()
+            self._entries = entries
+            self._mark_dirty()
+            for file_path in list(scan_changes):
+                self.update_file(file_path)
+        LOGGER.debug(f"Rescanned file cache with {len(entries)} files.")
+
+    def update_file(self, file_path: str):
+        """Add or refresh the entry for a file that was written to the cache. This blocks."""
+        with self._lock:
+            if self._scan_depth:
+                self._scan_changes.add(file_path)
+            if self._entries is None:
+                self._invalidate()
+                return
+            stem, extension = os.path.splitext(file_path)
+            if extension.lower() in self.THUMBNAIL_EXTENSIONS:
+                self._update_thumbnails(file_path)
+            elif extension.lower() in self.FILE_TYPES:
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    return self.remove_file(file_path)
+                self._entries[self._relative_path(file_path)] = self._make_entry(
+                    stat, self.FILE_TYPES[extension.lower()], os.path.dirname(file_path), self._find_thumbnail(stem))
+            else:
+                return
+            self._mark_dirty()
+
+    def remove_file(self, file_path: str):
+        """Drop the entry for a file that was deleted from the cache. This blocks."""
+        with self._lock:
+            if self._scan_depth:
+                self._scan_changes.add(file_path)
+            if self._entries is None:
+                self._invalidate()
+                return
+            if os.path.splitext(file_path)[1].lower() in self.THUMBNAIL_EXTENSIONS:
+                self._update_thumbnails(file_path)
+            elif self._entries.pop(self._relative_path(file_path), None) is None:
+                return
+            self._mark_dirty()
+
+    def clear(self):
+        with self._lock:
+            self._entries = {}
+            self._mark_dirty()
+
+    def files(self, file_type: str, offset: int = 0, limit: int | None = None) -> list[tuple[str, dict]]:
+        """Return (path relative to the cache root, entry) for files of the type in its directory, newest first"""
+        # Called from the event loop, so it reads the last committed snapshot instead of waiting for the lock.
+        matches = [(path, entry) for path, entry in self._snapshot.items()
+                   if entry['type'] == file_type and path.startswith(f"{file_type}/")]
+        matches.sort(key=lambda item: item[1]['mtime'], reverse=True)
+        return matches[offset:] if limit is None else matches[offset:offset + limit]
+
+    def _relative_path(self, file_path: str) -> str:
+        return Path(file_path).relative_to(self._root).as_posix()
+
+    def _make_entry(self, stat: os.stat_result, file_type: str, dirpath: str, thumbnail: str | None) -> dict:
+        return {
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'type': file_type,
+            'thumbnail': self._relative_path(os.path.join(dirpath, thumbnail)) if thumbnail else None,
+        }
+
+    def _find_thumbnail(self, stem: str) -> str | None:
+        for extension in self.THUMBNAIL_EXTENSIONS:
+            if os.path.exists(stem + extension):
+                return os.path.basename(stem + extension)
+        return None
+
+    def _update_thumbnails(self, thumbnail_path: str):
+        stem = os.path.splitext(thumbnail_path)[0]
+        thumbnail = self._find_thumbnail(stem)
+        for extension in self.FILE_TYPES:
+            path = self._relative_path(stem + extension)
+            entry = self._entries.get(path)
+            if entry is not None:
+                # Replaced rather than changed in place, the snapshot shares the entries.
+                self._entries[path] = {
+                    **entry,
+                    'thumbnail': self._relative_path(os.path.join(os.path.dirname(stem), thumbnail)) if thumbnail else None,
+                }
+
+    def _invalidate(self):
+        # Changes made before the index is loaded force a rescan when it is.
+        try:
+            os.remove(self._root / self.INDEX_FILENAME)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            LOGGER.error(f"Failed to remove file cache index: {e}")
+
+    def _mark_dirty(self):
+        # Committed now, or once at the end of the enclosing batch.
+        self._dirty = True
+        if self._batch_depth == 0:
+            self._commit()
+
+    def _commit(self):
+        self._snapshot = dict(self._entries or {})
+        self._save()
+
+    def _save(self):
+        self._dirty = False
+        if not self._root.is_dir():
+            return
+        index_path = self._root / self.INDEX_FILENAME
+        temp_path = self._root / f"{self.INDEX_FILENAME}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({'version': self.INDEX_VERSION, 'files': self._entries}, f)
+            os.replace(temp_path, index_path)
+        except OSError as e:
+            LOGGER.error(f"Failed to save file cache index: {e}")
+
+
+# Model downloads and parsing for all printers share a small worker pool so that several printers starting
+# jobs together don't each run their own blocking FTP thread.
+_model_data_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="Bambu-FTP")
+_model_metadata_cache = ModelMetadataCache(max_entries=16)
+# Bambu Cloud requests are made off the mqtt thread on a pool shared by all printers.
+_cloud_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="Bambu-Cloud")
+
+
 @dataclass
 class PrintJob:
     """Return all information related content"""
@@ -917,7 +1346,8 @@ class PrintJob:
     _gcode_file_prepare_percent: int
     _loaded_model_data: bool
     _ftpRunAgain: bool
-    _ftpThread: threading.Thread
+    _ftpTask: Future
+    _ftpAttempt: int
     _ftp_download_percentage: int
 
     def __init__(self, client):
@@ -946,7 +1376,8 @@ class PrintJob:
         self._gcode_file_prepare_percent = -1
         self._loaded_model_data = False
         self._ftpRunAgain = False
-        self._ftpThread = None
+        self._ftpTask = None
+        self._ftpAttempt = 0
         self._ftp_download_percentage = 100
 
     @property
@@ -1224,8 +1655,11 @@ class PrintJob:
                 cache_file_size = os.path.getsize(cache_file_path)
                 if cache_file_size == size:
                     LOGGER.debug(f"File already in cache with same size.")
-                    # Update last edited time to refresh it's cache lifetime.
+                    # Update last edited time to refresh it's cache lifetime, keeping any parsed metadata for it.
+                    old_key = _model_metadata_cache.key(cache_file_path)
                     os.utime(cache_file_path, None)
+                    _model_metadata_cache.rekey(old_key, _model_metadata_cache.key(cache_file_path))
+                    self._client.file_cache.update_file(cache_file_path)
                     return cache_file_path
             except FileNotFoundError:
                 # File doesn't exist in the cache.
@@ -1249,7 +1683,7 @@ class PrintJob:
                         LOGGER.debug(f"FTP download progress: {percentage:.0f}% ({total_downloaded//1024}/{size//1024} KB)")
                         self._ftp_download_percentage = int(percentage)
                         last_log_percentage = percentage
-                        self._client.callback("event_printer_data_update")
+                        self._client._device.data_updated("print_job")
                     
                     if progress_callback:
                         progress_callback(percentage)
@@ -1266,6 +1700,8 @@ class PrintJob:
                 ftp.retrbinary(f"RETR {file_path}", write_with_progress)
                 f.flush()
             
+            self._client.file_cache.update_file(cache_file_path)
+
             # Calculate download statistics
             self._ftp_download_percentage = 100
             end_time = time.time()
@@ -1329,15 +1765,17 @@ class PrintJob:
 
         return None
     
+    # Match the line format: '-rw-rw-rw- 1 user group 1234 Jan 01 12:34 filename'
+    _LIST_LINE_WITH_TIME_NO_YEAR = re.compile(r'^\S+\s+\d+\s+\S+\s+\S+\s+\d+\s+(\S+\s+\d+\s+\d+:\d+)\s+(.+)$')
+    # Match the line format: '-rw-rw-rw- 1 user group 1234 Jan 01 2024 filename'
+    _LIST_LINE_WITHOUT_TIME_JUST_YEAR = re.compile(r'^\S+\s+\d+\s+\S+\s+\S+\s+\d+\s+(\S+\s+\d+\s+\d+)\s+(.+)$')
+
     def _find_latest_file(self, ftp, search_paths, extensions: list):
         # Look for the newest file with extension in directory.
         file_list = []
+        utc_time_now = datetime.now().astimezone(timezone.utc)
         def parse_line(path: str, line: str):
-            # Match the line format: '-rw-rw-rw- 1 user group 1234 Jan 01 12:34 filename'
-            pattern_with_time_no_year      = r'^\S+\s+\d+\s+\S+\s+\S+\s+\d+\s+(\S+\s+\d+\s+\d+:\d+)\s+(.+)$'
-            # Match the line format: '-rw-rw-rw- 1 user group 1234 Jan 01 2024 filename'
-            pattern_without_time_just_year = r'^\S+\s+\d+\s+\S+\s+\S+\s+\d+\s+(\S+\s+\d+\s+\d+)\s+(.+)$'
-            match = re.match(pattern_with_time_no_year, line)
+            match = self._LIST_LINE_WITH_TIME_NO_YEAR.match(line)
             if match:
                 timestamp_str, filename = match.groups()
                 _, extension = os.path.splitext(filename)
@@ -1346,7 +1784,6 @@ class PrintJob:
                     # the year than now then it's this year. If it's later it's last year.
                     timestamp = datetime.strptime(timestamp_str, '%b %d %H:%M')
                     timestamp = timestamp.replace(tzinfo=timezone.utc)
-                    utc_time_now = datetime.now().astimezone(timezone.utc)
                     timestamp = timestamp.replace(year=utc_time_now.year)
                     if timestamp > utc_time_now:
                         timestamp = timestamp.replace(year=datetime.now().year - 1)
@@ -1354,7 +1791,7 @@ class PrintJob:
                 else:
                     return None
 
-            match = re.match(pattern_without_time_just_year, line)
+            match = self._LIST_LINE_WITHOUT_TIME_JUST_YEAR.match(line)
             if match:
                 timestamp_str, filename = match.groups()
                 _, extension = os.path.splitext(filename)
@@ -1434,10 +1871,15 @@ class PrintJob:
 
         LOGGER.debug(f"Keeping {keep} files. Deleting {len(old_files)} files.")
         
+        with self._client.file_cache.batch():
+            self._delete_files(old_files, extra_extensions)
+
+    def _delete_files(self, old_files: list, extra_extensions: list):
         for primary_file in old_files:
             try:
                 os.remove(primary_file )
                 LOGGER.debug(f"Deleted: {primary_file }")
+                self._client.file_cache.remove_file(str(primary_file))
             except Exception as e:
                 LOGGER.error(f"Failed to delete {primary_file}: {e}")
                 continue
@@ -1452,6 +1894,7 @@ class PrintJob:
                     try:
                         os.remove(assoc_file)
                         LOGGER.debug(f"Deleted associated: {assoc_file}")
+                        self._client.file_cache.remove_file(assoc_file)
                     except Exception as e:
                         LOGGER.error(f"Failed to delete associated {assoc_file}: {e}")
     
@@ -1517,6 +1960,10 @@ class PrintJob:
                         LOGGER.info(f"Downloading '{thumbnail_path}'")
                         ftp.retrbinary(f"RETR {thumbnail_path}", f.write)
                         f.flush()
+
+                    with self._client.file_cache.batch():
+                        self._client.file_cache.update_file(local_file_path)
+                        self._client.file_cache.update_file(thumbnail_local_path)
                     
             except ftplib.error_perm as e:
                 if '550' not in str(e.args): # 550 is unavailable.
@@ -1539,18 +1986,30 @@ class PrintJob:
         if self._client._test_mode:
             return
         
-        self._download_task_data_from_cloud()
+        if self._client.bambu_cloud.auth_token == "":
+            if self._client.ftp_enabled:
+                self._download_task_data_from_printer()
+        else:
+            # Only accept cloud task data fetched after this point so we pick up the task that just started.
+            _cloud_executor.submit(self._async_download_task_data, time.monotonic())
+
+    def _async_download_task_data(self, since: float):
+        try:
+            self._download_task_data_from_cloud(since)
+        except Exception as e:
+            LOGGER.error(f"Cloud task data download failed with exception {e}")
+        # The printer's model data is applied after the cloud task data as it is the more detailed source.
         if self._client.ftp_enabled:
             self._download_task_data_from_printer()
 
     def _download_task_data_from_printer(self):
-        if self._ftpThread is None:
-            # Only start a new thread if there
-            LOGGER.debug("Starting FTP thread.")
-            self._ftpThread = threading.Thread(target=self._async_download_task_data_from_printer)
-            self._ftpThread.start()
+        if self._ftpTask is None:
+            # Only queue a new task if there isn't one already queued or running for this printer.
+            LOGGER.debug("Queueing FTP task.")
+            self._ftpAttempt = 1
+            self._ftpTask = _model_data_executor.submit(self._async_download_task_data_from_printer)
         else:
-            LOGGER.debug("FTP thread already running.")
+            LOGGER.debug("FTP task already queued or running.")
             self._ftpRunAgain = True
 
     def _clear_model_data(self):
@@ -1565,216 +2024,138 @@ class PrintJob:
         self._printable_objects = {}
 
     def _async_download_task_data_from_printer(self):
-        current_thread = threading.current_thread()
-        current_thread.setName(f"{self._client._device.info.device_type}-FTP-{threading.get_native_id()}")
-        LOGGER.debug(f"FTP thread starting.")
+        LOGGER.debug(f"FTP task starting.")
+        start_time = datetime.now()
+        retry = False
 
         try:
-            while True:
-                self._ftpRunAgain = False
-                start_time = datetime.now()
-                self._async_download_task_data_from_printer_worker()
-                if not self._ftpRunAgain:
-                    break
-                end_time = datetime.now()
-                LOGGER.debug("FTP thread re-running. Elapsed time = {(end_time-start_time).seconds}s")
+            self._ftpRunAgain = False
+            retry = self._async_download_task_data_from_printer_worker()
         except Exception as e:
-            LOGGER.error(f"FTP thread failed with exception {e}")
+            LOGGER.error(f"FTP task failed with exception {e}")
 
         end_time = datetime.now()
-        LOGGER.info(f"FTP thread exiting. Elapsed time = {(end_time-start_time).seconds}s")
-        self._ftpThread = None
+        if self._ftpRunAgain:
+            LOGGER.debug(f"FTP task re-running. Elapsed time = {(end_time-start_time).seconds}s")
+            self._ftpAttempt = 1
+            self._ftpTask = _model_data_executor.submit(self._async_download_task_data_from_printer)
+        elif retry and self._ftpAttempt < 12:
+            # The X1 has a weird behavior where the downloaded file doesn't exist for several seconds into the RUNNING phase and even
+            # then it is still being downloaded in place so we might try to grab it mid-download and get a corrupt file. Try 12 times
+            # 5 seconds apart over 60s. Wait on a timer rather than in the shared worker pool so other printers aren't held up.
+            self._ftpAttempt += 1
+            LOGGER.debug(f"Retrying in 5s for X1/H2. Try #{self._ftpAttempt}")
+            timer = threading.Timer(5, self._retry_download_task_data_from_printer)
+            timer.daemon = True
+            timer.start()
+        else:
+            if retry:
+                LOGGER.debug("No model file found.")
+            LOGGER.info(f"FTP task exiting. Elapsed time = {(end_time-start_time).seconds}s")
+            self._ftpTask = None
+
+    def _retry_download_task_data_from_printer(self):
+        self._ftpTask = _model_data_executor.submit(self._async_download_task_data_from_printer)
 
-    def _async_download_task_data_from_printer_worker(self):
+    def _async_download_task_data_from_printer_worker(self) -> bool:
+        """Download and parse the model for the current job. Returns True if the model should be looked for again shortly."""
         # Open the FTP connection
         ftp = self._client.ftp_connection()
-
-        for i in range(1,13):
+        try:
             model_file_path = self._attempt_ftp_download(ftp)
-            if model_file_path is not None:
-                break
-
-            if (self._client._device.info.device_type == Printers.X1 or 
-                self._client._device.info.device_type == Printers.X1C or
-                self._client._device.info.device_type == Printers.X1E or
-                self._client._device.info.device_type == Printers.H2C or
-                self._client._device.info.device_type == Printers.H2D or
-                self._client._device.info.device_type == Printers.H2DPRO or
-                self._client._device.info.device_type == Printers.H2S):
-                # The X1 has a weird behavior where the downloaded file doesn't exist for several seconds into the RUNNING phase and even
-                # then it is still being downloaded in place so we might try to grab it mid-download and get a corrupt file. Try 13 times
-                # 5 seconds apart over 60s.
-                if i != 12:
-                    LOGGER.debug(f"Sleeping 5s for X1/H2 retry")
-                    time.sleep(5)
-                    LOGGER.debug(f"Try #{i+1} for X1/H2")
-            else:
-                break
-
-        ftp.quit()
+        finally:
+            ftp.quit()
 
         if model_file_path is None:
+            if self._client._device.info.device_type in (Printers.X1, Printers.X1C, Printers.X1E,
+                                                         Printers.H2C, Printers.H2D, Printers.H2DPRO, Printers.H2S):
+                return True
             LOGGER.debug("No model file found.")
-            return
+            return False
 
-        result = False
-        
         try:
             LOGGER.debug(f"File size is {os.path.getsize(model_file_path)} bytes")
 
-            model_dir = os.path.dirname(model_file_path)
+            key = _model_metadata_cache.key(model_file_path)
+            metadata = _model_metadata_cache.get(key)
+            if metadata is None:
+                metadata = ModelMetadata.from_3mf(model_file_path)
+                _model_metadata_cache.put(key, metadata)
+                # The cover image and gcode were extracted alongside the model.
+                with self._client.file_cache.batch():
+                    for extension in ('.png', '.gcode'):
+                        self._client.file_cache.update_file(os.path.splitext(model_file_path)[0] + extension)
+            else:
+                LOGGER.debug("Using cached model metadata.")
+            with self._client._device.data_lock:
+                self._apply_model_metadata(metadata)
 
-            # Open the 3mf zip archive
-            with ZipFile(model_file_path) as archive:
-                # Extract the slicer XML config and parse the plate tree
-                plate = ElementTree.fromstring(archive.read('Metadata/slice_info.config')).find('plate')
-                
-                # Iterate through each config element and extract the data
-                # Example contents:
-                # {'key': 'index', 'value': '2'}
-                # {'key': 'printer_model_id', 'value': 'C12'}
-                # {'key': 'nozzle_diameters', 'value': '0.4'}
-                # {'key': 'timelapse_type', 'value': '0'}
-                # {'key': 'prediction', 'value': '5935'}
-                # {'key': 'weight', 'value': '20.91'}
-                # {'key': 'outside', 'value': 'false'}
-                # {'key': 'support_used', 'value': 'false'}
-                # {'key': 'label_object_enabled', 'value': 'true'}
-                # {'identify_id': '123', 'name': 'ModelObjectOne.stl', 'skipped': 'false'}
-                # {'identify_id': '394', 'name': 'ModelObjectTwo.stl', 'skipped': 'false'}
-                # {'id': '1', 'tray_info_idx': 'GFA01', 'type': 'PLA', 'color': '#000000', 'used_m': '5.45', 'used_g': '17.32'}
-                # {'id': '2', 'tray_info_idx': 'GFA01', 'type': 'PLA', 'color': '#8D8C8F', 'used_m': '0.84', 'used_g': '2.66'}
-                # {'id': '3', 'tray_info_idx': 'GFA01', 'type': 'PLA', 'color': '#FFFFFF', 'used_m': '0.29', 'used_g': '0.93'}
-                
-                # Start a total print length count to be compiled from each filament
-                print_length = 0
-                plate_number = None
-                _printable_objects = {}
-                filament_count = len(self.ams_mapping)
-                plate_filament_count = len(plate.findall('filament'))
-
-                # Reset filament data
-                self._ams_print_weights = [0.0] * 136 # TODO: Convert to a dict in the future?
-                self._ams_print_lengths = [0.0] * 136 # TODO: Convert to a dict in the future?
-
-                for metadata in plate:
-                    if (metadata.get('key') == 'index'):
-                        # Index is the plate number being printed
-                        plate_number = metadata.get('value')
-                        LOGGER.debug(f"Plate: {plate_number}")
-                        
-                        # Now we have the plate number, extract the cover image from the archive
-                        self._client._device.cover_image.set_image(archive.read(f"Metadata/plate_{plate_number}.png"))
-                        LOGGER.debug(f"Cover image: Metadata/plate_{plate_number}.png")
-
-                        # Save the cover image to the cache
-                        try:
-                            # Save the cover image directly to the cache
-                            cover_filename = os.path.splitext(os.path.basename(model_file_path))[0] + '.png'
-                            cover_path = os.path.join(model_dir, cover_filename)
-                            with archive.open(f"Metadata/plate_{plate_number}.png") as cover_entry, open(cover_path, "wb") as target_path:
-                                shutil.copyfileobj(cover_entry, target_path)
-                            LOGGER.debug(f"Cover image saved to: {cover_path}")
-                        except Exception as e:
-                            LOGGER.error(f"Failed to save cover image: {e}")
-
-                        try:
-                            # Save the gcode file to the cache
-                            gcode_filename = os.path.splitext(os.path.basename(model_file_path))[0] + '.gcode'
-                            gcode_path = os.path.join(model_dir, gcode_filename)
-                            with archive.open(f"Metadata/plate_{plate_number}.gcode") as gcode_entry, open(gcode_path, "wb") as target_path:
-                                shutil.copyfileobj(gcode_entry, target_path)
-                                self.gcode_file_downloaded = gcode_filename
-                        except Exception as e:
-                            self.gcode_file_downloaded = "ERROR"
-                            LOGGER.error(f"Error while extracting gcode zip entry to target path. {repr(e)}")
-                        
-                        # And extract the plate type from the plate json.
-                        self.print_bed_type = json.loads(archive.read(f"Metadata/plate_{plate_number}.json")).get('bed_type')
-                    elif (metadata.get('key') == 'weight'):
-                        LOGGER.debug(f"Weight: {metadata.get('value')}")
-                        self.print_weight = metadata.get('value')
-                    elif (metadata.get('key') == 'prediction'):
-                        # Estimated print length in seconds
-                        LOGGER.debug(f"Print time: {metadata.get('value')}s")
-                    elif (metadata.tag == 'object'):
-                        # Get the list of printable objects present on the plate before slicing.
-                        # This includes hidden objects which need to be filtered out later.
-                        if metadata.get('skipped') == f"false":
-                            _printable_objects[metadata.get('identify_id')] = metadata.get('name')
-                    elif (metadata.tag == 'filament'):
-                        try:
-                            # Filament used for the current print job. The plate info contains filaments
-                            # identified in the order they appear in the slicer. These IDs must be
-                            # mapped to the AMS tray mappings provided by MQTT print.ams_mapping
-
-                            # Zero-index the filament ID
-                            filament_index = int(metadata.get('id')) - 1
-                            log_label = f"External spool"
-                            
-                            # Filament count should be greater than the zero-indexed filament ID
-                            if filament_count > filament_index:
-                                ams_index = self.ams_mapping[filament_index]
-                                if ams_index < 16: # BUG - This will not yet handle AMS HT devices
-                                    # We add the filament as you can map multiple slicer filaments to the same physical filament.
-                                    self._ams_print_weights[ams_index] += float(metadata.get('used_g'))
-                                    self._ams_print_lengths[ams_index] += float(metadata.get('used_m'))
-                                    log_label = f"AMS Tray {ams_index + 1}"
-                                else:
-                                    LOGGER.debug(f"ams_mapping: {self.ams_mapping}")
-                            elif plate_filament_count > 0:
-                                # Multi filament print but the AMS mapping is unknown
-                                # The data is only sent in the mqtt payload once and isn't part of the 'full' data so the integration must be
-                                # live and listening to capture it.
-                                LOGGER.debug(f"filament_index: {filament_index}")
-                                log_label = f"AMS Tray unknown"
-                            else:
-                                LOGGER.debug(f"plate_filament_count: {plate_filament_count}")
-
-                            LOGGER.debug(f"{log_label}: {metadata.get('used_m')}m | {metadata.get('used_g')}g")
-
-                            # Increase the total print length
-                            print_length += float(metadata.get('used_m'))
-                        except Exception as e:
-                            LOGGER.error(f"Failed to parse filament data: {e}")
-                
-                self.print_length = print_length
+            self._client._device.data_updated("print_job")
+        except Exception as e:
+            LOGGER.error(f"Unexpected error parsing model data: {e}")
+        
+        self.prune_print_history_files()
 
-                if plate_number is not None:
-                    try:
-                        image = archive.read(f"Metadata/pick_{plate_number}.png")
-                        self._client._device.pick_image.set_image(image)
-                        # Process the pick image for objects
-                        pick_image = Image.open(archive.open(f"Metadata/pick_{plate_number}.png"))
-                        identify_ids = self._identify_objects_in_pick_image(image=pick_image)
-                        
-                        # Filter the printable objects from slice_info.config, removing
-                        # any that weren't detected in the pick image
-                        self._printable_objects = {k: _printable_objects[k] for k in identify_ids if k in _printable_objects}
-                    except:
-                        LOGGER.debug(f"Unable to load 'Metadata/pick_{plate_number}.png' from archive")
+        return False
 
-                # Save the slice_info.config file only if file cache is enabled
-                try:
-                    slice_info_bytes = archive.read('Metadata/slice_info.config')
-                    # Save the slice_info.config in the same directory as the model file
-                    slice_info_filename = os.path.splitext(os.path.basename(model_file_path))[0] + '.slice_info.config'
-                    slice_info_path = os.path.join(model_dir, slice_info_filename)
-                    with open(slice_info_path, "wb") as f:
-                        f.write(slice_info_bytes)
-                except Exception as e:
-                    LOGGER.error(f"Failed to save slice_info.config: {e}")
+    def _apply_model_metadata(self, metadata: ModelMetadata):
+        # Reset filament data
+        self._ams_print_weights = [0.0] * 136 # TODO: Convert to a dict in the future?
+        self._ams_print_lengths = [0.0] * 136 # TODO: Convert to a dict in the future?
 
-            archive.close()
+        if metadata.plate_number is not None:
+            self._client._device.cover_image.set_image(metadata.cover_image)
+            self.gcode_file_downloaded = metadata.gcode_file
+            self.print_bed_type = metadata.bed_type
+        if metadata.weight is not None:
+            self.print_weight = metadata.weight
+
+        # Start a total print length count to be compiled from each filament
+        print_length = 0
+        filament_count = len(self.ams_mapping)
+        plate_filament_count = len(metadata.filaments)
+        for filament_id, used_m, used_g in metadata.filaments:
+            try:
+                # Filament used for the current print job. The plate info contains filaments
+                # identified in the order they appear in the slicer. These IDs must be
+                # mapped to the AMS tray mappings provided by MQTT print.ams_mapping
 
-            self._client.callback("event_printer_data_update")
-            result = True
-        except Exception as e:
-            LOGGER.error(f"Unexpected error parsing model data: {e}")
+                # Zero-index the filament ID
+                filament_index = int(filament_id) - 1
+                log_label = f"External spool"
+                
+                # Filament count should be greater than the zero-indexed filament ID
+                if filament_count > filament_index:
+                    ams_index = self.ams_mapping[filament_index]
+                    if ams_index < 16: # BUG - This will not yet handle AMS HT devices
+                        # We add the filament as you can map multiple slicer filaments to the same physical filament.
+                        self._ams_print_weights[ams_index] += float(used_g)
+                        self._ams_print_lengths[ams_index] += float(used_m)
+                        log_label = f"AMS Tray {ams_index + 1}"
+                    else:
+                        LOGGER.debug(f"ams_mapping: {self.ams_mapping}")
+                elif plate_filament_count > 0:
+                    # Multi filament print but the AMS mapping is unknown
+                    # The data is only sent in the mqtt payload once and isn't part of the 'full' data so the integration must be
+                    # live and listening to capture it.
+                    LOGGER.debug(f"filament_index: {filament_index}")
+                    log_label = f"AMS Tray unknown"
+                else:
+                    LOGGER.debug(f"plate_filament_count: {plate_filament_count}")
+
+                LOGGER.debug(f"{log_label}: {used_m}m | {used_g}g")
+
+                # Increase the total print length
+                print_length += float(used_m)
+            except Exception as e:
+                LOGGER.error(f"Failed to parse filament data: {e}")
         
-        self.prune_print_history_files()
+        self.print_length = print_length
 
-        return result
+        if metadata.pick_image is not None:
+            self._client._device.pick_image.set_image(metadata.pick_image)
+        if metadata.printable_objects is not None:
+            self._printable_objects = metadata.printable_objects
 
     # The task list is of the following form with a 'hits' array with typical 20 entries.
     #
@@ -1818,17 +2199,31 @@ class PrintJob:
     #     "bedType": "textured_plate"
     #     },
 
-    def _download_task_data_from_cloud(self):
+    def _download_task_data_from_cloud(self, since: float = None):
         # Must have an auth token for this to be possible
         if self._client.bambu_cloud.auth_token == "":
             return
 
-        self._task_data = self._client.bambu_cloud.get_latest_task_for_printer(self._client._serial)
+        # Fetch everything first so the lock is only held while the result is applied.
+        task_data = self._client.bambu_cloud.get_latest_task_for_printer(self._client._serial, since)
+        if task_data is None:
+            self._client._device.cover_image.set_image(None)
+        else:
+            url = task_data.get('cover', '')
+            if url != "":
+                self._client._device.cover_image.set_image(self._client.bambu_cloud.download(url))
+
+        # Applied under the device data lock so it can't interleave with the mqtt thread's change tracking.
+        with self._client._device.data_lock:
+            self._apply_cloud_task_data(task_data)
+        self._client._device.data_updated("print_job")
+
+    def _apply_cloud_task_data(self, task_data: dict | None):
+        self._task_data = task_data
         self._ams_print_weights = [0.0] * 136 # TODO: Convert to a dict in the future?
         self._ams_print_lengths = [0.0] * 136 # TODO: Convert to a dict in the future?
         if self._task_data is None:
             LOGGER.debug("No bambu cloud task data found for printer.")
-            self._client._device.cover_image.set_image(None)
             self.print_weight = 0
             self.print_length = 0
             self.print_bed_type = "unknown"
@@ -1836,11 +2231,6 @@ class PrintJob:
             self.end_time = None
         else:
             LOGGER.debug("Updating bambu cloud task data found for printer.")
-            url = self._task_data.get('cover', '')
-            if url != "":
-                data = self._client.bambu_cloud.download(url)
-                self._client._device.cover_image.set_image(data)
-
             self.print_length = self._task_data.get('length', self.print_length * 100) / 100
             self.print_bed_type = self._task_data.get('bedType', self.print_bed_type)
             self.print_weight = self._task_data.get('weight', self.print_weight)
@@ -1887,34 +2277,6 @@ class PrintJob:
                     self.start_time = cloud_dt.astimezone(tz.UTC)
                     LOGGER.debug(f"CLOUD END TIME2: {self.end_time}")
 
-    def _identify_objects_in_pick_image(self, image: Image) -> set:
-        LOGGER.debug(f"Processing the pick image for objects")
-        # Open the pick image so we can detect objects present
-        image_width, image_height = image.size
-        
-        seen_colors = set()
-        seen_identify_ids = set()
-
-        # Loop through every pixel and label the first occurrence of each unique color
-        pixels = image.load()
-        for y in range(image_height):
-            for x in range(image_width):
-                current_color = pixels[x, y]
-                r, g, b, a = current_color
-
-                # Skip this pixel if it's transparent or already identified
-                if a == 0 or current_color in seen_colors:
-                    continue
-
-                # Convert the colour to the decimal representation of its hex value
-                identify_id = int(f"0x{b:02X}{g:02X}{r:02X}", 16)
-                seen_colors.add(current_color)
-                seen_identify_ids.add(str(identify_id))
-        
-        object_count = len(seen_identify_ids)
-        LOGGER.debug(f"Finished proccessing pick image, found {object_count} object{'s'[:object_count^1]}")
-        return seen_identify_ids
-
     async def async_ftp_file_check(self, file_path: str, expected_size: int) -> bool:
         """Async check if a file exists on the printer via FTP and matches the expected size."""
         loop = asyncio.get_event_loop()
@@ -1956,6 +2318,7 @@ class PrintJob:
             this_printer_cache_file_path.parent.mkdir(parents=True, exist_ok=True)
             shutil.copy2(local_path, this_printer_cache_file_path)
             LOGGER.debug(f"Copied file to local cache: {this_printer_cache_file_path}")
+            self._client.file_cache.update_file(str(this_printer_cache_file_path))
         except Exception as e:
             LOGGER.error(f"Failed to copy file to local cache: {e}")
 
@@ -2077,7 +2440,7 @@ class Info:
     def set_online(self, online):
         if self.online != online:
             self.online = online
-            self._client.callback("event_printer_data_update")
+            self._client._device.data_updated("info")
 
     def info_update(self, data):
 
@@ -2843,6 +3206,8 @@ class ExternalSpool(AMSTray):
 @dataclass
 class Speed:
     """Return speed profile information"""
+    PUSH_KEYS = frozenset({"spd_lvl", "spd_mag"})
+
     _id: int
     name: str
     modifier: int
@@ -2876,6 +3241,8 @@ class Speed:
 @dataclass
 class StageAction:
     """Return Stage Action information"""
+    PUSH_KEYS = frozenset({"print_type", "stage", "stg_cur"})
+
     _id: int
     _print_type: str
     description: str
@@ -2906,6 +3273,8 @@ class StageAction:
 @dataclass
 class HMSList:
     """Return all HMS related info"""
+    PUSH_KEYS = frozenset({"hms"})
+
     _errors: dict
 
     def __init__(self, client):
@@ -2975,6 +3344,8 @@ class HMSList:
 @dataclass
 class PrintError:
     """Return all print_error related info"""
+    PUSH_KEYS = frozenset({"print_error"})
+
     _error: dict
 
     def __init__(self, client):
@@ -3061,19 +3432,72 @@ class HMSNotification:
 @dataclass
 class ChamberImage:
     """Returns the latest jpeg data from the P1P camera"""
+    # Seconds images keep being delivered after the last request for one.
+    LEASE_DURATION = 30
+
     def __init__(self, client):
         self._client = client
         self._bytes = bytearray()
         self._image_last_updated = None
+        self._subscribers = 0
+        self._lease_expires = 0
+        self._thumbnails = {}
+        self._lock = threading.Lock()
 
     def set_image(self, bytes):
-        self._bytes = bytes
+        # The image thread hands over ownership of the buffer and never writes to it again.
+        with self._lock:
+            self._bytes = bytes
+            self._thumbnails = {}
         self._image_last_updated = datetime.now()
         self._client.callback("event_printer_chamber_image_update")
 
     def get_image(self) -> bytearray:
-        return self._bytes.copy()
-    
+        return self._bytes
+
+    def get_thumbnail(self, width: int | None, height: int | None) -> bytes:
+        """Return the latest image scaled down to fit width x height, reusing the result until the next image"""
+        with self._lock:
+            image_bytes = self._bytes
+            thumbnail = self._thumbnails.get((width, height))
+        if thumbnail is not None or len(image_bytes) == 0:
+            return thumbnail or image_bytes
+
+        image = Image.open(BytesIO(image_bytes))
+        if (width is None or image.width <= width) and (height is None or image.height <= height):
+            thumbnail = image_bytes
+        else:
+            image.thumbnail((width or image.width, height or image.height))
+            output = BytesIO()
+            image.save(output, format="JPEG")
+            thumbnail = output.getvalue()
+
+        with self._lock:
+            # Only cache if a new image hasn't arrived while scaling.
+            if self._bytes is image_bytes:
+                self._thumbnails[(width, height)] = thumbnail
+        return thumbnail
+
+    def add_subscriber(self):
+        """Register interest in new images. Returns a callable that removes the subscription."""
+        with self._lock:
+            self._subscribers += 1
+
+        def remove_subscriber():
+            with self._lock:
+                self._subscribers -= 1
+
+        return remove_subscriber
+
+    def renew_lease(self):
+        """Keep images coming for LEASE_DURATION seconds. Called whenever an image is requested."""
+        with self._lock:
+            self._lease_expires = time.monotonic() + self.LEASE_DURATION
+
+    @property
+    def has_subscribers(self) -> bool:
+        return self._subscribers > 0 or time.monotonic() < self._lease_expires
+
     def get_last_update_time(self) -> datetime:
         return self._image_last_updated
 
@@ -3125,6 +3549,8 @@ class PickImage:
 @dataclass
 class HomeFlag:
     """Contains parsed _values from the homeflag sensor"""
+    PUSH_KEYS = frozenset({"home_flag"})
+
     _value: int
     _sw_ver: str
     _device_type: str 
@@ -3221,6 +3647,8 @@ class HomeFlag:
 @dataclass
 class PrintFun:
     """Contains parsed _values from the print->fun sensor"""
+    PUSH_KEYS = frozenset({"fun"})
+
     _value: str
     _int_value: int
     _encryption_enabled: bool
@@ -3291,6 +3719,7 @@ class SlicerSettings:
         return self.custom_filaments
 
     def _load_custom_filaments(self, slicer_settings: dict):
+        custom_filaments = {}
         filaments = slicer_settings.get("filament")
         if filaments is not None:
             private_filaments = filaments.get("private", {})
@@ -3300,7 +3729,7 @@ class SlicerSettings:
                     if " @" in name:
                         name = name[:name.index(" @")]
                     id = filament["filament_id"]
-                    self.custom_filaments[id] = FilamentInfo(
+                    custom_filaments[id] = FilamentInfo(
                         name=name,
                         filament_vendor=filament["filament_vendor"],
                         filament_type=filament["filament_type"],
@@ -3309,20 +3738,48 @@ class SlicerSettings:
                         nozzle_temperature_range_high=filament["nozzle_temperature"][1],
                         nozzle_temperature_range_low=filament["nozzle_temperature"][0]
                     )
-            LOGGER.debug(f"Got {len(self.custom_filaments)} custom filaments.")
+            LOGGER.debug(f"Got {len(custom_filaments)} custom filaments.")
+        # Swap in the complete set so the mqtt thread never sees a partially loaded one.
+        self.custom_filaments = custom_filaments
 
     def update(self):
-        self.custom_filaments = {}
+        """Load the slicer settings in the background. They are cached per account so reconnects and other
+        printers on the same account reuse them."""
         if self._client.bambu_cloud.auth_token != "":
-            LOGGER.debug("Loading slicer settings")
-            slicer_settings = self._client.bambu_cloud.get_slicer_settings()
-            if slicer_settings is None:
-                self._client.callback("event_printer_bambu_authentication_failed")
-            else:
-                self._load_custom_filaments(slicer_settings)
+            _cloud_executor.submit(self._async_update)
+        else:
+            self.custom_filaments = {}
+
+    def _async_update(self):
+        LOGGER.debug("Loading slicer settings")
+        slicer_settings = self._client.bambu_cloud.get_slicer_settings()
+        if slicer_settings is None:
+            self.custom_filaments = {}
+            self._client.callback("event_printer_bambu_authentication_failed")
+        else:
+            self._load_custom_filaments(slicer_settings)
+            self._refresh_tray_names()
+
+    def _refresh_tray_names(self):
+        # Trays may have been named before the custom filaments arrived.
+        device = self._client._device
+        updated_parts = set()
+        with device.data_lock:
+            trays = [("ams", tray) for ams in device.ams.data.values() for tray in ams.tray if tray is not None]
+            trays.extend(("external_spool", tray) for tray in device.external_spool)
+            for part, tray in trays:
+                if not tray.empty:
+                    name = get_filament_name(tray.idx, self.custom_filaments)
+                    if name != tray.name:
+                        tray.name = name
+                        updated_parts.add(part)
+        if updated_parts:
+            device.data_updated(*updated_parts)
 
 class ExtruderTool:
     """Contains parsed _values from the ext_tool sensor"""
+    PUSH_KEYS = frozenset({"device"})
+
     state: str
 
     def __init__(self, client):
@@ -3352,6 +3809,8 @@ class ExtruderTool:
         return (old_data != f"{self.__dict__}")
     
 class Extruder:
+    PUSH_KEYS = frozenset({"device"})
+
     _active_nozzle_index: int
 
     def __init__(self, client):
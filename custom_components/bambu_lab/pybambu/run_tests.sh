@@ -13,7 +13,7 @@ pip install -r "$SCRIPT_DIR/tests/requirements.txt"
 cd "$(dirname "$SCRIPT_DIR")"
 
 # Run tests with PYTHONPATH set to include the parent directory
-PYTHONPATH="$(pwd)" python3 -m unittest pybambu.tests.test_models pybambu.tests.test_error_lookup -v
+PYTHONPATH="$(pwd)" python3 -m unittest pybambu.tests.test_models pybambu.tests.test_error_lookup pybambu.tests.test_push_replay pybambu.tests.test_chamber_image pybambu.tests.test_bambu_cloud -v
 
 # Deactivate virtual environment
 deactivate
\ No newline at end of file
@@ -0,0 +1,163 @@
+"""
+Tests for the shared per-account Bambu Cloud cache against a local HTTP server standing in for the cloud.
+"""
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+# Add the parent directory to the Python path to find pybambu
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from pybambu import bambu_cloud
+from pybambu.bambu_cloud import BambuCloud, CachedCloudResponse, ConnectionMechanismEnum
+from pybambu.const import BambuUrl
+
+
+TASKLIST = {
+    "total": 3,
+    "hits": [
+        {"id": 3, "deviceId": "PRINTER1", "status": 2, "title": "Newest"},
+        {"id": 2, "deviceId": "PRINTER2", "status": 2, "title": "Other"},
+        {"id": 1, "deviceId": "PRINTER1", "status": 4, "title": "Oldest"},
+    ]
+}
+
+SLICER_SETTINGS = {"filament": {"private": []}}
+
+
+class StandInCloud(ThreadingHTTPServer):
+    """Serves canned responses for the task list and slicer settings, counting requests by path"""
+
+    def __init__(self, delay: float = 0.2):
+        super().__init__(("127.0.0.1", 0), StandInCloudHandler)
+        self.delay = delay
+        self.status = 200
+        self.requests = {}
+        self._lock = threading.Lock()
+
+    def url(self, urlenum: BambuUrl, region: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/{urlenum.name}"
+
+    def count(self, urlenum: BambuUrl) -> int:
+        with self._lock:
+            return self.requests.get(f"/{urlenum.name}", 0)
+
+    def record(self, path: str):
+        with self._lock:
+            self.requests[path] = self.requests.get(path, 0) + 1
+
+
+class StandInCloudHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.record(self.path)
+        # Hold each response open long enough for concurrent callers to overlap.
+        time.sleep(self.server.delay)
+        if self.path == f"/{BambuUrl.TASKS.name}":
+            body = TASKLIST
+        elif self.path == f"/{BambuUrl.SLICER_SETTINGS.name}":
+            body = SLICER_SETTINGS
+        else:
+            body = {}
+        payload = json.dumps(body).encode()
+        self.send_response(self.server.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestBambuCloudCache(unittest.TestCase):
+    def setUp(self):
+        self.server = StandInCloud()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        for patcher in (patch.object(bambu_cloud, "get_Url", self.server.url),
+                        patch.object(bambu_cloud, "CONNECTION_MECHANISM", ConnectionMechanismEnum.REQUESTS)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def make_cloud(self, auth_token: str = "token") -> BambuCloud:
+        return BambuCloud(region="", email="", username="", auth_token=auth_token)
+
+    def test_concurrent_callers_share_one_request(self):
+        # Several printers on one account all starting jobs at the same time.
+        clouds = [self.make_cloud() for _ in range(4)]
+        results = {}
+
+        def fetch(index):
+            results[index] = clouds[index].get_latest_task_for_printer(f"PRINTER{index % 2 + 1}")
+
+        threads = [threading.Thread(target=fetch, args=(index,)) for index in range(len(clouds))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(1, self.server.count(BambuUrl.TASKS))
+        self.assertEqual("Newest", results[0]["title"])
+        self.assertEqual("Other", results[1]["title"])
+
+    def test_tasks_indexed_by_device(self):
+        cloud = self.make_cloud()
+        self.assertEqual(["Newest", "Oldest"], [task["title"] for task in cloud.get_tasklist_for_printer("PRINTER1")])
+        self.assertEqual([], cloud.get_tasklist_for_printer("UNKNOWN"))
+        self.assertIsNone(cloud.get_latest_task_for_printer("UNKNOWN"))
+        self.assertEqual(3, cloud.get_tasklist()["total"])
+        self.assertEqual(1, self.server.count(BambuUrl.TASKS))
+
+    def test_since_requires_a_newer_response(self):
+        cloud = self.make_cloud()
+        cloud.get_tasklist()
+        cloud.get_tasklist(since=time.monotonic() - 60)
+        self.assertEqual(1, self.server.count(BambuUrl.TASKS))
+        cloud.get_tasklist(since=time.monotonic())
+        self.assertEqual(2, self.server.count(BambuUrl.TASKS))
+
+    def test_accounts_are_separate(self):
+        clouds = [self.make_cloud("token1"), self.make_cloud("token1"), self.make_cloud("token2")]
+        for cloud in clouds:
+            cloud.get_slicer_settings()
+        self.assertEqual(2, self.server.count(BambuUrl.SLICER_SETTINGS))
+
+    def test_failures_are_not_cached(self):
+        cloud = self.make_cloud()
+        self.server.status = 401
+        self.assertIsNone(cloud.get_slicer_settings())
+        self.server.status = 200
+        self.assertEqual(SLICER_SETTINGS, cloud.get_slicer_settings())
+        self.assertEqual(2, self.server.count(BambuUrl.SLICER_SETTINGS))
+
+    def test_auth_token_change_switches_account(self):
+        cloud = self.make_cloud("")
+        cloud.get_tasklist()
+        cloud._auth_token = "token"
+        cloud.get_tasklist()
+        self.assertEqual(2, self.server.count(BambuUrl.TASKS))
+
+
+class TestCachedCloudResponse(unittest.TestCase):
+    def test_ttl(self):
+        calls = []
+        cache = CachedCloudResponse(ttl=0.1)
+        fetch = lambda: calls.append(1) or len(calls)
+        self.assertEqual(1, cache.get(fetch))
+        self.assertEqual(1, cache.get(fetch))
+        time.sleep(0.15)
+        self.assertEqual(2, cache.get(fetch))
+        cache.invalidate()
+        self.assertEqual(3, cache.get(fetch))
+
+
+if __name__ == '__main__':
+    unittest.main()
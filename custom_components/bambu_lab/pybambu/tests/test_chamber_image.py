@@ -0,0 +1,165 @@
+"""
+Tests for ChamberImageThread against a local TLS server standing in for the printer's
+chamber image port, and for the ChamberImage thumbnail cache.
+"""
+import os
+import shutil
+import socket
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from io import BytesIO
+from unittest.mock import MagicMock
+
+# Add the parent directory to the Python path to find pybambu
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from PIL import Image
+
+from pybambu.bambu_client import ChamberImageThread, create_insecure_ssl_context
+from pybambu.models import ChamberImage
+
+
+def make_jpeg(width: int = 640, height: int = 480, color: str = "red") -> bytes:
+    output = BytesIO()
+    Image.new("RGB", (width, height), color).save(output, format="JPEG")
+    return output.getvalue()
+
+
+class StandInPrinter(threading.Thread):
+    """Accepts one chamber image connection and sends the given frames the way a printer does"""
+
+    def __init__(self, certfile: str, keyfile: str, frames: list[bytes], interval: float):
+        super().__init__(daemon=True)
+        self._context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        self._context.load_cert_chain(certfile, keyfile)
+        self._listener = socket.create_server(("127.0.0.1", 0))
+        self.port = self._listener.getsockname()[1]
+        self._frames = frames
+        self._interval = interval
+        self.auth_data = b""
+        self.done = threading.Event()
+        self.release = threading.Event()
+
+    def run(self):
+        conn, _ = self._listener.accept()
+        with self._context.wrap_socket(conn, server_side=True) as tls:
+            while len(self.auth_data) < 80:
+                self.auth_data += tls.recv(80 - len(self.auth_data))
+            for frame in self._frames:
+                tls.sendall(len(frame).to_bytes(4, 'little') + b"\0\0\0\0\1\0\0\0\0\0\0\0")
+                # Split the payload like the printer does.
+                for offset in range(0, len(frame), 4096):
+                    tls.sendall(frame[offset:offset + 4096])
+                time.sleep(self._interval)
+            self.done.set()
+            # Keep the connection open until the test is finished with it.
+            self.release.wait(10)
+        self._listener.close()
+
+
+class TestChamberImageThread(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if shutil.which("openssl") is None:
+            raise unittest.SkipTest("openssl is required to create the stand-in server certificate")
+        cls._tempdir = tempfile.TemporaryDirectory()
+        cls.certfile = os.path.join(cls._tempdir.name, "cert.pem")
+        cls.keyfile = os.path.join(cls._tempdir.name, "key.pem")
+        subprocess.run(
+            ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1", "-subj", "/CN=127.0.0.1",
+             "-keyout", cls.keyfile, "-out", cls.certfile],
+            check=True, capture_output=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tempdir.cleanup()
+
+    def run_thread(self, frames: list[bytes], subscribed: bool = True, max_fps: float = 0, interval: float = 0.02):
+        server = StandInPrinter(self.certfile, self.keyfile, frames, interval)
+        server.start()
+
+        client = MagicMock()
+        client._access_code = "12345678"
+        client._device.info.ip_address = "127.0.0.1"
+        client.local_tls_context = create_insecure_ssl_context()
+        client.camera_max_fps = max_fps
+        chamber_image = ChamberImage(MagicMock())
+        client._device.chamber_image = chamber_image
+        received = []
+        client.on_jpeg_received.side_effect = received.append
+        if subscribed:
+            chamber_image.add_subscriber()
+
+        thread = ChamberImageThread(client)
+        thread.PORT = server.port
+        thread.STOP_CHECK_INTERVAL = 0.05
+        thread.start()
+        self.assertTrue(server.done.wait(10))
+        time.sleep(0.1)
+        thread.stop()
+        thread.join(5)
+        server.release.set()
+        server.join(5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(b"bblp", server.auth_data[16:20])
+        self.assertEqual(b"12345678", server.auth_data[48:56])
+        return received
+
+    def test_frames_delivered_intact(self):
+        frames = [make_jpeg(color=color) for color in ("red", "green", "blue")]
+        received = self.run_thread(frames)
+        self.assertEqual(frames, [bytes(image) for image in received])
+
+    def test_frames_dropped_without_subscribers(self):
+        self.assertEqual([], self.run_thread([make_jpeg()] * 3, subscribed=False))
+
+    def test_max_fps(self):
+        # Ten frames sent over about a second, delivered at no more than two per second.
+        received = self.run_thread([make_jpeg()] * 10, max_fps=2, interval=0.1)
+        self.assertGreaterEqual(len(received), 1)
+        self.assertLessEqual(len(received), 3)
+
+
+class TestChamberImage(unittest.TestCase):
+    def test_subscribers(self):
+        chamber_image = ChamberImage(MagicMock())
+        self.assertFalse(chamber_image.has_subscribers)
+        remove_first = chamber_image.add_subscriber()
+        remove_second = chamber_image.add_subscriber()
+        remove_first()
+        self.assertTrue(chamber_image.has_subscribers)
+        remove_second()
+        self.assertFalse(chamber_image.has_subscribers)
+
+    def test_lease(self):
+        chamber_image = ChamberImage(MagicMock())
+        chamber_image.LEASE_DURATION = 0.1
+        chamber_image.renew_lease()
+        self.assertTrue(chamber_image.has_subscribers)
+        time.sleep(0.2)
+        self.assertFalse(chamber_image.has_subscribers)
+
+    def test_thumbnail_cache(self):
+        chamber_image = ChamberImage(MagicMock())
+        chamber_image.set_image(bytearray(make_jpeg(1920, 1080)))
+
+        thumbnail = chamber_image.get_thumbnail(320, None)
+        self.assertEqual((320, 180), Image.open(BytesIO(thumbnail)).size)
+        self.assertIs(thumbnail, chamber_image.get_thumbnail(320, None))
+
+        # No scaling needed when the image already fits.
+        self.assertIs(chamber_image.get_image(), chamber_image.get_thumbnail(3840, 2160))
+
+        # A new image invalidates the cache.
+        chamber_image.set_image(bytearray(make_jpeg(1280, 720)))
+        self.assertIsNot(thumbnail, chamber_image.get_thumbnail(320, None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,12 +7,14 @@ simply update the text or select a different locale, printer serial number, etc.
 import unittest
 import os
 import sys
+import time
 
 # Add the parent directory to the Python path to find pybambu
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from pybambu.const import Printers
-from pybambu.utils import get_HMS_error_text, get_print_error_text
+from pybambu import utils
+from pybambu.utils import get_HMS_error_text, get_print_error_text, preload_error_text
 
 class TestErrorLookup(unittest.TestCase):
     def test_exact_hms_error_lookup(self):
@@ -73,4 +75,43 @@ class TestErrorLookup(unittest.TestCase):
         self.assertEqual(
             "unknown",
             get_HMS_error_text("1234_1234_1234_1234", Printers.H2S, "xx-YY"),
-            )
\ No newline at end of file
+            )
+
+    def test_default_before_device_message(self):
+        """A default message listed first wins over a device-specific one listed after it"""
+        index = utils._build_error_index({"device_hms": {"0001": {"Default": [], "Device": ["H2S"]}}})
+        self.assertEqual(("Default", {}), index["device_hms"]["0001"])
+
+        index = utils._build_error_index({"device_hms": {"0001": {"Device": ["H2S"], "Other": ["H2S", "X1C"]}}})
+        self.assertEqual((None, {"H2S": "Device", "X1C": "Other"}), index["device_hms"]["0001"])
+
+class TestErrorLookupBenchmark(unittest.TestCase):
+    LOOKUPS = 200
+
+    def test_lookup_cost(self):
+        """Compare a lookup that loads the error data each time with one that uses the cached index"""
+        codes = list(utils._load_error_data("en")["device_hms"].keys())[:self.LOOKUPS]
+
+        def uncached_lookup(error_code, device_type, preferred_language):
+            for locale_code in utils._get_error_locales(preferred_language):
+                code_entry = utils._load_error_data(locale_code).get("device_hms", {}).get(error_code)
+                for msg, models in (code_entry or {}).items():
+                    if not models or device_type in models:
+                        return msg
+            return 'unknown'
+
+        start = time.perf_counter()
+        for code in codes[:20]:
+            expected = uncached_lookup(code, Printers.H2S, "de-CH")
+        uncached = (time.perf_counter() - start) / 20
+
+        preload_error_text("de-CH")
+        start = time.perf_counter()
+        for code in codes:
+            # Bypass the per-code lru_cache to measure the index itself.
+            utils._get_error_text.__wrapped__("device_hms", code, Printers.H2S, "de-CH")
+        cached = (time.perf_counter() - start) / len(codes)
+
+        self.assertEqual(expected, get_HMS_error_text(codes[19], Printers.H2S, "de-CH"))
+        print(f"\nPer lookup: uncached={uncached * 1000:.2f}ms indexed={cached * 1e6:.2f}us")
+        self.assertLess(cached * 100, uncached)
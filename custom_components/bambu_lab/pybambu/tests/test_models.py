@@ -1,15 +1,21 @@
 import logging
 import unittest
-from unittest.mock import call, MagicMock
+from unittest.mock import call, MagicMock, patch
 from datetime import datetime
 import sys
 import os
 import json
+import tempfile
+import threading
+from io import BytesIO
+from zipfile import ZipFile
+
+from PIL import Image
 
 # Add the parent directory to the Python path to find pybambu
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from pybambu.models import PrintJob, Info, AMSList, Extruder, HMSList, PrintError, Temperature
+from pybambu.models import FileCacheIndex, ModelMetadata, ModelMetadataCache, PrintJob, Info, AMSList, Extruder, HMSList, PrintError, SlicerSettings, Temperature
 from pybambu.const import Printers
 
 class TestPrintJob(unittest.TestCase):
@@ -32,6 +38,259 @@ class TestPrintJob(unittest.TestCase):
         self.assertEqual(self.print_job.current_layer, 1)
         self.assertEqual(self.print_job.total_layers, 70)
 
+    def test_cloud_task_data_marks_print_job(self):
+        self.client.bambu_cloud.auth_token = "token"
+        self.client.bambu_cloud.get_latest_task_for_printer.return_value = {
+            'cover': '', 'length': 545, 'weight': 20.0, 'status': 2,
+            'amsDetailMapping': [{'ams': 1, 'weight': 5.0}],
+        }
+
+        self.print_job._download_task_data_from_cloud()
+
+        self.assertEqual(self.print_job.print_weight, 20.0)
+        self.assertEqual(self.print_job._ams_print_weights[1], 5.0)
+        self.client._device.data_updated.assert_called_once_with("print_job")
+
+class TestSlicerSettings(unittest.TestCase):
+    def test_refresh_tray_names_marks_parts(self):
+        client = MagicMock()
+        client._device.ams.data = {}
+        spool = MagicMock(empty=False, idx="P1234567")
+        spool.name = "unknown"
+        client._device.external_spool = [spool]
+        slicer_settings = SlicerSettings(client)
+        slicer_settings.custom_filaments = {"P1234567": MagicMock()}
+        slicer_settings.custom_filaments["P1234567"].name = "My PLA"
+
+        slicer_settings._refresh_tray_names()
+
+        self.assertEqual(spool.name, "My PLA")
+        client._device.data_updated.assert_called_once_with("external_spool")
+        client.callback.assert_not_called()
+
+def create_3mf(path: str):
+    slice_info = """<config><plate>
+        <metadata key="index" value="2"/>
+        <metadata key="weight" value="20.91"/>
+        <object identify_id="255" name="Visible.stl" skipped="false"/>
+        <object identify_id="394" name="Hidden.stl" skipped="false"/>
+        <filament id="1" type="PLA" used_m="5.45" used_g="17.32"/>
+        <filament id="2" type="PLA" used_m="0.84" used_g="2.66"/>
+    </plate></config>"""
+    pick_image = BytesIO()
+    image = Image.new("RGBA", (8, 8), (0, 0, 0, 0))
+    image.putpixel((1, 1), (255, 0, 0, 255))  # identify_id 255
+    image.save(pick_image, format="PNG")
+    with ZipFile(path, "w") as archive:
+        archive.writestr("Metadata/slice_info.config", slice_info)
+        archive.writestr("Metadata/plate_2.png", b"cover")
+        archive.writestr("Metadata/plate_2.gcode", b"G28")
+        archive.writestr("Metadata/plate_2.json", json.dumps({"bed_type": "textured_plate"}))
+        archive.writestr("Metadata/pick_2.png", pick_image.getvalue())
+
+class TestModelMetadata(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.model_path = os.path.join(self.tempdir.name, "model.3mf")
+        create_3mf(self.model_path)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_from_3mf(self):
+        metadata = ModelMetadata.from_3mf(self.model_path)
+        self.assertEqual("2", metadata.plate_number)
+        self.assertEqual("20.91", metadata.weight)
+        self.assertEqual("textured_plate", metadata.bed_type)
+        self.assertEqual(b"cover", metadata.cover_image)
+        self.assertEqual("model.gcode", metadata.gcode_file)
+        self.assertEqual({"255": "Visible.stl"}, metadata.printable_objects)
+        self.assertEqual([("1", "5.45", "17.32"), ("2", "0.84", "2.66")], metadata.filaments)
+        for extension in (".png", ".gcode", ".slice_info.config"):
+            self.assertTrue(os.path.exists(os.path.join(self.tempdir.name, "model" + extension)))
+
+    def test_apply_to_print_job(self):
+        client = MagicMock()
+        print_job = PrintJob(client)
+        print_job.ams_mapping = [3, 0]
+        print_job._apply_model_metadata(ModelMetadata.from_3mf(self.model_path))
+        self.assertAlmostEqual(6.29, print_job.print_length)
+        self.assertEqual(17.32, print_job._ams_print_weights[3])
+        self.assertEqual(2.66, print_job._ams_print_weights[0])
+        self.assertEqual({"255": "Visible.stl"}, print_job.get_printable_objects)
+        client._device.cover_image.set_image.assert_called_with(b"cover")
+
+    def test_cache(self):
+        cache = ModelMetadataCache(max_entries=2)
+        key = cache.key(self.model_path)
+        self.assertEqual(("model.3mf", os.path.getsize(self.model_path)), key[:2])
+
+        metadata = ModelMetadata()
+        cache.put(key, metadata)
+        self.assertIs(metadata, cache.get(key))
+
+        # Refreshing the cache lifetime of the file keeps the entry.
+        os.utime(self.model_path, ns=(0, key[2] + 1))
+        new_key = cache.key(self.model_path)
+        cache.rekey(key, new_key)
+        self.assertIsNone(cache.get(key))
+        self.assertIs(metadata, cache.get(new_key))
+
+        # The least recently used entry is evicted.
+        cache.put(("a", 1, 1), ModelMetadata())
+        cache.get(new_key)
+        cache.put(("b", 1, 1), ModelMetadata())
+        self.assertIsNone(cache.get(("a", 1, 1)))
+        self.assertIs(metadata, cache.get(new_key))
+
+class TestFileCacheIndex(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.root = self.tempdir.name
+        self.write("prints/cache/old.3mf", mtime=100)
+        self.write("prints/cache/old.png")
+        self.write("prints/new.3mf", mtime=200)
+        self.write("prints/new.gcode", mtime=200)
+        self.write("timelapse/video.mp4", mtime=150)
+        self.write("timelapse/video.jpg")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def write(self, relative_path: str, mtime: int = None) -> str:
+        path = os.path.join(self.root, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(b"x" * 10)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        return path
+
+    def paths(self, index: FileCacheIndex, file_type: str, **kwargs) -> list:
+        return [path for path, _ in index.files(file_type, **kwargs)]
+
+    def test_scan(self):
+        index = FileCacheIndex(self.root)
+        self.assertFalse(index.loaded)
+        index.load()
+        self.assertEqual(["prints/new.3mf", "prints/cache/old.3mf"], self.paths(index, "prints"))
+        self.assertEqual(["prints/new.3mf"], self.paths(index, "prints", offset=0, limit=1))
+        self.assertEqual(["prints/cache/old.3mf"], self.paths(index, "prints", offset=1, limit=1))
+        # gcode files live in the prints directory so, as before, aren't listed under 'gcode'.
+        self.assertEqual([], self.paths(index, "gcode"))
+
+        path, entry = index.files("timelapse")[0]
+        self.assertEqual("timelapse/video.mp4", path)
+        self.assertEqual({'size': 10, 'mtime': 150, 'type': 'timelapse', 'thumbnail': 'timelapse/video.jpg'}, entry)
+        self.assertEqual("prints/cache/old.png", dict(index.files("prints"))["prints/cache/old.3mf"]['thumbnail'])
+
+    def test_persisted(self):
+        FileCacheIndex(self.root).load()
+        # Files added behind the index's back aren't seen until a rescan.
+        self.write("prints/other.3mf", mtime=300)
+        index = FileCacheIndex(self.root)
+        index.load()
+        self.assertEqual(2, len(index.files("prints")))
+        index.rescan()
+        self.assertEqual("prints/other.3mf", self.paths(index, "prints")[0])
+
+    def test_incremental_updates(self):
+        index = FileCacheIndex(self.root)
+        index.load()
+
+        index.update_file(self.write("prints/added.3mf", mtime=300))
+        self.assertEqual("prints/added.3mf", self.paths(index, "prints")[0])
+        index.update_file(self.write("prints/added.png"))
+        self.assertEqual("prints/added.png", index.files("prints")[0][1]['thumbnail'])
+
+        os.remove(os.path.join(self.root, "prints/added.png"))
+        index.remove_file(os.path.join(self.root, "prints/added.png"))
+        self.assertIsNone(index.files("prints")[0][1]['thumbnail'])
+        os.remove(os.path.join(self.root, "prints/cache/old.3mf"))
+        index.remove_file(os.path.join(self.root, "prints/cache/old.3mf"))
+        self.assertEqual(["prints/added.3mf", "prints/new.3mf"], self.paths(index, "prints"))
+
+        # The changes were persisted.
+        reloaded = FileCacheIndex(self.root)
+        reloaded.load()
+        self.assertEqual(index.files("prints"), reloaded.files("prints"))
+
+    def test_changes_before_load_force_rescan(self):
+        FileCacheIndex(self.root).load()
+        index = FileCacheIndex(self.root)
+        os.remove(os.path.join(self.root, "prints/new.3mf"))
+        index.remove_file(os.path.join(self.root, "prints/new.3mf"))
+        index.load()
+        self.assertEqual(["prints/cache/old.3mf"], self.paths(index, "prints"))
+
+    def test_batch_saves_once(self):
+        index = FileCacheIndex(self.root)
+        index.load()
+        paths = [self.write(f"prints/batch{i}.3mf", mtime=300 + i) for i in range(5)]
+        with patch.object(index, "_save", wraps=index._save) as save:
+            with index.batch():
+                for path in paths:
+                    index.update_file(path)
+                for path in paths[:2]:
+                    os.remove(path)
+                    index.remove_file(path)
+                save.assert_not_called()
+            save.assert_called_once()
+
+        reloaded = FileCacheIndex(self.root)
+        reloaded.load()
+        self.assertEqual(["prints/batch4.3mf", "prints/batch3.3mf", "prints/batch2.3mf"], self.paths(reloaded, "prints")[:3])
+
+    def test_files_does_not_wait_for_lock(self):
+        index = FileCacheIndex(self.root)
+        index.load()
+        locked = threading.Event()
+        release = threading.Event()
+
+        def hold_batch():
+            with index.batch():
+                index.update_file(self.write("prints/pending.3mf", mtime=300))
+                locked.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=hold_batch)
+        holder.start()
+        try:
+            self.assertTrue(locked.wait(5))
+            reader = threading.Thread(target=index.files, args=("prints",))
+            reader.start()
+            reader.join(1)
+            self.assertFalse(reader.is_alive())
+            # Changes show up once the batch is committed.
+            self.assertNotIn("prints/pending.3mf", self.paths(index, "prints"))
+        finally:
+            release.set()
+            holder.join()
+        self.assertEqual("prints/pending.3mf", self.paths(index, "prints")[0])
+
+    def test_rescan_keeps_changes_made_during_walk(self):
+        index = FileCacheIndex(self.root)
+        index.load()
+        walk = os.walk
+
+        def change():
+            index.update_file(self.write("prints/during.3mf", mtime=300))
+            os.remove(os.path.join(self.root, "prints/new.3mf"))
+            index.remove_file(os.path.join(self.root, "prints/new.3mf"))
+
+        def walk_with_changes(top):
+            listed = list(walk(top))
+            # Another thread changes the cache after the directories were listed, without waiting for the walk.
+            writer = threading.Thread(target=change)
+            writer.start()
+            writer.join(5)
+            self.assertFalse(writer.is_alive())
+            yield from listed
+
+        with patch("pybambu.models.os.walk", side_effect=walk_with_changes):
+            index.rescan()
+        self.assertEqual(["prints/during.3mf", "prints/cache/old.3mf"], self.paths(index, "prints"))
+
 class TestInfo(unittest.TestCase):
     def setUp(self):
         self.client = MagicMock()
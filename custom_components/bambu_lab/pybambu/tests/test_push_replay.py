@@ -0,0 +1,172 @@
+"""
+Tests for change tracking in Device.print_update and a push replay benchmark.
+
+The benchmark replays a push_all followed by a stream of incremental push_status
+messages, shaped like those an X1C sends roughly once a second while printing, through
+BambuClient.on_message and counts the data objects updated with and without PUSH_KEYS.
+The entity state writes and the coordinator's coalescing are tested against the real
+coordinator in tests/bambu_lab/test_coordinator.py.
+"""
+import json
+import os
+import sys
+import time
+import unittest
+from contextlib import ExitStack
+from unittest.mock import MagicMock, patch
+
+# Add the parent directory to the Python path to find pybambu
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from pybambu import models
+from pybambu.bambu_client import BambuClient
+from pybambu.models import Device
+
+# Every data object Device.print_update reports on.
+ALL_PARTS = {
+    "info", "upgrade", "print_job", "lights", "fans", "speed", "stage", "extruder", "temperature",
+    "ams", "external_spool", "hms", "print_error", "camera", "home_flag", "print_fun", "extruder_tool",
+}
+
+
+def create_device(mock: str = 'MOCK-X1CMULTIAMS') -> tuple[Device, dict]:
+    client = MagicMock()
+    client._usage_hours = 0
+    client._local_mqtt = True
+    client.user_language = 'en'
+    device = Device(client)
+    client._device = device
+
+    with open(os.path.join(os.path.dirname(__file__), f'{mock}.json'), 'r') as f:
+        data = json.load(f)
+    device.info_update(data['get_version']['info'])
+    return device, data
+
+
+def recorded_pushes(count: int) -> list[dict]:
+    """Incremental pushes as sent during a print: temperatures jitter every push, the rest changes slowly."""
+    pushes = []
+    for i in range(count):
+        push = {
+            "command": "push_status",
+            "msg": 1,
+            "sequence_id": str(1000 + i),
+            "nozzle_temper": 220 + (i % 3) * 0.5,
+            "bed_temper": 60 + (i % 2) * 0.25,
+        }
+        if i % 30 == 0:
+            push["mc_percent"] = i // 30
+            push["mc_remaining_time"] = 120 - i // 30
+            push["layer_num"] = i // 30
+        if i % 10 == 0:
+            push["cooling_fan_speed"] = str(15 if (i // 10) % 2 else 10)
+        if i % 20 == 0:
+            push["wifi_signal"] = f"-{40 + (i // 20) % 5}dBm"
+        pushes.append(push)
+    return pushes
+
+
+class TestChangedParts(unittest.TestCase):
+    def setUp(self):
+        self.device, self.data = create_device()
+        self.device.print_update(self.data['pushall']['print'])
+        self.device.pop_changed_parts()
+
+    def test_full_push_reports_parts(self):
+        device, data = create_device()
+        self.assertTrue(device.print_update(data['pushall']['print']))
+        changed_parts = device.pop_changed_parts()
+        self.assertIn("temperature", changed_parts)
+        self.assertIn("print_job", changed_parts)
+        self.assertIn("ams", changed_parts)
+        self.assertTrue(changed_parts.issubset(ALL_PARTS))
+
+    def test_repeated_push_reports_nothing(self):
+        self.assertFalse(self.device.print_update(self.data['pushall']['print']))
+        self.assertEqual(set(), self.device.pop_changed_parts())
+
+    def test_delta_reports_only_changed_part(self):
+        self.device.print_update({"command": "push_status", "msg": 1, "nozzle_temper": 201})
+        self.assertEqual({"temperature"}, self.device.pop_changed_parts())
+
+        self.device.print_update({"command": "push_status", "msg": 1, "mc_percent": 42})
+        self.assertEqual({"print_job"}, self.device.pop_changed_parts())
+
+    def test_changes_accumulate_until_popped(self):
+        self.device.print_update({"command": "push_status", "msg": 1, "nozzle_temper": 201})
+        self.device.print_update({"command": "push_status", "msg": 1, "cooling_fan_speed": "15"})
+        self.assertEqual({"temperature", "fans"}, self.device.pop_changed_parts())
+        self.assertEqual(set(), self.device.pop_changed_parts())
+
+    def test_data_updated_marks_part(self):
+        self.device.info.set_online(not self.device.info.online)
+        self.assertEqual({"info"}, self.device.pop_changed_parts())
+        self.device._client.callback.assert_called_with("event_printer_data_update")
+
+
+class TestOnMessageReplayBenchmark(unittest.TestCase):
+    """Replays captured full pushes followed by incremental pushes through BambuClient.on_message"""
+    PUSH_COUNT = 600
+    GATED_CLASSES = (models.Camera, models.Temperature, models.Speed, models.StageAction, models.HMSList,
+                     models.PrintError, models.HomeFlag, models.PrintFun, models.ExtruderTool, models.Extruder)
+
+    def create_client(self, mock: str) -> tuple[BambuClient, list]:
+        client = BambuClient({'host': '', 'serial': mock})
+        client.client = MagicMock()
+        client._loaded_slicer_settings = True
+        with open(os.path.join(os.path.dirname(__file__), f'{mock}.json'), 'r') as f:
+            data = json.load(f)
+        client._device.info_update(data['get_version']['info'])
+        messages = [data['pushall']] + [{"print": push} for push in recorded_pushes(self.PUSH_COUNT)]
+        return client, [MagicMock(payload=json.dumps(message).encode()) for message in messages]
+
+    def replay(self, mock: str, gated: bool) -> tuple[BambuClient, int, float]:
+        """Replay through on_message, returning the client, the print_update calls of the gated classes and the time taken.
+        Without gating every data object is updated on every push, as before PUSH_KEYS."""
+        client, messages = self.create_client(mock)
+        calls = 0
+
+        def counted(print_update):
+            def wrapper(self_, *args, **kwargs):
+                nonlocal calls
+                calls += 1
+                return print_update(self_, *args, **kwargs)
+            return wrapper
+
+        with ExitStack() as stack:
+            for cls in self.GATED_CLASSES:
+                stack.enter_context(patch.object(cls, "print_update", counted(cls.print_update)))
+                if not gated:
+                    stack.enter_context(patch.object(cls, "PUSH_KEYS", None))
+            start = time.perf_counter()
+            for message in messages:
+                client._refreshed = True
+                client.on_message(None, None, message)
+            elapsed = time.perf_counter() - start
+        return client, calls, elapsed / len(messages)
+
+    def test_replay(self):
+        for mock in ('MOCK-X1CMULTIAMS', 'MOCK-P1PNOAMS'):
+            with self.subTest(mock=mock):
+                ungated_client, ungated_calls, ungated_time = self.replay(mock, gated=False)
+                gated_client, gated_calls, gated_time = self.replay(mock, gated=True)
+
+                # Skipping data objects on incremental pushes must not change the resulting state.
+                for name in ("temperature", "speed", "stage", "hms", "home_flag", "print_fun", "extruder"):
+                    ungated_state = {k: v for k, v in vars(getattr(ungated_client._device, name)).items() if k != "_client"}
+                    gated_state = {k: v for k, v in vars(getattr(gated_client._device, name)).items() if k != "_client"}
+                    self.assertEqual(ungated_state, gated_state, name)
+
+                # Timings are informational only, the assertions are on the work skipped.
+                print(f"\n{mock}: {self.PUSH_COUNT + 1} messages. print_update calls of gated classes: "
+                      f"ungated={ungated_calls} gated={gated_calls}. Per message: ungated={ungated_time * 1e6:.0f}us "
+                      f"gated={gated_time * 1e6:.0f}us")
+                # Every gated class runs on the full push and on every incremental push without gating.
+                self.assertEqual(len(self.GATED_CLASSES) * (self.PUSH_COUNT + 1), ungated_calls)
+                # With gating the incremental pushes, which only carry temperatures, fans, progress and wifi signal,
+                # only reach Temperature. Every class still runs on the full push.
+                self.assertEqual(len(self.GATED_CLASSES) + self.PUSH_COUNT, gated_calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
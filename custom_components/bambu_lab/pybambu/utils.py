@@ -6,6 +6,12 @@ import math
 import requests
 import socket
 import re
+import threading
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from datetime import datetime, timedelta, timezone
 from urllib3.exceptions import ReadTimeoutError
@@ -138,7 +144,22 @@ def get_print_error_text(error_code: str, device_type: Printers | str, preferred
     """
     return _get_error_text("device_error", error_code, device_type, preferred_language)
 
-@functools.lru_cache(maxsize=8)
+# Process-wide error text indexes, keyed by locale. Each index maps error type -> error code ->
+# (default message, {device type: message}) so a lookup is a couple of dict gets.
+_error_text_indexes: dict[str, dict] = {}
+_error_text_lock = threading.Lock()
+
+def preload_error_text(preferred_language: str):
+    """
+    Load the error text indexes for a language and its fallbacks
+
+    This reads and decompresses the error text files, so call it from an executor rather
+    than the event loop. Lookups load any missing index on demand.
+    """
+    for locale_code in _get_error_locales(preferred_language):
+        _get_error_index(locale_code)
+
+@functools.lru_cache(maxsize=64)
 def _get_error_text(error_type: str, error_code: str, device_type: Printers | str, preferred_language: str) -> str:
     """
     Return the human-readable description for an error
@@ -150,27 +171,57 @@ def _get_error_text(error_type: str, error_code: str, device_type: Printers | st
     """
     LOGGER.debug(f"Looking up {error_type=} {error_code=} {device_type=} {preferred_language=}")
     error_code = error_code.replace("_", "")
+    device_type = str(device_type)
 
-    # Candidate locale(s) in priority order
-    locales = [preferred_language.lower()]
-    if len(preferred_language) > 2:
-        locales.append(preferred_language[:2].lower())
-    if preferred_language.lower() != "en":
-        locales.append("en")
-
-    for locale_code in locales:
-        error_data = _load_error_data(locale_code)
-        code_entry = error_data.get(error_type, {}).get(error_code)
+    for locale_code in _get_error_locales(preferred_language):
+        code_entry = _get_error_index(locale_code).get(error_type, {}).get(error_code)
         if not code_entry:
             continue
 
-        # Pick message matching device_type or default (empty list)
-        for msg, models in code_entry.items():
-            if not models or str(device_type) in models:
-                return msg
+        default_msg, device_msgs = code_entry
+        msg = device_msgs.get(device_type, default_msg)
+        if msg is not None:
+            return msg
 
     return 'unknown'
 
+def _get_error_locales(preferred_language: str) -> list[str]:
+    """Return the candidate locale(s) in priority order"""
+    locales = [preferred_language.lower()]
+    if len(preferred_language) > 2:
+        locales.append(preferred_language[:2].lower())
+    if preferred_language.lower() != "en":
+        locales.append("en")
+    return locales
+
+def _get_error_index(language: str) -> dict:
+    index = _error_text_indexes.get(language)
+    if index is None:
+        with _error_text_lock:
+            index = _error_text_indexes.get(language)
+            if index is None:
+                index = _build_error_index(_load_error_data(language))
+                _error_text_indexes[language] = index
+    return index
+
+def _build_error_index(error_data: dict) -> dict:
+    index = {}
+    for error_type, codes in error_data.items():
+        entries = index[error_type] = {}
+        for code, messages in codes.items():
+            # The first message that is either the default (empty list) or names the device
+            # type wins, so device-specific messages listed after the default are never used.
+            default_msg = None
+            device_msgs = {}
+            for msg, models in messages.items():
+                if not models:
+                    default_msg = msg
+                    break
+                for model in models:
+                    device_msgs.setdefault(model, msg)
+            entries[code] = (default_msg, device_msgs)
+    return index
+
 def _load_error_data(language: str) -> dict:
     filename = Path(__file__).parent / "hms_error_text" / f"hms_{language}.json.gz"
     if not filename.exists():
@@ -179,7 +230,7 @@ def _load_error_data(language: str) -> dict:
 
     with gzip.open(filename, "rt", encoding="utf-8") as f:
         return json.load(f)
-    
+
 def get_HMS_severity(code: int) -> str:
     uint_code = code >> 16
     if code > 0 and uint_code in HMS_SEVERITY_LEVELS:
@@ -385,6 +436,14 @@ def upgrade_template(url: str) -> dict:
 
 def safe_json_loads(raw_bytes):
 
+    # Use the faster parser when it's installed (it is in Home Assistant). It is stricter than json (e.g. about
+    # integers over 64 bits and NaN) so fall through to the standard parser on any failure.
+    if orjson is not None:
+        try:
+            return orjson.loads(raw_bytes)
+        except orjson.JSONDecodeError:
+            pass
+
     # First try to decode it normally for efficiency.
     try:
         json_data = json.loads(raw_bytes)
@@ -6,11 +6,8 @@ import asyncio
 from collections.abc import Awaitable, Callable
 from dataclasses import asdict, dataclass, field
 from datetime import timedelta
-import gzip
 import math
-import os
 import pathlib
-import shutil
 from typing import TYPE_CHECKING, Any
 
 from aiogithubapi import (
@@ -47,6 +44,7 @@ from .enums import (
     HacsGitHubRepo,
     HacsStage,
     LovelaceMode,
+    QueuePriority,
 )
 from .exceptions import (
     AddonRepositoryException,
@@ -60,6 +58,7 @@ from .exceptions import (
 )
 from .repositories import REPOSITORY_CLASSES
 from .repositories.base import HACS_MANIFEST_KEYS_TO_EXPORT, REPOSITORY_KEYS_TO_EXPORT
+from .utils.download import finalize_saved_file
 from .utils.file_system import async_exists
 from .utils.json import json_loads
 from .utils.logger import LOGGER
@@ -201,12 +200,37 @@ class HacsRepositories:
     _repositories_by_full_name: dict[str, HacsRepository] = field(default_factory=dict)
     _repositories_by_id: dict[str, HacsRepository] = field(default_factory=dict)
     _removed_repositories_by_full_name: dict[str, RemovedRepository] = field(default_factory=dict)
+    # Secondary indexes, kept in sync by register/unregister and by the data change listener.
+    # Dicts with None values are used as ordered sets to keep registration order.
+    _repositories_by_category: dict[str, dict[HacsRepository, None]] = field(default_factory=dict)
+    _indexed_category: dict[HacsRepository, str] = field(default_factory=dict)
+    _downloaded_repositories: dict[HacsRepository, None] = field(default_factory=dict)
 
     @property
     def list_all(self) -> list[HacsRepository]:
         """Return a list of repositories."""
         return list(self._repositories)
 
+    @property
+    def count(self) -> int:
+        """Return the number of registered repositories."""
+        return len(self._repositories)
+
+    def list_category(
+        self,
+        category: str,
+        downloaded: bool | None = None,
+    ) -> list[HacsRepository]:
+        """Return a list of repositories in a category, optionally filtered by downloaded state."""
+        repositories = self._repositories_by_category.get(category, ())
+        if downloaded is None:
+            return list(repositories)
+        return [
+            repository
+            for repository in repositories
+            if (repository in self._downloaded_repositories) == downloaded
+        ]
+
     @property
     def list_removed(self) -> list[RemovedRepository]:
         """Return a list of removed repositories."""
@@ -215,14 +239,34 @@ class HacsRepositories:
     @property
     def list_downloaded(self) -> list[HacsRepository]:
         """Return a list of downloaded repositories."""
-        return [repo for repo in self._repositories if repo.data.installed]
+        return list(self._downloaded_repositories)
 
     def category_downloaded(self, category: HacsCategory) -> bool:
         """Check if a given category has been downloaded."""
-        for repository in self.list_downloaded:
-            if repository.data.category == category:
-                return True
-        return False
+        return any(
+            repository.data.category == category for repository in self._downloaded_repositories
+        )
+
+    def _index(self, repository: HacsRepository) -> None:
+        """Update the secondary indexes for a registered repository."""
+        category = repository.data.category
+        indexed = self._indexed_category.get(repository)
+        if indexed != category:
+            if indexed is not None:
+                self._repositories_by_category[indexed].pop(repository, None)
+            self._repositories_by_category.setdefault(category, {})[repository] = None
+            self._indexed_category[repository] = category
+
+        if repository.data.installed:
+            self._downloaded_repositories.setdefault(repository, None)
+        else:
+            self._downloaded_repositories.pop(repository, None)
+
+    def _unindex(self, repository: HacsRepository) -> None:
+        """Remove a repository from the secondary indexes."""
+        if (indexed := self._indexed_category.pop(repository, None)) is not None:
+            self._repositories_by_category[indexed].pop(repository, None)
+        self._downloaded_repositories.pop(repository, None)
 
     def register(self, repository: HacsRepository, default: bool = False) -> None:
         """Register a repository."""
@@ -246,6 +290,10 @@ class HacsRepositories:
 
         self._repositories_by_id[repo_id] = repository
         self._repositories_by_full_name[repository.data.full_name_lower] = repository
+        self._index(repository)
+        repository.data.set_change_listener(
+            lambda name: self._index(repository) if name in ("category", "installed") else None
+        )
 
         if default:
             self.mark_default(repository)
@@ -266,6 +314,8 @@ class HacsRepositories:
         if repository in self._repositories:
             self._repositories.remove(repository)
 
+        repository.data.set_change_listener(None)
+        self._unindex(repository)
         self._repositories_by_id.pop(repo_id, None)
         self._repositories_by_full_name.pop(repository.data.full_name_lower, None)
 
@@ -440,21 +490,7 @@ class HacsBase:
             ) as file_handler:
                 file_handler.write(content)
 
-            # Create gz for .js files
-            if os.path.isfile(file_path):
-                if file_path.endswith(".js"):
-                    with open(file_path, "rb") as f_in:
-                        with gzip.open(file_path + ".gz", "wb") as f_out:
-                            shutil.copyfileobj(f_in, f_out)
-
-            # LEGACY! Remove with 2.0
-            if "themes" in file_path and file_path.endswith(".yaml"):
-                filename = file_path.split("/")[-1]
-                base = file_path.split("/themes/")[0]
-                combined = f"{base}/themes/{filename}"
-                if os.path.exists(combined):
-                    self.log.info("Removing old theme file %s", combined)
-                    os.remove(combined)
+            finalize_saved_file(file_path)
 
         try:
             await self.hass.async_add_executor_job(_write_file)
@@ -801,7 +837,11 @@ class HacsBase:
                 repository = self.repositories.get_by_full_name(HacsGitHubRepo.INTEGRATION)
             elif not self.status.startup:
                 self.log.error("Scheduling update of hacs/integration")
-                self.queue.add(repository.common_update())
+                self.queue.add(
+                    repository.common_update(),
+                    priority=QueuePriority.HIGH,
+                    key=("update", repository.data.full_name),
+                )
             if repository is None:
                 raise HacsException("Unknown error")
 
@@ -840,7 +880,9 @@ class HacsBase:
         """Update all category repositories."""
         self.log.debug("Fetching updated content for %s", category)
         try:
-            category_data = await self.data_client.get_data(category, validate=True)
+            category_data, changed = await self.data_client.get_repository_data(
+                category, lambda repo_id: self.repositories.is_registered(repository_id=repo_id)
+            )
         except HacsNotModifiedException:
             self.log.debug("No updates for %s", category)
             return
@@ -861,6 +903,8 @@ class HacsBase:
             if repository := self.repositories.get_by_full_name(repo_name):
                 self.repositories.set_repository_id(repository, repo_id)
                 self.repositories.mark_default(repository)
+                if repo_id not in changed:
+                    continue
                 if repository.data.last_fetched is None or (
                     repository.data.last_fetched.timestamp() < repo_data["last_fetched"]
                 ):
@@ -874,12 +918,8 @@ class HacsBase:
             self.status.inital_fetch_done = True
 
         if self.stage == HacsStage.STARTUP:
-            for repository in self.repositories.list_all:
-                if (
-                    repository.data.category == category
-                    and not repository.data.installed
-                    and not self.repositories.is_default(repository.data.id)
-                ):
+            for repository in self.repositories.list_category(category, downloaded=False):
+                if not self.repositories.is_default(repository.data.id):
                     repository.logger.debug(
                         "%s Unregister stale custom repository", repository.string
                     )
@@ -912,25 +952,21 @@ class HacsBase:
             self.log.debug("Queue is already running")
             return
 
-        async def _handle_queue():
-            if not self.queue.has_pending_tasks:
-                await self.data.async_write()
-                return
+        while self.queue.has_pending_tasks:
             can_update = await self.async_can_update()
             self.log.debug(
                 "Can update %s repositories, items in queue %s",
                 can_update,
-                self.queue.pending_tasks,
+                self.queue.as_dict()["pending"],
             )
-            if can_update != 0:
-                try:
-                    await self.queue.execute(can_update)
-                except HacsExecutionStillInProgress:
-                    return
-
-                await _handle_queue()
+            if can_update == 0:
+                return
+            try:
+                await self.queue.execute(can_update)
+            except HacsExecutionStillInProgress:
+                return
 
-        await _handle_queue()
+        await self.data.async_write()
 
     async def async_handle_removed_repositories(self, _=None) -> None:
         """Handle removed repositories."""
@@ -1005,8 +1041,10 @@ class HacsBase:
                 repository.data.category in self.common.categories
                 and not self.repositories.is_default(repository.data.id)
             ):
-                repositories_to_update += 1
-                self.queue.add(update_repository(repository))
+                if self.queue.add(
+                    update_repository(repository), key=("update", repository.data.full_name)
+                ):
+                    repositories_to_update += 1
 
         async def update_coordinators() -> None:
             """Update all coordinators."""
@@ -1068,7 +1106,7 @@ class HacsBase:
                     was_installed = True
                     stored["acknowledged"] = False
                     # Remove from HACS
-                    critical_queue.add(repo.uninstall())
+                    critical_queue.add(repo.uninstall(), priority=QueuePriority.CRITICAL)
                     repo.remove()
 
             stored_critical.append(stored)
@@ -17,6 +17,7 @@ PACKAGE_NAME = "custom_components.hacs"
 
 DEFAULT_CONCURRENT_TASKS = 15
 DEFAULT_CONCURRENT_BACKOFF_TIME = 1
+DEFAULT_CONCURRENT_DOWNLOADS = 10
 
 HACS_REPOSITORY_ID = "172733314"
 
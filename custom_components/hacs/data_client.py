@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 from typing import Any
 
 from aiohttp import ClientSession, ClientTimeout
@@ -10,6 +11,7 @@ import voluptuous as vol
 
 from .exceptions import HacsException, HacsNotModifiedException
 from .utils.logger import LOGGER
+from .utils.store import get_content_hash
 from .utils.validate import (
     VALIDATE_FETCHED_V2_CRITICAL_REPO_SCHEMA,
     VALIDATE_FETCHED_V2_REMOVED_REPO_SCHEMA,
@@ -30,6 +32,30 @@ class HacsDataClient:
         self._client_name = client_name
         self._etags = {}
         self._session = session
+        # Content hash and full name of each valid repository entry by category,
+        # persisted with the ETag so unchanged entries are skipped across restarts.
+        self._entry_hashes: dict[str, dict[str, tuple[str, str]]] = {}
+        self._fetched: set[str] = set()
+        self.changed = False
+
+    def restore(self, stored: dict[str, Any]) -> None:
+        """Restore ETags and entry hashes of repository data."""
+        for section, section_data in stored.get("repositories", {}).items():
+            if section not in VALIDATE_FETCHED_V2_REPO_DATA or not section_data.get("etag"):
+                continue
+            self._etags[f"{section}/data.json"] = section_data["etag"]
+            self._entry_hashes[section] = {
+                key: tuple(entry) for key, entry in section_data.get("entries", {}).items()
+            }
+
+    def to_store(self) -> dict[str, Any]:
+        """Return ETags and entry hashes of repository data to store."""
+        return {
+            "repositories": {
+                section: {"etag": self._etags.get(f"{section}/data.json"), "entries": entries}
+                for section, entries in self._entry_hashes.items()
+            }
+        }
 
     async def _do_request(
         self,
@@ -57,7 +83,10 @@ class HacsDataClient:
         except Exception as exception:
             raise HacsException(f"Error fetching data from HACS: {exception}") from exception
 
-        self._etags[endpoint] = response.headers.get("etag")
+        etag = response.headers.get("etag")
+        if self._etags.get(endpoint) != etag:
+            self._etags[endpoint] = etag
+            self.changed = True
 
         return await response.json()
 
@@ -93,6 +122,60 @@ class HacsDataClient:
 
         return validated
 
+    async def get_repository_data(
+        self,
+        section: str,
+        is_registered: Callable[[str], bool],
+    ) -> tuple[dict[str, dict[str, Any]], set[str]]:
+        """Get repository data for a category and the IDs of entries that changed.
+
+        Entries that are unchanged since they were last fetched, possibly in an
+        earlier run, are not validated again. They were applied when they changed,
+        so only their full name is guaranteed to be present.
+        """
+        endpoint = f"{section}/data.json"
+        try:
+            data = await self._do_request(filename="data.json", section=section)
+        except HacsNotModifiedException:
+            if section in self._fetched:
+                raise
+            # Not modified since the ETag stored by an earlier run.
+            self._fetched.add(section)
+            entries = self._entry_hashes.get(section, {})
+            if entries and all(is_registered(key) for key in entries):
+                return {key: {"full_name": entry[1]} for key, entry in entries.items()}, set()
+            # Repositories are missing that we no longer have the data for.
+            self._etags.pop(endpoint, None)
+            data = await self._do_request(filename="data.json", section=section)
+
+        self._fetched.add(section)
+        previous = self._entry_hashes.get(section, {})
+        validator = VALIDATE_FETCHED_V2_REPO_DATA[section]
+        hashes = {}
+        changed = set()
+        validated = {}
+
+        for key, repo_data in data.items():
+            entry_hash = get_content_hash(repo_data)
+            if (entry := previous.get(key)) is not None and entry[0] == entry_hash and is_registered(key):
+                hashes[key] = entry
+                validated[key] = repo_data
+                continue
+            try:
+                validated[key] = validator(repo_data)
+            except vol.Invalid as exception:
+                LOGGER.info(
+                    "Got invalid data for %s (%s)", repo_data.get("full_name", key), exception
+                )
+                continue
+            hashes[key] = (entry_hash, validated[key]["full_name"])
+            changed.add(key)
+
+        self._entry_hashes[section] = hashes
+        self.changed = self.changed or bool(changed) or len(hashes) != len(previous)
+        LOGGER.debug("%s of %s entries changed for %s", len(changed), len(validated), section)
+        return validated, changed
+
     async def get_repositories(self, section: str) -> list[str]:
         """Get repositories."""
         return await self._do_request(filename="repositories.json", section=section)
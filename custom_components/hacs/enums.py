@@ -1,7 +1,7 @@
 """Helper constants."""
 
 # pylint: disable=missing-class-docstring
-from enum import StrEnum
+from enum import IntEnum, StrEnum
 
 
 class HacsGitHubRepo(StrEnum):
@@ -38,6 +38,15 @@ class HacsDispatchEvent(StrEnum):
     STATUS = "hacs_dispatch_status"
 
 
+class QueuePriority(IntEnum):
+    """Priority of queued tasks, lower runs first."""
+
+    CRITICAL = 0
+    USER = 1
+    HIGH = 2
+    BACKGROUND = 3
+
+
 class RepositoryFile(StrEnum):
     """Repository file names."""
 
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from asyncio import sleep
+from collections.abc import Callable
 from datetime import UTC, datetime
 import os
-import pathlib
 import shutil
 import tempfile
 from typing import TYPE_CHECKING, Any
@@ -18,6 +18,7 @@ from aiogithubapi import (
 )
 from aiogithubapi.objects.repository import AIOGitHubAPIRepository
 import attr
+from homeassistant.core import callback
 from homeassistant.helpers import device_registry as dr, issue_registry as ir
 
 from ..const import DOMAIN
@@ -32,13 +33,13 @@ from ..types import DownloadableContent
 from ..utils.backup import Backup
 from ..utils.decode import decode_content
 from ..utils.decorator import concurrent
+from ..utils.download import ContentDownloader, DownloadRequest, DownloadStats
 from ..utils.file_system import async_exists, async_remove, async_remove_directory
 from ..utils.filters import filter_content_return_one_of_type
 from ..utils.github_graphql_query import GET_REPOSITORY_RELEASES
 from ..utils.json import json_loads
 from ..utils.logger import LOGGER
 from ..utils.path import is_safe
-from ..utils.queue_manager import QueueManager
 from ..utils.store import async_remove_store
 from ..utils.url import github_archive, github_release_asset
 from ..utils.validate import Validate
@@ -136,9 +137,12 @@ class FileInformation:
         self.name = name
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class RepositoryData:
-    """RepositoryData class."""
+    """RepositoryData class.
+
+    Slotted, as one is kept for every repository HACS knows about.
+    """
 
     archived: bool = False
     authors: list[str] = []
@@ -174,6 +178,29 @@ class RepositoryData:
     stargazers_count: int = 0
     topics: list[str] = []
 
+    # Set by the repository classes as the registry key, not persisted.
+    full_name_lower: str = attr.ib(default="", init=False, eq=False, repr=False)
+
+    # Bumped on every change so consumers can tell when data they derived from it is stale.
+    revision: int = attr.ib(init=False, eq=False, repr=False)
+    _change_listener: Callable[[str], None] | None = attr.ib(init=False, eq=False, repr=False)
+
+    def __attrs_pre_init__(self) -> None:
+        """Set the bookkeeping attributes before the fields."""
+        object.__setattr__(self, "revision", 0)
+        object.__setattr__(self, "_change_listener", None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute and bump the revision."""
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "revision", self.revision + 1)
+        if self._change_listener is not None:
+            self._change_listener(name)
+
+    def set_change_listener(self, listener: Callable[[str], None] | None) -> None:
+        """Set a callback called with the attribute name when an attribute changes."""
+        object.__setattr__(self, "_change_listener", listener)
+
     @property
     def name(self):
         """Return the name."""
@@ -183,7 +210,9 @@ class RepositoryData:
 
     def to_json(self):
         """Export to json."""
-        return attr.asdict(self, filter=lambda attr, value: attr.name != "last_fetched")
+        return attr.asdict(
+            self, filter=lambda attr, value: attr.init and attr.name != "last_fetched"
+        )
 
     @staticmethod
     def create_from_dict(source: dict, action: bool = False) -> RepositoryData:
@@ -195,7 +224,7 @@ class RepositoryData:
     def update_data(self, data: dict, action: bool = False) -> None:
         """Update data of the repository."""
         for key, value in data.items():
-            if key not in self.__dict__:
+            if key not in REPOSITORY_DATA_FIELDS:
                 continue
 
             if key == "last_fetched" and isinstance(value, float):
@@ -214,7 +243,7 @@ class RepositoryData:
                 setattr(self, key, value)
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class HacsManifest:
     """HacsManifest class."""
 
@@ -244,20 +273,20 @@ class HacsManifest:
         manifest_data.manifest = {
             k: v
             for k, v in manifest.items()
-            if k in manifest_data.__dict__ and v != manifest_data.__getattribute__(k)
+            if k in HACS_MANIFEST_FIELDS and v != manifest_data.__getattribute__(k)
         }
 
         for key, value in manifest_data.manifest.items():
             if key == "country" and isinstance(value, str):
                 setattr(manifest_data, key, [value])
-            elif key in manifest_data.__dict__:
+            elif key in HACS_MANIFEST_FIELDS:
                 setattr(manifest_data, key, value)
         return manifest_data
 
     def update_data(self, data: dict) -> None:
         """Update the manifest data."""
         for key, value in data.items():
-            if key not in self.__dict__:
+            if key not in HACS_MANIFEST_FIELDS:
                 continue
 
             if key == "country":
@@ -269,6 +298,10 @@ class HacsManifest:
                 setattr(self, key, value)
 
 
+REPOSITORY_DATA_FIELDS = frozenset(field.name for field in attr.fields(RepositoryData) if field.init)
+HACS_MANIFEST_FIELDS = frozenset(field.name for field in attr.fields(HacsManifest))
+
+
 class RepositoryReleases:
     """RepositoyReleases."""
 
@@ -319,6 +352,7 @@ class HacsRepository:
         self.treefiles = []
         self.ref = None
         self.logger = LOGGER
+        self.download_stats: DownloadStats | None = None
 
     def __str__(self) -> str:
         """Return a string representation of the repository."""
@@ -645,15 +679,47 @@ class HacsRepository:
         if not contents:
             raise HacsException("No content to download")
 
-        download_queue = QueueManager(hass=self.hacs.hass)
+        requests = [
+            DownloadRequest(
+                # Trees fetched for a "tags/<version>" ref link to raw URLs that must not contain "tags/".
+                url=content.download_url.replace("tags/", ""),
+                local_path=self.local_file_path_for_content(content),
+                name=content.name,
+            )
+            for content in contents
+            if not (
+                self.repository_manifest.content_in_root
+                and self.repository_manifest.filename
+                and content.name != self.repository_manifest.filename
+            )
+        ]
 
-        for content in contents:
-            if self.repository_manifest.content_in_root and self.repository_manifest.filename:
-                if content.name != self.repository_manifest.filename:
-                    continue
-            download_queue.add(self.dowload_repository_content(content))
+        @callback
+        def _async_progress(stats: DownloadStats) -> None:
+            """Report download progress between the 50% and 70% install steps."""
+            self.hacs.async_dispatch(
+                HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
+                {
+                    "repository": self.data.full_name,
+                    "progress": 50 + 20 * (stats.completed + stats.failed) // stats.files,
+                    "stats": stats.as_dict(),
+                },
+            )
 
-        await download_queue.execute()
+        downloader = ContentDownloader(
+            self.hacs.hass, self.hacs.session, on_progress=_async_progress
+        )
+        self.validate.errors.extend(await downloader.async_download(requests))
+        self.download_stats = downloader.stats
+        self.logger.info(
+            "%s Downloaded %s of %s files (%s bytes) in %.2fs (%.0f bytes/s)",
+            self.string,
+            downloader.stats.completed,
+            downloader.stats.files,
+            downloader.stats.bytes,
+            downloader.stats.elapsed,
+            downloader.stats.throughput,
+        )
 
     async def download_repository_zip(self):
         """Download the zip archive of the repository."""
@@ -1248,48 +1314,22 @@ class HacsRepository:
             for asset in release.data.get("assets", [])
         ]
 
-    @concurrent(concurrenttasks=10)
-    async def dowload_repository_content(self, content: FileInformation) -> None:
-        """Download content."""
-        try:
-            self.logger.debug("%s Downloading %s", self.string, content.name)
-
-            filecontent = await self.hacs.async_download_file(content.download_url)
-
-            if filecontent is None:
-                self.validate.errors.append(f"[{content.name}] was not downloaded.")
-                return
-
-            # Save the content of the file.
-            if self.content.single or content.path is None:
-                local_directory = self.content.path.local
-
-            else:
-                _content_path = content.path
-                if not self.repository_manifest.content_in_root:
-                    _content_path = _content_path.replace(f"{self.content.path.remote}", "")
+    def local_file_path_for_content(self, content: FileInformation) -> str:
+        """Return the local path to download content to."""
+        if self.content.single or content.path is None:
+            local_directory = self.content.path.local
 
-                local_directory = f"{self.content.path.local}/{_content_path}"
-                local_directory = local_directory.split("/")
-                del local_directory[-1]
-                local_directory = "/".join(local_directory)
-
-            # Check local directory
-            pathlib.Path(local_directory).mkdir(parents=True, exist_ok=True)
-
-            local_file_path = (f"{local_directory}/{content.name}").replace("//", "/")
+        else:
+            _content_path = content.path
+            if not self.repository_manifest.content_in_root:
+                _content_path = _content_path.replace(f"{self.content.path.remote}", "")
 
-            result = await self.hacs.async_save_file(local_file_path, filecontent)
-            if result:
-                self.logger.info("%s Download of %s completed", self.string, content.name)
-                return
-            self.validate.errors.append(f"[{content.name}] was not downloaded.")
+            local_directory = f"{self.content.path.local}/{_content_path}"
+            local_directory = local_directory.split("/")
+            del local_directory[-1]
+            local_directory = "/".join(local_directory)
 
-        except (
-            # lgtm [py/catch-base-exception] pylint: disable=broad-except
-            BaseException
-        ) as exception:
-            self.validate.errors.append(f"Download was not completed [{exception}]")
+        return (f"{local_directory}/{content.name}").replace("//", "/")
 
     async def async_remove_entity_device(self) -> None:
         """Remove the entity device."""
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, NamedTuple
 
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
@@ -12,6 +12,7 @@ from homeassistant.exceptions import HomeAssistantError
 from ..base import HacsBase
 from ..const import HACS_REPOSITORY_ID
 from ..enums import HacsDisabledReason, HacsDispatchEvent
+from ..exceptions import HacsException
 from ..repositories.base import TOPIC_FILTER, HacsManifest, HacsRepository
 from .logger import LOGGER
 from .path import is_safe
@@ -55,6 +56,16 @@ EXPORTED_DOWNLOADED_REPOSITORY_DATA = EXPORTED_REPOSITORY_DATA + (
 )
 
 
+class ExportedRepository(NamedTuple):
+    """The stored data of a repository as of its last export."""
+
+    data: dict[str, Any]
+    category: str
+    experimental_data: dict[str, Any]
+    manifest: HacsManifest
+    revision: int
+
+
 class HacsData:
     """HacsData class."""
 
@@ -62,7 +73,11 @@ class HacsData:
         """Initialize."""
         self.logger = LOGGER
         self.hacs = hacs
-        self.content = {}
+        # Exported store entries by repository ID, kept between writes so only
+        # repositories that changed since the last write need to be exported again.
+        self._exported: dict[str, ExportedRepository] = {}
+        # Repository IDs that were exported or removed since the last write.
+        self._journal: set[str] = set()
 
     async def async_force_write(self, _=None):
         """Force write."""
@@ -85,34 +100,89 @@ class HacsData:
                 "ignored_repositories": self.hacs.common.ignored_repositories,
             },
         )
-        await self._async_store_experimental_content_and_repos()
-        await self._async_store_content_and_repos()
 
-    async def _async_store_content_and_repos(self, _=None):  # bb: ignore
-        """Store the main repos file and each repo that is out of date."""
-        # Repositories
-        self.content = {}
-        for repository in self.hacs.repositories.list_all:
-            if repository.data.category in self.hacs.common.categories:
-                self.async_store_repository_data(repository)
+        self.async_export_changed_repositories()
+        if self._journal or force:
+            self.logger.debug(
+                "<HacsData async_write> %s repositories changed since the last write",
+                len(self._journal),
+            )
+            journal, self._journal = self._journal, set()
+            try:
+                await self._async_store_experimental_content_and_repos()
+                await self._async_store_content_and_repos()
+            except BaseException:
+                self._journal |= journal
+                raise
+
+        # Stored after the repositories so entries are never marked as applied before they are stored.
+        if (data_client := self.hacs.data_client) is not None and data_client.changed:
+            await async_save_to_store(
+                self.hacs.hass, "data_client", data_client.to_store(), changed=True
+            )
+            data_client.changed = False
 
-        await async_save_to_store(self.hacs.hass, "repositories", self.content)
         for event in (HacsDispatchEvent.REPOSITORY, HacsDispatchEvent.CONFIG):
             self.hacs.async_dispatch(event, {})
 
-    async def _async_store_experimental_content_and_repos(self, _=None):
-        """Store the main repos file and each repo that is out of date."""
-        # Repositories
-        self.content = {}
+    @callback
+    def async_export_changed_repositories(self) -> None:
+        """Export the repositories that changed since they were last exported."""
+        exported = self._exported
+        current = set()
         for repository in self.hacs.repositories.list_all:
-            if repository.data.category in self.hacs.common.categories:
-                self.async_store_experimental_repository_data(repository)
+            if repository.data.category not in self.hacs.common.categories:
+                continue
+            repository_id = str(repository.data.id)
+            if repository_id == "0":
+                continue
+            current.add(repository_id)
+            previous = exported.get(repository_id)
+            if (
+                previous is not None
+                and previous.revision == repository.data.revision
+                and previous.manifest is repository.repository_manifest
+            ):
+                continue
 
-        await async_save_to_store(self.hacs.hass, "data", {"repositories": self.content})
+            entry = ExportedRepository(
+                self.async_store_repository_data(repository),
+                repository.data.category,
+                self.async_store_experimental_repository_data(repository),
+                repository.repository_manifest,
+                repository.data.revision,
+            )
+            exported[repository_id] = entry
+            if previous is None or previous[:3] != entry[:3]:
+                self._journal.add(repository_id)
+
+        if len(current) != len(exported):
+            for repository_id in exported.keys() - current:
+                exported.pop(repository_id)
+                self._journal.add(repository_id)
+
+    async def _async_store_content_and_repos(self, _=None):  # bb: ignore
+        """Store the main repos file."""
+        await async_save_to_store(
+            self.hacs.hass,
+            "repositories",
+            {repository_id: entry.data for repository_id, entry in self._exported.items()},
+            changed=True,
+        )
+
+    async def _async_store_experimental_content_and_repos(self, _=None):
+        """Store the experimental repos file."""
+        content = {}
+        for entry in self._exported.values():
+            content.setdefault(entry.category, []).append(entry.experimental_data)
+
+        await async_save_to_store(
+            self.hacs.hass, "data", {"repositories": content}, changed=True
+        )
 
     @callback
     def async_store_repository_data(self, repository: HacsRepository) -> dict:
-        """Store the repository data."""
+        """Return the repository data to store."""
         data = {"repository_manifest": repository.repository_manifest.manifest}
 
         for key, default in (
@@ -128,13 +198,12 @@ class HacsData:
         if repository.data.last_fetched:
             data["last_fetched"] = repository.data.last_fetched.timestamp()
 
-        self.content[str(repository.data.id)] = data
+        return data
 
     @callback
-    def async_store_experimental_repository_data(self, repository: HacsRepository) -> None:
-        """Store the experimental repository data for non downloaded repositories."""
+    def async_store_experimental_repository_data(self, repository: HacsRepository) -> dict:
+        """Return the experimental repository data to store."""
         data = {}
-        self.content.setdefault(repository.data.category, [])
 
         if repository.data.installed:
             data["repository_manifest"] = repository.repository_manifest.manifest
@@ -151,7 +220,7 @@ class HacsData:
                 if (value := getattr(repository.data, key, default)) != default:
                     data[key] = value
 
-        self.content[repository.data.category].append({"id": str(repository.data.id), **data})
+        return {"id": str(repository.data.id), **data}
 
     async def restore(self):
         """Restore saved data."""
@@ -180,6 +249,15 @@ class HacsData:
             self.hacs.disable_hacs(HacsDisabledReason.RESTORE)
             return False
 
+        if self.hacs.data_client is not None:
+            try:
+                self.hacs.data_client.restore(
+                    await async_load_from_store(self.hacs.hass, "data_client")
+                )
+            except HacsException:
+                # Everything is fetched and validated again
+                pass
+
         if not hacs and not repositories:
             # Assume new install
             self.hacs.status.new = True
@@ -0,0 +1,227 @@
+"""Download repository content."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import gzip
+import os
+import shutil
+import tempfile
+import time
+from typing import TYPE_CHECKING
+
+from aiohttp import ClientSession, ClientTimeout
+
+from ..const import DEFAULT_CONCURRENT_DOWNLOADS
+from ..exceptions import HacsException
+from .logger import LOGGER
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+CHUNK_SIZE = 64 * 1024
+# Chunks are collected up to this size before they are handed to the executor to write.
+WRITE_BUFFER_SIZE = 1024 * 1024
+DOWNLOAD_TIMEOUT = 60
+DOWNLOAD_ATTEMPTS = 5
+
+# Shared by all repositories so concurrent installs don't multiply the connections to GitHub.
+_DOWNLOAD_SLOTS = asyncio.Semaphore(DEFAULT_CONCURRENT_DOWNLOADS)
+
+
+@dataclass
+class DownloadStats:
+    """Progress and throughput of a set of downloads."""
+
+    files: int = 0
+    completed: int = 0
+    failed: int = 0
+    bytes: int = 0
+    started: float = field(default_factory=time.monotonic)
+    finished: float | None = None
+
+    @property
+    def elapsed(self) -> float:
+        """Return the seconds spent downloading."""
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Return the bytes downloaded per second."""
+        if (elapsed := self.elapsed) <= 0:
+            return 0.0
+        return self.bytes / elapsed
+
+    def as_dict(self) -> dict[str, float | int]:
+        """Return the stats as a dict."""
+        return {
+            "files": self.files,
+            "completed": self.completed,
+            "failed": self.failed,
+            "bytes": self.bytes,
+            "elapsed": round(self.elapsed, 3),
+            "throughput": round(self.throughput),
+        }
+
+
+@dataclass
+class DownloadRequest:
+    """A file to download."""
+
+    url: str
+    local_path: str
+    name: str
+
+
+def finalize_saved_file(file_path: str) -> None:
+    """Create the companion files HACS keeps next to a saved file."""
+    # Create gz for .js files
+    if file_path.endswith(".js") and os.path.isfile(file_path):
+        with open(file_path, "rb") as f_in:
+            with gzip.open(file_path + ".gz", "wb") as f_out:
+                shutil.copyfileobj(f_in, f_out)
+
+    # LEGACY! Remove with 2.0
+    if "themes" in file_path and file_path.endswith(".yaml"):
+        filename = file_path.split("/")[-1]
+        base = file_path.split("/themes/")[0]
+        combined = f"{base}/themes/{filename}"
+        if os.path.exists(combined):
+            LOGGER.info("Removing old theme file %s", combined)
+            os.remove(combined)
+
+
+class ContentDownloader:
+    """Download files in parallel, streaming each to a temporary file that is renamed into place."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        session: ClientSession,
+        *,
+        on_progress: Callable[[DownloadStats], None] | None = None,
+        slots: asyncio.Semaphore | None = None,
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.session = session
+        self.stats = DownloadStats()
+        self._on_progress = on_progress
+        self._slots = slots or _DOWNLOAD_SLOTS
+
+    async def async_download(self, requests: list[DownloadRequest]) -> list[str]:
+        """Download the files and return a list of errors."""
+        self.stats = DownloadStats(files=len(requests))
+
+        # Create every target directory in a single executor job up front.
+        directories = {os.path.dirname(request.local_path) for request in requests}
+        await self.hass.async_add_executor_job(_make_directories, directories)
+
+        results = await asyncio.gather(
+            *(self._async_download_file(request) for request in requests),
+            return_exceptions=True,
+        )
+        self.stats.finished = time.monotonic()
+
+        errors = []
+        for request, result in zip(requests, results, strict=True):
+            if isinstance(result, BaseException):
+                errors.append(f"[{request.name}] was not downloaded. {result}")
+        return errors
+
+    async def _async_download_file(self, request: DownloadRequest) -> None:
+        """Download a file, retrying on timeouts."""
+        async with self._slots:
+            LOGGER.debug("Downloading %s", request.url)
+            for attempt in range(1, DOWNLOAD_ATTEMPTS + 1):
+                try:
+                    size = await self._async_stream_to_file(request)
+                except TimeoutError:
+                    LOGGER.warning(
+                        "A timeout of %s seconds was encountered while downloading %s, "
+                        "tries left %s",
+                        DOWNLOAD_TIMEOUT,
+                        request.url,
+                        DOWNLOAD_ATTEMPTS - attempt,
+                    )
+                    if attempt == DOWNLOAD_ATTEMPTS:
+                        self._async_failed()
+                        raise HacsException("Timed out") from None
+                    await asyncio.sleep(1)
+                except BaseException:
+                    self._async_failed()
+                    raise
+                else:
+                    self.stats.completed += 1
+                    LOGGER.info("Download of %s completed (%s bytes)", request.name, size)
+                    self._async_progress()
+                    return
+
+    async def _async_stream_to_file(self, request: DownloadRequest) -> int:
+        """Stream a download to a temporary file and rename it into place."""
+        async with self.session.get(
+            request.url, timeout=ClientTimeout(total=DOWNLOAD_TIMEOUT)
+        ) as response:
+            if response.status != 200:
+                raise HacsException(f"Got status code {response.status} when trying to download")
+
+            handle, temp_path = await self.hass.async_add_executor_job(
+                _open_temp_file, request.local_path
+            )
+            size = 0
+            try:
+                buffer = bytearray()
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    buffer += chunk
+                    if len(buffer) >= WRITE_BUFFER_SIZE:
+                        await self.hass.async_add_executor_job(handle.write, bytes(buffer))
+                        size += len(buffer)
+                        self.stats.bytes += len(buffer)
+                        buffer.clear()
+                if buffer:
+                    await self.hass.async_add_executor_job(handle.write, bytes(buffer))
+                    size += len(buffer)
+                    self.stats.bytes += len(buffer)
+                await self.hass.async_add_executor_job(
+                    _commit_temp_file, handle, temp_path, request.local_path
+                )
+            except BaseException:
+                self.stats.bytes -= size
+                await self.hass.async_add_executor_job(_discard_temp_file, handle, temp_path)
+                raise
+        return size
+
+    def _async_failed(self) -> None:
+        self.stats.failed += 1
+        self._async_progress()
+
+    def _async_progress(self) -> None:
+        if self._on_progress is not None:
+            self._on_progress(self.stats)
+
+
+def _make_directories(directories: set[str]) -> None:
+    for directory in directories:
+        os.makedirs(directory, exist_ok=True)
+
+
+def _open_temp_file(local_path: str):
+    directory, name = os.path.split(local_path)
+    descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+    return os.fdopen(descriptor, "wb"), temp_path
+
+
+def _commit_temp_file(handle, temp_path: str, local_path: str) -> None:
+    handle.close()
+    # mkstemp creates the file readable by the owner only.
+    os.chmod(temp_path, 0o644)
+    os.replace(temp_path, local_path)
+    finalize_saved_file(local_path)
+
+
+def _discard_temp_file(handle, temp_path: str) -> None:
+    handle.close()
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
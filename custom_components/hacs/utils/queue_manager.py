@@ -3,74 +3,213 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Coroutine
+from collections.abc import Coroutine, Hashable
+from dataclasses import dataclass, field
+import heapq
+import itertools
+import math
 import time
+from typing import Any
 
 from homeassistant.core import HomeAssistant
 
+from ..const import DEFAULT_CONCURRENT_TASKS
+from ..enums import QueuePriority
 from ..exceptions import HacsExecutionStillInProgress
 from .logger import LOGGER
 
 _LOGGER = LOGGER
 
+# Background tasks may only spend this share of a rate limit budget,
+# the rest is kept for higher priority tasks queued while they run.
+BACKGROUND_BUDGET_SHARE = 0.8
+
+
+@dataclass(order=True)
+class QueueEntry:
+    """A task waiting in the queue."""
+
+    priority: QueuePriority
+    sequence: int
+    task: Coroutine = field(compare=False)
+    key: Hashable | None = field(default=None, compare=False)
+    queued: float = field(default_factory=time.monotonic, compare=False)
+    cancelled: bool = field(default=False, compare=False)
+
+
+@dataclass
+class QueueMetrics:
+    """Counters for the queue."""
+
+    executed: int = 0
+    failed: int = 0
+    deduplicated: int = 0
+    last_wait_average: float = 0.0
+    last_wait_max: float = 0.0
+    last_duration: float = 0.0
+
 
 class QueueManager:
-    """The QueueManager class."""
+    """The QueueManager class.
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    Tasks run in priority order with bounded concurrency. Tasks added with a key
+    replace a pending task with the same key, keeping the higher priority.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_concurrent: int = DEFAULT_CONCURRENT_TASKS) -> None:
         self.hass = hass
-        self.queue: list[Coroutine] = []
+        self.max_concurrent = max_concurrent
+        self.metrics = QueueMetrics()
         self.running = False
+        self._heap: list[QueueEntry] = []
+        self._by_key: dict[Hashable, QueueEntry] = {}
+        self._pending = 0
+        self._sequence = itertools.count()
+
+    @property
+    def queue(self) -> list[Coroutine]:
+        """Return the pending tasks in the order they will run."""
+        return [entry.task for entry in sorted(self._heap) if not entry.cancelled]
 
     @property
     def pending_tasks(self) -> int:
         """Return a count of pending tasks in the queue."""
-        return len(self.queue)
+        return self._pending
 
     @property
     def has_pending_tasks(self) -> bool:
         """Return a count of pending tasks in the queue."""
         return self.pending_tasks != 0
 
+    @property
+    def pending_by_priority(self) -> dict[str, int]:
+        """Return a count of pending tasks for each priority."""
+        depth = {priority.name.lower(): 0 for priority in QueuePriority}
+        for entry in self._heap:
+            if not entry.cancelled:
+                depth[entry.priority.name.lower()] += 1
+        return depth
+
+    @property
+    def oldest_wait(self) -> float:
+        """Return the seconds the oldest pending task has been waiting."""
+        queued = [entry.queued for entry in self._heap if not entry.cancelled]
+        return time.monotonic() - min(queued) if queued else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the queue metrics."""
+        return {
+            "pending": self.pending_by_priority,
+            "oldest_wait": round(self.oldest_wait, 3),
+            "running": self.running,
+            "executed": self.metrics.executed,
+            "failed": self.metrics.failed,
+            "deduplicated": self.metrics.deduplicated,
+            "last_wait_average": round(self.metrics.last_wait_average, 3),
+            "last_wait_max": round(self.metrics.last_wait_max, 3),
+            "last_duration": round(self.metrics.last_duration, 3),
+        }
+
     def clear(self) -> None:
         """Clear the queue."""
-        self.queue = []
-
-    def add(self, task: Coroutine) -> None:
-        """Add a task to the queue."""
-        self.queue.append(task)
+        for entry in self._heap:
+            if not entry.cancelled:
+                entry.task.close()
+        self._heap = []
+        self._by_key = {}
+        self._pending = 0
+
+    def add(
+        self,
+        task: Coroutine,
+        *,
+        priority: QueuePriority = QueuePriority.BACKGROUND,
+        key: Hashable | None = None,
+    ) -> bool:
+        """Add a task to the queue, return False if a pending task with the key covers it."""
+        if key is not None and (existing := self._by_key.get(key)) is not None:
+            self.metrics.deduplicated += 1
+            if existing.priority <= priority:
+                # The pending task already covers this one.
+                task.close()
+                return False
+            existing.cancelled = True
+            existing.task.close()
+            self._pending -= 1
+
+        entry = QueueEntry(priority, next(self._sequence), task, key)
+        heapq.heappush(self._heap, entry)
+        if key is not None:
+            self._by_key[key] = entry
+        self._pending += 1
+        return True
+
+    def _checkout(self, number_of_tasks: int | None) -> list[QueueEntry]:
+        """Take the tasks to run now, spending the budget in priority order."""
+        background_budget = (
+            None
+            if number_of_tasks is None
+            else max(1, math.floor(number_of_tasks * BACKGROUND_BUDGET_SHARE))
+        )
+        entries = []
+        background = 0
+        while self._heap and (number_of_tasks is None or len(entries) < number_of_tasks):
+            entry = self._heap[0]
+            if entry.cancelled:
+                heapq.heappop(self._heap)
+                continue
+            if entry.priority >= QueuePriority.BACKGROUND:
+                if background_budget is not None and background >= background_budget:
+                    break
+                background += 1
+            heapq.heappop(self._heap)
+            if entry.key is not None:
+                self._by_key.pop(entry.key, None)
+            self._pending -= 1
+            entries.append(entry)
+        return entries
 
     async def execute(self, number_of_tasks: int | None = None) -> None:
         """Execute the tasks in the queue."""
         if self.running:
             _LOGGER.debug("<QueueManager> Execution is already running")
             raise HacsExecutionStillInProgress
-        if len(self.queue) == 0:
+        if not self.has_pending_tasks:
             _LOGGER.debug("<QueueManager> The queue is empty")
             return
 
         self.running = True
 
         _LOGGER.debug("<QueueManager> Checking out tasks to execute")
-        local_queue = []
+        local_queue = self._checkout(number_of_tasks)
+        slots = asyncio.Semaphore(self.max_concurrent)
+        waits: list[float] = []
 
-        if number_of_tasks:
-            for task in self.queue[:number_of_tasks]:
-                local_queue.append(task)
-        else:
-            for task in self.queue:
-                local_queue.append(task)
+        async def _run(entry: QueueEntry) -> Any:
+            async with slots:
+                waits.append(time.monotonic() - entry.queued)
+                return await entry.task
 
         _LOGGER.debug("<QueueManager> Starting queue execution for %s tasks", len(local_queue))
         start = time.time()
-        result = await asyncio.gather(*local_queue, return_exceptions=True)
+        try:
+            result = await asyncio.gather(
+                *(_run(entry) for entry in local_queue), return_exceptions=True
+            )
+        finally:
+            self.running = False
+
         for entry in result:
             if isinstance(entry, Exception):
+                self.metrics.failed += 1
                 _LOGGER.error("<QueueManager> %s", entry)
         end = time.time() - start
 
-        for task in local_queue:
-            self.queue.remove(task)
+        self.metrics.executed += len(local_queue)
+        self.metrics.last_duration = end
+        if waits:
+            self.metrics.last_wait_average = sum(waits) / len(waits)
+            self.metrics.last_wait_max = max(waits)
 
         _LOGGER.debug(
             "<QueueManager> Queue execution finished for %s tasks finished in %.2f seconds",
@@ -78,5 +217,4 @@ class QueueManager:
             end,
         )
         if self.has_pending_tasks:
-            _LOGGER.debug("<QueueManager> %s tasks remaining in the queue", len(self.queue))
-        self.running = False
+            _LOGGER.debug("<QueueManager> %s tasks remaining in the queue", self.pending_tasks)
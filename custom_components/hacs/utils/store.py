@@ -1,6 +1,8 @@
 """Storage handers."""
 
-from homeassistant.helpers.json import JSONEncoder
+from hashlib import blake2b
+
+from homeassistant.helpers.json import JSONEncoder, json_bytes_sorted
 from homeassistant.helpers.storage import Store
 from homeassistant.util import json as json_util
 
@@ -10,6 +12,8 @@ from .logger import LOGGER
 
 _LOGGER = LOGGER
 
+DATA_STORE_HASHES = "hacs_store_hashes"
+
 
 class HACSStore(Store):
     """A subclass of Store that allows multiple loads in the executor."""
@@ -52,24 +56,48 @@ async def async_load_from_store(hass, key):
     return await get_store_for_key(hass, key).async_load() or {}
 
 
-async def async_save_to_store(hass, key, data):
+def get_content_hash(data) -> str:
+    """Return a hash of the serialized content."""
+    return blake2b(json_bytes_sorted(data), digest_size=16).hexdigest()
+
+
+async def async_save_to_store(hass, key, data, changed: bool = False):
     """Generate dynamic data to store and save it to the filesystem.
 
-    The data is only written if the content on the disk has changed
-    by reading the existing content and comparing it.
+    The data is only written if the content has changed. The hash of the
+    last stored content is kept in memory, so the existing content is only
+    read from disk and compared the first time a key is saved.
+
+    Callers that track their own changes can pass changed=True to skip
+    the comparison.
 
-    If the data has changed this will generate two executor jobs
+    If the data has changed this will generate one or two executor jobs
 
-    If the data has not changed this will generate one executor job
+    If the data has not changed this will generate at most one executor job
     """
-    current = await async_load_from_store(hass, key)
-    if current is None or current != data:
+    hashes: dict[str, str] = hass.data.setdefault(DATA_STORE_HASHES, {})
+    content_hash = None
+
+    if not changed:
+        content_hash = get_content_hash(data)
+        if (stored_hash := hashes.get(key)) is None:
+            current = await async_load_from_store(hass, key)
+            changed = current is None or current != data
+        else:
+            changed = stored_hash != content_hash
+
+    if changed:
         await get_store_for_key(hass, key).async_save(data)
-        return
-    _LOGGER.debug(
-        "<HACSStore async_save_to_store> Did not store data for '%s'. Content did not change",
-        get_store_key(key),
-    )
+    else:
+        _LOGGER.debug(
+            "<HACSStore async_save_to_store> Did not store data for '%s'. Content did not change",
+            get_store_key(key),
+        )
+
+    if content_hash is None:
+        hashes.pop(key, None)
+    else:
+        hashes[key] = content_hash
 
 
 async def async_remove_store(hass, key):
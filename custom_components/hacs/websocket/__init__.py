@@ -15,8 +15,10 @@ from .repositories import (
     hacs_repositories_add,
     hacs_repositories_clear_new,
     hacs_repositories_list,
+    hacs_repositories_list_page,
     hacs_repositories_remove,
     hacs_repositories_removed,
+    hacs_repositories_subscribe,
 )
 from .repository import (
     hacs_repository_beta,
@@ -55,6 +57,8 @@ def async_register_websocket_commands(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, hacs_critical_list)
 
     websocket_api.async_register_command(hass, hacs_repositories_list)
+    websocket_api.async_register_command(hass, hacs_repositories_list_page)
+    websocket_api.async_register_command(hass, hacs_repositories_subscribe)
     websocket_api.async_register_command(hass, hacs_repositories_add)
     websocket_api.async_register_command(hass, hacs_repositories_clear_new)
     websocket_api.async_register_command(hass, hacs_repositories_removed)
@@ -6,7 +6,10 @@ import sys
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components import websocket_api
+from homeassistant.core import CALLBACK_TYPE, callback
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later
 import voluptuous as vol
 
 from custom_components.hacs.utils import regex
@@ -18,6 +21,112 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from ..base import HacsBase
+    from ..repositories.base import HacsRepository
+
+
+DATA_REPOSITORY_LIST = "hacs_repository_list"
+SUBSCRIPTION_DEBOUNCE = 0.5
+
+
+def _repository_row_key(hacs: HacsBase, repo: HacsRepository) -> tuple:
+    """Return everything a repository row is derived from."""
+    return (
+        repo.data.revision,
+        repo.repository_manifest,
+        repo.integration_manifest,
+        repo.state,
+        repo.pending_restart,
+        repo.content.path.local,
+        hacs.repositories.is_default(str(repo.data.id)),
+    )
+
+
+def _repository_row(hacs: HacsBase, repo: HacsRepository) -> dict[str, Any]:
+    """Return the websocket row for a repository."""
+    return {
+        "authors": repo.data.authors,
+        "available_version": repo.display_available_version,
+        "installed_version": repo.display_installed_version,
+        "config_flow": repo.data.config_flow,
+        "can_download": repo.can_download,
+        "category": repo.data.category,
+        "country": repo.repository_manifest.country,
+        "custom": not hacs.repositories.is_default(str(repo.data.id)),
+        "description": repo.data.description,
+        "domain": repo.data.domain,
+        "downloads": repo.data.downloads,
+        "file_name": repo.data.file_name,
+        "full_name": repo.data.full_name,
+        "hide": repo.data.hide,
+        "homeassistant": repo.repository_manifest.homeassistant,
+        "id": repo.data.id,
+        "installed": repo.data.installed,
+        "last_updated": repo.data.last_updated,
+        "local_path": repo.content.path.local,
+        "name": repo.display_name,
+        "new": repo.data.new,
+        "pending_upgrade": repo.pending_update,
+        "stars": repo.data.stargazers_count,
+        "state": repo.state,
+        "status": repo.display_status,
+        "topics": repo.data.topics,
+    }
+
+
+class RepositoryListCache:
+    """Repository rows for the websocket API, rebuilt only for repositories that changed."""
+
+    def __init__(self, hacs: HacsBase) -> None:
+        """Initialize."""
+        self.hacs = hacs
+        self._rows: dict[HacsRepository, tuple[tuple, dict[str, Any], str]] = {}
+
+    @callback
+    def async_get_rows(
+        self,
+        categories: set[str] | list[str],
+        search: str | None = None,
+        installed: bool | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return rows of repositories in the categories matching the filters."""
+        hacs = self.hacs
+        rows = []
+        search = search.lower() if search else None
+
+        for repo in (
+            repo
+            for category in dict.fromkeys(categories)
+            for repo in hacs.repositories.list_category(category, downloaded=installed)
+        ):
+            if repo.ignored_by_country_configuration or not repo.data.last_fetched:
+                continue
+            key = _repository_row_key(hacs, repo)
+            if (cached := self._rows.get(repo)) is None or cached[0] != key:
+                row = _repository_row(hacs, repo)
+                search_text = " ".join(
+                    str(value).lower()
+                    for value in (row["name"], row["full_name"], row["description"])
+                    if value
+                )
+                cached = self._rows[repo] = (key, row, search_text)
+            if search is not None and search not in cached[2]:
+                continue
+            rows.append(cached[1])
+
+        if len(self._rows) > hacs.repositories.count:
+            for repo in self._rows.keys() - set(hacs.repositories.list_all):
+                self._rows.pop(repo)
+
+        return rows
+
+
+@callback
+def async_get_repository_list_cache(hass: HomeAssistant, hacs: HacsBase) -> RepositoryListCache:
+    """Return the repository list cache for this HACS instance."""
+    cache: RepositoryListCache | None = hass.data.get(DATA_REPOSITORY_LIST)
+    if cache is None or cache.hacs is not hacs:
+        cache = hass.data[DATA_REPOSITORY_LIST] = RepositoryListCache(hacs)
+    return cache
 
 
 @websocket_api.websocket_command(
@@ -38,44 +147,119 @@ async def hacs_repositories_list(
     connection.send_message(
         websocket_api.result_message(
             msg["id"],
-            [
-                {
-                    "authors": repo.data.authors,
-                    "available_version": repo.display_available_version,
-                    "installed_version": repo.display_installed_version,
-                    "config_flow": repo.data.config_flow,
-                    "can_download": repo.can_download,
-                    "category": repo.data.category,
-                    "country": repo.repository_manifest.country,
-                    "custom": not hacs.repositories.is_default(str(repo.data.id)),
-                    "description": repo.data.description,
-                    "domain": repo.data.domain,
-                    "downloads": repo.data.downloads,
-                    "file_name": repo.data.file_name,
-                    "full_name": repo.data.full_name,
-                    "hide": repo.data.hide,
-                    "homeassistant": repo.repository_manifest.homeassistant,
-                    "id": repo.data.id,
-                    "installed": repo.data.installed,
-                    "last_updated": repo.data.last_updated,
-                    "local_path": repo.content.path.local,
-                    "name": repo.display_name,
-                    "new": repo.data.new,
-                    "pending_upgrade": repo.pending_update,
-                    "stars": repo.data.stargazers_count,
-                    "state": repo.state,
-                    "status": repo.display_status,
-                    "topics": repo.data.topics,
-                }
-                for repo in hacs.repositories.list_all
-                if repo.data.category in msg.get("categories", hacs.common.categories)
-                and not repo.ignored_by_country_configuration
-                and repo.data.last_fetched
-            ],
+            async_get_repository_list_cache(hass, hacs).async_get_rows(
+                msg.get("categories", hacs.common.categories)
+            ),
         )
     )
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "hacs/repositories/list_page",
+        vol.Optional("categories"): [str],
+        vol.Optional("search"): cv.string,
+        vol.Optional("installed"): cv.boolean,
+        vol.Optional("offset", default=0): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional("limit", default=100): vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+    }
+)
+@websocket_api.require_admin
+@websocket_api.async_response
+async def hacs_repositories_list_page(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """List a page of repositories, sorted by name."""
+    hacs: HacsBase = hass.data.get(DOMAIN)
+    rows = async_get_repository_list_cache(hass, hacs).async_get_rows(
+        msg.get("categories", hacs.common.categories),
+        search=msg.get("search"),
+        installed=msg.get("installed"),
+    )
+    rows.sort(key=lambda row: (str(row["name"]).lower(), row["full_name"]))
+    offset = msg["offset"]
+    connection.send_message(
+        websocket_api.result_message(
+            msg["id"],
+            {
+                "total": len(rows),
+                "offset": offset,
+                "repositories": rows[offset : offset + msg["limit"]],
+            },
+        )
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "hacs/repositories/subscribe",
+        vol.Optional("categories"): [str],
+    }
+)
+@websocket_api.require_admin
+@websocket_api.async_response
+async def hacs_repositories_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to repositories.
+
+    The first event has every repository, later events only the rows that
+    changed and the IDs of repositories that are no longer listed.
+    """
+    hacs: HacsBase = hass.data.get(DOMAIN)
+    cache = async_get_repository_list_cache(hass, hacs)
+    sent = {
+        str(row["id"]): row
+        for row in cache.async_get_rows(msg.get("categories", hacs.common.categories))
+    }
+    cancel_scheduled: CALLBACK_TYPE | None = None
+
+    @callback
+    def send_changes(_=None) -> None:
+        """Send the rows that changed since the last event."""
+        nonlocal cancel_scheduled, sent
+        cancel_scheduled = None
+        current = {
+            str(row["id"]): row
+            for row in cache.async_get_rows(msg.get("categories", hacs.common.categories))
+        }
+        changed = [row for repo_id, row in current.items() if sent.get(repo_id) is not row]
+        removed = [repo_id for repo_id in sent if repo_id not in current]
+        sent = current
+        if changed or removed:
+            connection.send_message(
+                websocket_api.event_message(msg["id"], {"changed": changed, "removed": removed})
+            )
+
+    @callback
+    def schedule_changes(_=None) -> None:
+        """Collect bursts of repository updates into a single event."""
+        nonlocal cancel_scheduled
+        if cancel_scheduled is None:
+            cancel_scheduled = async_call_later(hass, SUBSCRIPTION_DEBOUNCE, send_changes)
+
+    unsub_dispatcher = async_dispatcher_connect(
+        hass, HacsDispatchEvent.REPOSITORY, schedule_changes
+    )
+
+    @callback
+    def unsubscribe() -> None:
+        """Stop sending changes."""
+        unsub_dispatcher()
+        if cancel_scheduled is not None:
+            cancel_scheduled()
+
+    connection.subscriptions[msg["id"]] = unsubscribe
+    connection.send_message(websocket_api.result_message(msg["id"]))
+    connection.send_message(
+        websocket_api.event_message(msg["id"], {"changed": list(sent.values()), "removed": []})
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "hacs/repositories/clear_new",
@@ -98,8 +282,12 @@ async def hacs_repositories_clear_new(
         repository.data.new = False
 
     else:
-        for repo in hacs.repositories.list_all:
-            if repo.data.new and repo.data.category in msg.get("categories", []):
+        for repo in (
+            repo
+            for category in dict.fromkeys(msg.get("categories", []))
+            for repo in hacs.repositories.list_category(category)
+        ):
+            if repo.data.new:
                 hacs.log.debug(
                     "Clearing new flag from '%s'",
                     repo.data.full_name,
@@ -1,7 +1,10 @@
 """The import_statistics integration."""
 
+import asyncio
+from collections.abc import Iterable
 from typing import Any
 
+from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.statistics import (
     async_add_external_statistics,
     async_import_statistics,
@@ -12,8 +15,9 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.typing import ConfigType
 
 from custom_components.import_statistics import helpers, prepare_data
-from custom_components.import_statistics.const import ATTR_FILENAME, DOMAIN
+from custom_components.import_statistics.const import ATTR_BATCH_SIZE, ATTR_FILENAME, DOMAIN
 from custom_components.import_statistics.helpers import _LOGGER, UnitFrom
+from custom_components.import_statistics.progress import ImportProgress
 
 # Use empty_config_schema because the component does not have any config options
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -34,6 +38,12 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:  # pylint: disable=u
 
         hass.states.set("import_statistics.import_from_file", file_path)
 
+        batch_size = call.data.get(ATTR_BATCH_SIZE)
+        if batch_size:
+            batches, unit_from_entity, total_rows = prepare_data.prepare_data_to_import_in_batches(file_path, call, int(batch_size))
+            import_stats_in_batches(hass, batches, unit_from_entity, ImportProgress(hass, file_path, total_rows))
+            return
+
         _LOGGER.info("Peparing data for import")
         stats, unit_from_entity = prepare_data.prepare_data_to_import(file_path, call)
 
@@ -44,6 +54,13 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:  # pylint: disable=u
     def handle_import_from_json(call: ServiceCall) -> None:
         """Handle the json service call."""
         _LOGGER.info("Service handle_import_from_json called")
+
+        batch_size = call.data.get(ATTR_BATCH_SIZE)
+        if batch_size:
+            batches, unit_from_entity, total_rows = prepare_data.prepare_json_data_to_import_in_batches(call, int(batch_size))
+            import_stats_in_batches(hass, batches, unit_from_entity, ImportProgress(hass, None, total_rows))
+            return
+
         stats, unit_from_entity = prepare_data.prepare_json_data_to_import(call)
         import_stats(hass, stats, unit_from_entity)
 
@@ -86,6 +103,40 @@ def import_stats(hass: HomeAssistant, stats: dict, unit_from_entity: UnitFrom) -
     _LOGGER.info("Finished importing data")
 
 
+def import_stats_in_batches(hass: HomeAssistant, batches: Iterable[dict], unit_from_entity: UnitFrom, progress: ImportProgress) -> None:
+    """
+    Import statistics into Home Assistant one batch at a time.
+
+    The next batch is only read after the recorder has written the previous one, so the
+    recorder queue holds at most one batch and the progress only counts committed rows.
+
+    Args:
+    ----
+        hass: home assistant
+        batches: the statistic data of each batch
+        unit_from_entity: ENTITY if the unit is taken from the entity, TABLE if taken from input file.
+        progress: the progress of the import
+
+    """
+    instance = get_instance(hass)
+    try:
+        for batch in batches:
+            stats = progress.skip_committed(batch)
+            if not stats:
+                continue
+
+            import_stats(hass, stats, unit_from_entity)
+            # The service runs in the executor, wait for the recorder in the event loop
+            asyncio.run_coroutine_threadsafe(instance.async_block_till_done(), hass.loop).result()
+            progress.commit(stats)
+            _LOGGER.info("Imported %s of %s rows", progress.imported_rows + progress.skipped_rows, progress.total_rows)
+    except Exception:
+        progress.fail()
+        raise
+
+    progress.finish()
+
+
 def check_all_entities_exists(hass: HomeAssistant, stats: dict) -> None:
     """
     Check all entities in stats if they exist.
@@ -0,0 +1,271 @@
+"""Aggregate interval data to hourly statistics before the import."""
+
+import zoneinfo
+
+import numpy as np
+import pandas as pd
+import pytz
+
+from custom_components.import_statistics import helpers
+from custom_components.import_statistics.helpers import _LOGGER
+
+HOUR = pd.Timedelta(hours=1)
+HOUR_NS = HOUR.value
+# The format of the hourly timestamps, independent of the format of the input which may not contain the time
+HOURLY_DATETIME_FORMAT = "%Y-%m-%d %H:%M"
+
+
+def needs_aggregation(df: pd.DataFrame) -> bool:
+    """
+    Check if the dataframe contains interval data instead of hourly statistics.
+
+    Args:
+    ----
+        df: The dataframe read from the file or json.
+
+    Returns:
+    -------
+        bool: True if the dataframe has a 'value' or a 'delta' column.
+
+    """
+    return "value" in df.columns or "delta" in df.columns
+
+
+def aggregate_to_hourly(
+    df: pd.DataFrame,
+    timezone_identifier: str,
+    datetime_format: str,
+    load_profile: list[float] | None = None,
+    interval_end: bool = False,  # noqa: FBT001, FBT002
+) -> pd.DataFrame:
+    """
+    Aggregate interval data to hourly statistics.
+
+    A 'value' column contains measurements, which are aggregated to the hourly mean, min and max.
+    A 'delta' column contains the consumption of the interval from the timestamp of the row to
+    the timestamp of the next row of the statistic (from the previous timestamp if interval_end is true).
+    The consumption is distributed over the hours of the interval, weighted by the load profile for
+    intervals longer than an hour, and summed up to the hourly sum and state.
+
+    Args:
+    ----
+        df: The dataframe with the columns 'statistic_id', 'start', optionally 'unit', and 'value' or 'delta'.
+        timezone_identifier: The timezone of the timestamps.
+        datetime_format: The format of the timestamps, e.g. "%d.%m.%Y %H:%M"
+        load_profile: 24 weights for the local hours of the day, None to distribute evenly.
+        interval_end: True if the timestamp of a 'delta' row is the end of its interval.
+
+    Returns:
+    -------
+        pandas.DataFrame: The hourly statistics, with timestamps in UTC formatted with HOURLY_DATETIME_FORMAT.
+
+    Raises:
+    ------
+        HomeAssistantError: If the columns or values are invalid.
+
+    """
+    columns = df.columns
+    if "statistic_id" not in columns or "start" not in columns:
+        helpers.handle_error("The file must contain the columns 'statistic_id' and 'start' (check delimiter)")
+    if "value" in columns and "delta" in columns:
+        helpers.handle_error("The file must not contain both the columns 'value' and 'delta' (check delimiter)")
+    if any(column in columns for column in ("mean", "min", "max", "sum", "state")):
+        helpers.handle_error("The file must not contain the columns 'mean', 'min', 'max', 'sum' or 'state' together with 'value' or 'delta'")
+
+    value_column = "value" if "value" in columns else "delta"
+    helpers.check_float_column(df[value_column])
+    if value_column == "delta" and df["delta"].isna().any():
+        helpers.handle_error(f"Missing delta value for {df['statistic_id'][df['delta'].isna()].iloc[0]}, the consumption of every interval is needed to calculate the sum.")
+
+    timezone = zoneinfo.ZoneInfo(timezone_identifier)
+    df = df.assign(
+        _order=pd.factorize(df["statistic_id"])[0],
+        _start=localize(df, timezone, datetime_format),
+        _value=df[value_column].astype(float),
+    ).sort_values(["_order", "_start"], kind="stable")
+
+    if value_column == "value":
+        hourly = aggregate_values(df)
+    else:
+        hourly = aggregate_deltas(df, timezone, load_profile, interval_end=interval_end)
+
+    statistic_ids = df.drop_duplicates("_order").set_index("_order")
+    result = pd.DataFrame({"statistic_id": statistic_ids["statistic_id"].reindex(hourly["_order"]).to_numpy()})
+    if "unit" in columns:
+        result["unit"] = statistic_ids["unit"].reindex(hourly["_order"]).to_numpy()
+    result["start"] = hourly["_start"].dt.strftime(HOURLY_DATETIME_FORMAT).to_numpy()
+    for column in hourly.columns.drop(["_order", "_start"]):
+        result[column] = hourly[column].to_numpy()
+
+    _LOGGER.info("Aggregated %s rows to %s hourly rows", len(df), len(result))
+    return result
+
+
+def localize(df: pd.DataFrame, timezone: zoneinfo.ZoneInfo, datetime_format: str) -> pd.Series:
+    """
+    Parse the timestamps in the timezone and convert them to UTC.
+
+    Repeated times at the end of daylight saving time are inferred from the order of the rows of
+    each statistic, or taken as daylight saving time if that is not possible, like the import does.
+
+    Args:
+    ----
+        df: The dataframe with the columns 'statistic_id' and 'start'.
+        timezone: The timezone of the timestamps.
+        datetime_format: The format of the timestamps, e.g. "%d.%m.%Y %H:%M"
+
+    Returns:
+    -------
+        pandas.Series: The timestamps in UTC.
+
+    """
+    parsed = pd.to_datetime(df["start"], format=datetime_format, errors="coerce")
+    invalid = parsed.isna()
+    if invalid.any():
+        helpers.handle_error(f"Invalid timestamp: {df['start'][invalid].iloc[0]}. The timestamp must be in the format '{datetime_format}'.")
+
+    localized = pd.Series(pd.NaT, index=df.index, dtype="datetime64[ns, UTC]")
+    for indices in df.groupby("statistic_id", sort=False).indices.values():
+        group = parsed.iloc[indices]
+        try:
+            local = group.dt.tz_localize(timezone, ambiguous="infer", nonexistent="shift_forward")
+        except (ValueError, pytz.exceptions.InvalidTimeError):
+            local = group.dt.tz_localize(timezone, ambiguous=np.ones(len(group), dtype=bool), nonexistent="shift_forward")
+        localized.iloc[indices] = local.dt.tz_convert("UTC").to_numpy()
+    return localized
+
+
+def aggregate_values(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aggregate measurements to the hourly mean, min and max.
+
+    Args:
+    ----
+        df: The dataframe with the columns '_order', '_start' in UTC and '_value'.
+
+    Returns:
+    -------
+        pandas.DataFrame: The columns '_order', '_start', 'mean', 'min' and 'max'.
+
+    """
+    hourly = df.assign(_start=df["_start"].dt.floor("h")).groupby(["_order", "_start"])["_value"].agg(["mean", "min", "max"])
+    return hourly.reset_index()
+
+
+def aggregate_deltas(
+    df: pd.DataFrame,
+    timezone: zoneinfo.ZoneInfo,
+    load_profile: list[float] | None,
+    *,
+    interval_end: bool,
+) -> pd.DataFrame:
+    """
+    Distribute the consumption of each interval over its hours and sum it up per hour.
+
+    Every hour between the first and the last interval of a statistic gets a row, so the running
+    sum has no gaps. The last interval (first, if interval_end is true) of a statistic is assumed to
+    be as long as the median interval of the statistic. The load profile only weights intervals
+    longer than an hour, shorter ones are distributed by their overlap with each hour.
+
+    Args:
+    ----
+        df: The dataframe with the columns '_order', '_start' in UTC and '_value', sorted by '_order' and '_start'.
+        timezone: The timezone of the load profile.
+        load_profile: 24 weights for the local hours of the day of intervals longer than an hour, None to distribute evenly.
+        interval_end: True if '_start' is the end of the interval.
+
+    Returns:
+    -------
+        pandas.DataFrame: The columns '_order', '_start', 'sum' and 'state'.
+
+    """
+    order = df["_order"].to_numpy()
+    timestamps = df["_start"].dt.tz_convert(None).to_numpy().astype("datetime64[ns]").astype(np.int64)
+
+    by_statistic = df.groupby("_order", sort=False)["_start"]
+    if interval_end:
+        other = by_statistic.shift(1)
+    else:
+        other = by_statistic.shift(-1)
+    other = other.dt.tz_convert(None).to_numpy().astype("datetime64[ns]")
+
+    # Interval of the row without a neighbour: the median interval of the statistic, or an hour
+    lengths = np.abs(other.astype(np.int64) - timestamps).astype(float)
+    lengths[np.isnat(other)] = np.nan
+    median = pd.Series(lengths).groupby(order).transform("median").fillna(HOUR_NS).to_numpy().astype(np.int64)
+    missing = np.isnat(other)
+    if interval_end:
+        begin = np.where(missing, timestamps - median, other.astype(np.int64))
+        end = timestamps
+    else:
+        begin = timestamps
+        end = np.where(missing, timestamps + median, other.astype(np.int64))
+
+    # One row for each hour an interval overlaps
+    first_hour = begin - begin % HOUR_NS
+    hours = np.maximum(1, -((first_hour - end) // HOUR_NS))
+    row = np.repeat(np.arange(len(begin)), hours)
+    hour_start = first_hour[row] + (np.arange(len(row)) - np.repeat(np.cumsum(hours) - hours, hours)) * HOUR_NS
+    overlap = np.clip(np.minimum(end[row], hour_start + HOUR_NS) - np.maximum(begin[row], hour_start), 0, None).astype(float)
+
+    weight = overlap
+    if load_profile is not None:
+        local_hours = pd.DatetimeIndex(hour_start, tz="UTC").tz_convert(timezone).hour
+        long_interval = (end - begin) > HOUR_NS
+        weight = np.where(long_interval[row], overlap * np.asarray(load_profile, dtype=float)[local_hours], overlap)
+        # Keep the consumption of intervals only covering hours with a weight of 0
+        no_weight = np.bincount(row, weights=weight, minlength=len(begin)) == 0
+        weight = np.where(no_weight[row], overlap, weight)
+
+    row_weight = np.bincount(row, weights=weight, minlength=len(begin))
+    # Intervals of length 0 go to their first hour
+    share = np.where(row_weight[row] > 0, weight / np.where(row_weight[row] > 0, row_weight[row], 1), hour_start == first_hour[row])
+
+    hourly = (
+        pd.DataFrame(
+            {
+                "_order": order[row],
+                "_start": pd.DatetimeIndex(hour_start, tz="UTC"),
+                "delta": df["_value"].to_numpy()[row] * share,
+            }
+        )
+        .groupby(["_order", "_start"])["delta"]
+        .sum()
+        .reset_index()
+    )
+    hourly["sum"] = hourly.groupby("_order")["delta"].cumsum()
+    hourly["state"] = hourly["sum"]
+    return hourly.drop(columns="delta")
+
+
+def parse_load_profile(load_profile: str | list | None) -> list[float] | None:
+    """
+    Parse the load profile argument.
+
+    Args:
+    ----
+        load_profile: 24 weights as list or comma separated string, or None.
+
+    Returns:
+    -------
+        list: The 24 weights, or None if not given.
+
+    Raises:
+    ------
+        HomeAssistantError: If the load profile is invalid.
+
+    """
+    if load_profile is None or load_profile in ("", []):
+        return None
+
+    if isinstance(load_profile, str):
+        load_profile = load_profile.split(",")
+
+    try:
+        weights = [float(weight) for weight in load_profile]
+    except (TypeError, ValueError):
+        weights = []
+
+    if len(weights) != 24 or any(weight < 0 for weight in weights) or sum(weights) == 0:  # noqa: PLR2004
+        helpers.handle_error(f"Invalid load_profile: {load_profile}. It must contain 24 non-negative weights, one for each hour of the day.")
+    return weights
@@ -8,6 +8,12 @@ ATTR_DELIMITER = "delimiter"
 ATTR_DECIMAL = "decimal"
 ATTR_DATETIME_FORMAT = "datetime_format"
 ATTR_UNIT_FROM_ENTITY = "unit_from_entity"
+ATTR_BATCH_SIZE = "batch_size"
+ATTR_LOAD_PROFILE = "load_profile"
+ATTR_INTERVAL_END = "interval_end"
+
+PROGRESS_ENTITY_ID = "import_statistics.import_progress"
+CHECKPOINT_FILE = ".storage/import_statistics.checkpoint"
 
 TESTFILEPATHS = "tests/testfiles/"
 
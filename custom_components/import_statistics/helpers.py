@@ -193,6 +193,86 @@ def min_max_mean_are_valid(min_value: float, max_value: float, mean_value: float
     raise HomeAssistantError(msg)
 
 
+def get_start_datetimes(start: pd.Series, timezone: zoneinfo.ZoneInfo, datetime_format: str = DATETIME_DEFAULT_FORMAT) -> list:
+    """
+    Parse a column of timestamps at once and check that all are full hours.
+
+    Args:
+    ----
+        start (pandas.Series): The timestamp strings.
+        timezone (zoneinfo.ZoneInfo): The timezone of the timestamps.
+        datetime_format (str): The format of the provided timestamps, e.g. "%d.%m.%Y %H:%M"
+
+    Returns:
+    -------
+        list: The timestamps as datetimes in the timezone, like get_mean_stat and get_sum_stat return them.
+
+    Raises:
+    ------
+        HomeAssistantError: If a timestamp is invalid or not a full hour.
+
+    """
+    parsed = pd.DatetimeIndex(pd.to_datetime(start, format=datetime_format, errors="coerce"))
+
+    invalid = parsed.isna()
+    if invalid.any():
+        # Same check and message as is_full_hour for the first invalid timestamp
+        is_full_hour(start[invalid].iloc[0], datetime_format)
+
+    not_full_hour = (parsed.minute != 0) | (parsed.second != 0)
+    if not_full_hour.any():
+        is_full_hour(start[not_full_hour].iloc[0], datetime_format)
+
+    return [value.replace(tzinfo=timezone) for value in parsed.to_pydatetime()]
+
+
+def check_float_column(values: pd.Series) -> None:
+    """
+    Check if all values of a column are valid floats.
+
+    Args:
+    ----
+        values (pandas.Series): The values to check.
+
+    Raises:
+    ------
+        HomeAssistantError: If a value is not a valid float.
+
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        return
+
+    numeric = pd.to_numeric(values, errors="coerce")
+    # Only the values pandas cannot parse are checked one by one, float() accepts a few more formats
+    for value in values[numeric.isna() & values.notna()]:
+        is_valid_float(value)
+
+
+def check_min_max_mean_columns(min_values: pd.Series, max_values: pd.Series, mean_values: pd.Series) -> None:
+    """
+    Check if the min, max and mean values of all rows are valid.
+
+    Args:
+    ----
+        min_values (pandas.Series): The minimum values.
+        max_values (pandas.Series): The maximum values.
+        mean_values (pandas.Series): The mean values.
+
+    Raises:
+    ------
+        HomeAssistantError: If a mean value is not between the min and max values.
+
+    """
+    min_floats = min_values.astype(float)
+    max_floats = max_values.astype(float)
+    mean_floats = mean_values.astype(float)
+
+    invalid = ~((min_floats <= mean_floats) & (mean_floats <= max_floats))
+    if invalid.any():
+        index = invalid.to_numpy().argmax()
+        min_max_mean_are_valid(min_floats.iloc[index], max_floats.iloc[index], mean_floats.iloc[index])
+
+
 def are_columns_valid(df: pd.DataFrame, unit_from_where: UnitFrom) -> bool:
     """
     Check if the given DataFrame columns meet the required criteria.
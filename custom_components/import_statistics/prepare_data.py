@@ -1,17 +1,20 @@
 """Main methods for the import_statistics integration."""
 
 import zoneinfo
+from collections.abc import Iterator
 from pathlib import Path
 
 import pandas as pd
 import pytz
 from homeassistant.core import ServiceCall
 
-from custom_components.import_statistics import helpers
+from custom_components.import_statistics import aggregate, helpers
 from custom_components.import_statistics.const import (
     ATTR_DATETIME_FORMAT,
     ATTR_DECIMAL,
     ATTR_DELIMITER,
+    ATTR_INTERVAL_END,
+    ATTR_LOAD_PROFILE,
     ATTR_TIMEZONE_IDENTIFIER,
     ATTR_UNIT_FROM_ENTITY,
     DATETIME_DEFAULT_FORMAT,
@@ -44,12 +47,87 @@ def prepare_data_to_import(file_path: str, call: ServiceCall) -> tuple:
     if not Path(file_path).exists():
         helpers.handle_error(f"path {file_path} does not exist.")
 
-    my_df = pd.read_csv(file_path, sep=delimiter, decimal=decimal, engine="python")
+    my_df = read_csv(file_path, delimiter, decimal)
+
+    if aggregate.needs_aggregation(my_df):
+        my_df, timezone_identifier, datetime_format = aggregate_dataframe(my_df, call, timezone_identifier, datetime_format)
 
     stats = handle_dataframe(my_df, timezone_identifier, datetime_format, unit_from_entity)
     return stats, unit_from_entity
 
 
+def prepare_data_to_import_in_batches(file_path: str, call: ServiceCall, batch_size: int) -> tuple:
+    """
+    Prepare data to import statistics from a file in batches.
+
+    Args:
+    ----
+        file_path: Path to the file with the data to be imported.
+        call: The call data containing the necessary information.
+        batch_size: The number of rows in a batch.
+
+    Returns:
+    -------
+        A tuple with an iterator of the statistics of each batch, the unit source and the number of rows.
+
+    Raises:
+    ------
+        FileNotFoundError: If the specified file does not exist.
+
+    """
+    decimal, timezone_identifier, delimiter, datetime_format, unit_from_entity = handle_arguments(call)
+
+    _LOGGER.info("Importing statistics from file in batches of %s rows: %s", batch_size, file_path)
+    if not Path(file_path).exists():
+        helpers.handle_error(f"path {file_path} does not exist.")
+
+    total_rows = count_rows(file_path)
+    batches = (check_not_aggregated(df) and handle_dataframe(df, timezone_identifier, datetime_format, unit_from_entity) for df in read_csv(file_path, delimiter, decimal, batch_size))
+    return batches, unit_from_entity, total_rows
+
+
+def count_rows(file_path: str) -> int:
+    """Count the data rows of a csv/tsv file without parsing it."""
+    lines = 0
+    last = b"\n"
+    with Path(file_path).open("rb") as file:
+        while block := file.read(1024 * 1024):
+            lines += block.count(b"\n")
+            last = block[-1:]
+    if last != b"\n":
+        lines += 1
+    # The first line is the header
+    return max(lines - 1, 0)
+
+
+def read_csv(file_path: str, delimiter: str | None, decimal: str, chunksize: int | None = None) -> pd.DataFrame | Iterator[pd.DataFrame]:
+    """
+    Read a csv/tsv file, with the C parser if possible.
+
+    Args:
+    ----
+        file_path: Path to the file.
+        delimiter: The delimiter, None to detect it.
+        decimal: The decimal separator.
+        chunksize: If set, the file is read in dataframes of this many rows.
+
+    Returns:
+    -------
+        The dataframe with the file content, or an iterator of dataframes if chunksize is set.
+
+    """
+    # The services selector offers the escaped tab, which the python parser handled as a regular expression
+    if delimiter == "\\t":
+        delimiter = "\t"
+
+    if delimiter is None or len(delimiter) != 1:
+        # Detecting the delimiter and multi character delimiters need the python parser
+        return pd.read_csv(file_path, sep=delimiter, decimal=decimal, engine="python", chunksize=chunksize)
+
+    # The default float converter of the C parser reads the same floats as the python parser, round_trip does not
+    return pd.read_csv(file_path, sep=delimiter, decimal=decimal, engine="c", chunksize=chunksize)
+
+
 def prepare_json_entities(call: ServiceCall) -> tuple:
     """Prepare json entities for import."""
     timezone_identifier = call.data.get("timezone_identifier")
@@ -67,7 +145,7 @@ def prepare_json_data_to_import(call: ServiceCall) -> tuple:
     """Parse json data to import statistics from."""
     _, timezone_identifier, _, datetime_format, unit_from_entity = handle_arguments(call)
 
-    valid_columns = ["state", "sum", "min", "max", "mean"]
+    valid_columns = ["state", "sum", "min", "max", "mean", "value", "delta"]
     columns = ["statistic_id", "unit", "start"]
     data = []
 
@@ -91,10 +169,96 @@ def prepare_json_data_to_import(call: ServiceCall) -> tuple:
             data.append(tuple([value_dict[column] for column in columns]))
 
     my_df = pd.DataFrame(data, columns=columns)
+
+    if aggregate.needs_aggregation(my_df):
+        my_df, timezone_identifier, datetime_format = aggregate_dataframe(my_df, call, timezone_identifier, datetime_format)
+
     stats = handle_dataframe(my_df, timezone_identifier, datetime_format, unit_from_entity)
     return stats, unit_from_entity
 
 
+def prepare_json_data_to_import_in_batches(call: ServiceCall, batch_size: int) -> tuple:
+    """
+    Parse json data to import statistics from in batches.
+
+    Args:
+    ----
+        call: The call data containing the necessary information.
+        batch_size: The number of values in a batch.
+
+    Returns:
+    -------
+        A tuple with an iterator of the statistics of each batch, the unit source and the number of values.
+
+    """
+    _, timezone_identifier, _, datetime_format, unit_from_entity = handle_arguments(call)
+
+    input_entities = call.data.get("entities", [])
+    total_rows = sum(len(entity["values"]) for entity in input_entities)
+    batches = (check_not_aggregated(df) and handle_dataframe(df, timezone_identifier, datetime_format, unit_from_entity) for df in iter_json_dataframes(input_entities, batch_size))
+    return batches, unit_from_entity, total_rows
+
+
+def iter_json_dataframes(input_entities: list, batch_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Build dataframes of at most batch_size values from the json entities.
+
+    Args:
+    ----
+        input_entities: The entities with their values.
+        batch_size: The number of values in a dataframe.
+
+    Returns:
+    -------
+        An iterator of dataframes with the same columns prepare_json_data_to_import creates.
+
+    """
+    valid_columns = ["state", "sum", "min", "max", "mean", "value", "delta"]
+
+    for entity in input_entities:
+        statistic_id, values, unit = (entity["id"], entity["values"], entity["unit"])
+        _LOGGER.info(f"Parsing entity with id: {statistic_id} with {len(values)} values")
+        for index in range(0, len(values), batch_size):
+            batch = pd.DataFrame.from_records(values[index : index + batch_size])
+            my_df = pd.DataFrame({"statistic_id": statistic_id, "unit": unit, "start": batch["datetime"]})
+            for valid_column in valid_columns:
+                if valid_column in batch.columns:
+                    my_df[valid_column] = batch[valid_column]
+            yield my_df
+
+
+def aggregate_dataframe(df: pd.DataFrame, call: ServiceCall, timezone_identifier: str, datetime_format: str) -> tuple:
+    """
+    Aggregate interval data to hourly statistics.
+
+    Args:
+    ----
+        df: The dataframe with a 'value' or 'delta' column.
+        call: The call data containing the load profile and interval end arguments.
+        timezone_identifier: The timezone of the timestamps.
+        datetime_format: The format of the timestamps.
+
+    Returns:
+    -------
+        A tuple with the hourly dataframe, the timezone of its timestamps, which is UTC, and their format.
+
+    """
+    load_profile = aggregate.parse_load_profile(call.data.get(ATTR_LOAD_PROFILE))
+    interval_end = call.data.get(ATTR_INTERVAL_END, False)
+    _LOGGER.debug("Load profile: %s", load_profile)
+    _LOGGER.debug("Interval end: %s", interval_end)
+
+    hourly_df = aggregate.aggregate_to_hourly(df, timezone_identifier, datetime_format, load_profile, interval_end)
+    return hourly_df, "UTC", aggregate.HOURLY_DATETIME_FORMAT
+
+
+def check_not_aggregated(df: pd.DataFrame) -> bool:
+    """Check that a batch does not need aggregation, which needs all rows of a statistic at once."""
+    if aggregate.needs_aggregation(df):
+        helpers.handle_error("The columns 'value' and 'delta' cannot be imported with batch_size, import without batch_size to aggregate them to hourly statistics.")
+    return True
+
+
 def handle_arguments(call: ServiceCall) -> tuple:
     """
     Handle the arguments for importing statistics from a file.
@@ -170,23 +334,32 @@ def handle_dataframe(
     timezone = zoneinfo.ZoneInfo(timezone_identifier)
     has_mean = "mean" in columns
     has_sum = "sum" in columns
-    for _index, row in df.iterrows():
-        statistic_id = row["statistic_id"]
-        if statistic_id not in stats:  # New statistic id found
-            source = helpers.get_source(statistic_id)
-            metadata = {
-                "has_mean": has_mean,
-                "has_sum": has_sum,
-                "source": source,
-                "statistic_id": statistic_id,
-                "name": None,
-                "unit_of_measurement": helpers.add_unit_to_dataframe(source, unit_from_where, row.get("unit", ""), statistic_id),
-            }
-            stats[statistic_id] = (metadata, [])
-
-        if has_mean:
-            new_stat = helpers.get_mean_stat(row, timezone, datetime_format)
-        if has_sum:
-            new_stat = helpers.get_sum_stat(row, timezone, datetime_format)
-        stats[statistic_id][1].append(new_stat)
+    if has_mean:
+        value_columns = ["min", "max", "mean"]
+    else:
+        value_columns = ["sum", "state"] if "state" in columns else ["sum"]
+
+    # Validate and convert whole columns instead of row by row, the checks are the same as in
+    # get_mean_stat and get_sum_stat.
+    starts = helpers.get_start_datetimes(df["start"], timezone, datetime_format)
+    for column in value_columns:
+        helpers.check_float_column(df[column])
+    if has_mean:
+        helpers.check_min_max_mean_columns(df["min"], df["max"], df["mean"])
+
+    keys = ["start", *value_columns]
+    rows = [dict(zip(keys, values, strict=True)) for values in zip(starts, *(df[column].tolist() for column in value_columns), strict=True)]
+    units = df["unit"].tolist() if "unit" in columns else None
+
+    for statistic_id, indices in df.groupby("statistic_id", sort=False, dropna=False).indices.items():
+        source = helpers.get_source(statistic_id)
+        metadata = {
+            "has_mean": has_mean,
+            "has_sum": has_sum,
+            "source": source,
+            "statistic_id": statistic_id,
+            "name": None,
+            "unit_of_measurement": helpers.add_unit_to_dataframe(source, unit_from_where, "" if units is None else units[indices[0]], statistic_id),
+        }
+        stats[statistic_id] = (metadata, [rows[index] for index in indices])
     return stats
@@ -0,0 +1,146 @@
+"""Progress and checkpoint of an import in batches."""
+
+import datetime as dt
+import json
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util.file import write_utf8_file
+
+from custom_components.import_statistics.const import CHECKPOINT_FILE, PROGRESS_ENTITY_ID
+from custom_components.import_statistics.helpers import _LOGGER
+
+
+class ImportProgress:
+    """
+    Track the rows of an import in batches.
+
+    The progress is shown in the state of PROGRESS_ENTITY_ID. For file imports, the last
+    committed hour of each statistic is saved in CHECKPOINT_FILE after every batch, so
+    importing the same file again skips the rows already committed. This expects the rows
+    of each statistic to be in chronological order.
+    """
+
+    def __init__(self, hass: HomeAssistant, source: str | None, total_rows: int | None) -> None:
+        """
+        Initialize the progress, loading the checkpoint of the source.
+
+        Args:
+        ----
+            hass: home assistant
+            source: the imported file, None if the import cannot be resumed
+            total_rows: the number of rows to import, None if not known
+
+        """
+        self._hass = hass
+        self._source = source
+        self._checkpoint_path = Path(hass.config.config_dir) / CHECKPOINT_FILE
+        self.total_rows = total_rows
+        self.imported_rows = 0
+        self.skipped_rows = 0
+        self.committed: dict[str, dt.datetime] = {}
+
+        if source is not None:
+            self._load_checkpoint()
+        self._set_state("running")
+
+    def _load_checkpoint(self) -> None:
+        """Load the last committed hours if the checkpoint is for the same source."""
+        if not self._checkpoint_path.exists():
+            return
+
+        try:
+            checkpoint = json.loads(self._checkpoint_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            _LOGGER.warning("Ignoring unreadable checkpoint %s: %s", self._checkpoint_path, exc)
+            return
+
+        if checkpoint.get("source") != self._source:
+            return
+
+        self.committed = {statistic_id: dt.datetime.fromisoformat(start) for statistic_id, start in checkpoint["committed"].items()}
+        _LOGGER.info("Resuming import of %s after %s", self._source, checkpoint["committed"])
+
+    def skip_committed(self, stats: dict) -> dict:
+        """
+        Remove the rows which were committed by a previous import of the source.
+
+        Args:
+        ----
+            stats: dictionary with the statistic data of a batch
+
+        Returns:
+        -------
+            dict: the statistic data still to be imported
+
+        """
+        if not self.committed:
+            return stats
+
+        remaining = {}
+        for statistic_id, (metadata, statistics) in stats.items():
+            last_committed = self.committed.get(statistic_id)
+            if last_committed is not None:
+                rows = len(statistics)
+                statistics = [statistic for statistic in statistics if statistic["start"] > last_committed]
+                self.skipped_rows += rows - len(statistics)
+            if statistics:
+                remaining[statistic_id] = (metadata, statistics)
+        return remaining
+
+    def commit(self, stats: dict) -> None:
+        """
+        Record a batch which was written by the recorder.
+
+        Args:
+        ----
+            stats: dictionary with the statistic data of the batch
+
+        """
+        for statistic_id, (_metadata, statistics) in stats.items():
+            self.imported_rows += len(statistics)
+            last_start = max(statistic["start"] for statistic in statistics)
+            if statistic_id not in self.committed or last_start > self.committed[statistic_id]:
+                self.committed[statistic_id] = last_start
+
+        if self._source is not None:
+            checkpoint = {
+                "source": self._source,
+                "committed": {statistic_id: start.isoformat() for statistic_id, start in self.committed.items()},
+            }
+            write_utf8_file(str(self._checkpoint_path), json.dumps(checkpoint))
+        self._set_state("running")
+
+    def finish(self) -> None:
+        """Mark the import as finished and remove its checkpoint."""
+        if self._source is not None and self._checkpoint_path.exists():
+            self._checkpoint_path.unlink()
+        self._set_state("finished")
+
+    def fail(self) -> None:
+        """Mark the import as failed, the checkpoint is kept to resume it."""
+        self._set_state("failed")
+
+    def _set_state(self, status: str) -> None:
+        """Show the progress in PROGRESS_ENTITY_ID."""
+        done = self.imported_rows + self.skipped_rows
+        if status == "finished":
+            percentage = 100
+        elif self.total_rows:
+            percentage = min(100, round(100 * done / self.total_rows))
+        else:
+            percentage = None
+
+        self._hass.states.set(
+            PROGRESS_ENTITY_ID,
+            percentage,
+            {
+                "unit_of_measurement": "%",
+                "status": status,
+                "source": self._source,
+                "imported_rows": self.imported_rows,
+                "skipped_rows": self.skipped_rows,
+                "total_rows": self.total_rows,
+                "last_committed": {statistic_id: start.isoformat() for statistic_id, start in self.committed.items()},
+            },
+        )
@@ -1,19 +1,19 @@
 """ TeamTracker Team Status """
 import asyncio
-from datetime import date, datetime, timedelta, timezone
+from datetime import date, timedelta
 import json
 import locale
 import logging
 import os
 
 import aiofiles
-import aiohttp
 import arrow
 from async_timeout import timeout
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_registry import ( # pylint: disable=reimported
     async_entries_for_config_entry,
     async_get,
@@ -24,6 +24,7 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, Upda
 from .clear_values import async_clear_values
 from .const import (
     API_LIMIT,
+    CACHED_API_MESSAGE,
     CONF_API_LANGUAGE,
     CONF_CONFERENCE_ID,
     CONF_LEAGUE_ID,
@@ -49,6 +50,7 @@ from .const import (
     VERSION,
 )
 from .event import async_process_event
+from .feed import LeagueFeed
 
 _LOGGER = logging.getLogger(__name__)
 # team_prob = {}
@@ -207,10 +209,6 @@ async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 class TeamTrackerDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching TeamTracker data."""
 
-    data_cache = {}
-    last_update = {}
-    c_cache = {}
-
     def __init__(self, hass, config, entry: ConfigEntry=None):
         """Initialize."""
         self.name = config[CONF_NAME]
@@ -227,6 +225,7 @@ class TeamTrackerDataUpdateCoordinator(DataUpdateCoordinator):
         self.config = config
         self.hass = hass
         self.entry = entry #None if setup from YAML
+        self.feed = None
 
         super().__init__(hass, _LOGGER, name=self.name, update_interval=DEFAULT_REFRESH_RATE)
         _LOGGER.debug(
@@ -268,11 +267,23 @@ class TeamTrackerDataUpdateCoordinator(DataUpdateCoordinator):
         self.team_id = team_id
         self.conference_id = conference_id
 
-        lang = self.get_lang()
-        key = sport_path + ":" + league_path + ":" + conference_id + ":" + lang
+        self.get_feed(self.get_lang()).invalidate()
+
+
+    #
+    #  Return the shared feed for the league, moving to a new one if the team info changed
+    #
+    def get_feed(self, lang) -> LeagueFeed:
+        """Return the feed for the sensor's league."""
 
-        if key in TeamTrackerDataUpdateCoordinator.data_cache:
-            del TeamTrackerDataUpdateCoordinator.data_cache[key]
+        key = self.sport_path + ":" + self.league_path + ":" + self.conference_id + ":" + lang
+
+        if self.feed is None or self.feed.key != key:
+            if self.feed is not None:
+                self.feed.unsubscribe(self)
+            self.feed = LeagueFeed.get(key)
+            self.feed.subscribe(self)
+        return self.feed
 
 
     #
@@ -305,46 +316,36 @@ class TeamTrackerDataUpdateCoordinator(DataUpdateCoordinator):
             return data
 
     async def async_update_game_data(self, config, hass) -> dict:
-        """Update game data from data_cache or the API (if expired)"""
+        """Update game data from the shared league feed, which calls the API if expired"""
 
         sensor_name = self.name
-        sport_path = self.sport_path
-        league_path = self.league_path
-        conference_id = self.conference_id
 
         lang = self.get_lang()
 
-        key = sport_path + ":" + league_path + ":" + conference_id + ":" + lang
-
-        #
-        #  Use cache if not expired
-        #
-        if key in self.data_cache:
-            expiration = (
-                datetime.fromisoformat(self.last_update[key]) + self.update_interval
-            )
-            now = datetime.now(timezone.utc)
-
-            if now < expiration:
-                data = self.data_cache[key]
-                values = await self.async_update_values(config, hass, data, lang)
-                if values["api_message"]:
-                    values["api_message"] = "Cached data: " + values["api_message"]
-                else:
-                    values["api_message"] = "Cached data"
-                return values
-
         #
-        #  Call the API
+        #  Call the API through the feed for the league
         #  Get the language based on the locale
         #    Then override it if there is a value in frontend_storage for the selected language
         #      (it usually takes about a minute after reboot for frontend_storage to be populated)
         #
 
-        data, file_override = await self.async_call_api(config, hass, lang)
+        async def async_fetch():
+            data, file_override = await self.async_call_api(config, hass, lang)
+            return data, file_override, self.api_url
+
+        feed = self.get_feed(lang)
+        data, file_override, cached = await feed.async_get(
+            sensor_name, self.update_interval, async_fetch
+        )
+        self.api_url = feed.api_url
+
         values = await self.async_update_values(config, hass, data, lang)
-        self.data_cache[key] = data
-        self.last_update[key] = values["last_update"]
+        if cached:
+            if values["api_message"]:
+                values["api_message"] = CACHED_API_MESSAGE + ": " + values["api_message"]
+            else:
+                values["api_message"] = CACHED_API_MESSAGE
+            return values
 
         if file_override:
             path = "/share/tt/results/" + sensor_name + ".json"
@@ -371,6 +372,7 @@ class TeamTrackerDataUpdateCoordinator(DataUpdateCoordinator):
 
         headers = {"User-Agent": USER_AGENT, "Accept": "application/ld+json"}
         sensor_name = self.name
+        session = async_get_clientsession(hass)
 
         data = None
         file_override = False
@@ -401,19 +403,18 @@ class TeamTrackerDataUpdateCoordinator(DataUpdateCoordinator):
                 contents = await f.read()
             data = json.loads(contents)
         else:
-            async with aiohttp.ClientSession() as session:
-                try:
-                    async with session.get(url, headers=headers) as r:
-                        _LOGGER.debug(
-                            "%s: Calling API for '%s' from %s",
-                            sensor_name,
-                            team_id,
-                            url,
-                        )
-                        if r.status == 200:
-                            data = await r.json()
-                except:
-                    data = None
+            try:
+                async with session.get(url, headers=headers) as r:
+                    _LOGGER.debug(
+                        "%s: Calling API for '%s' from %s",
+                        sensor_name,
+                        team_id,
+                        url,
+                    )
+                    if r.status == 200:
+                        data = await r.json()
+            except:
+                data = None
 
             num_events = 0
             if data is not None:
@@ -443,19 +444,18 @@ class TeamTrackerDataUpdateCoordinator(DataUpdateCoordinator):
 
                 url = URL_HEAD + sport_path + "/" + league_path + URL_TAIL + url_parms
 
-                async with aiohttp.ClientSession() as session:
-                    try:
-                        async with session.get(url, headers=headers) as r:
-                            _LOGGER.debug(
-                                "%s: Calling API without date constraint for '%s' from %s",
-                                sensor_name,
-                                team_id,
-                                url,
-                            )
-                            if r.status == 200:
-                                data = await r.json()
-                    except:
-                        data = None
+                try:
+                    async with session.get(url, headers=headers) as r:
+                        _LOGGER.debug(
+                            "%s: Calling API without date constraint for '%s' from %s",
+                            sensor_name,
+                            team_id,
+                            url,
+                        )
+                        if r.status == 200:
+                            data = await r.json()
+                except:
+                    data = None
 
                 num_events = 0
                 if data is not None:
@@ -487,19 +487,18 @@ class TeamTrackerDataUpdateCoordinator(DataUpdateCoordinator):
 
                 url = URL_HEAD + sport_path + "/" + league_path + URL_TAIL + url_parms
 
-                async with aiohttp.ClientSession() as session:
-                    try:
-                        async with session.get(url, headers=headers) as r:
-                            _LOGGER.debug(
-                                "%s: Calling API without language for '%s' from %s",
-                                sensor_name,
-                                team_id,
-                                url,
-                            )
-                            if r.status == 200:
-                                data = await r.json()
-                    except:
-                        data = None
+                try:
+                    async with session.get(url, headers=headers) as r:
+                        _LOGGER.debug(
+                            "%s: Calling API without language for '%s' from %s",
+                            sensor_name,
+                            team_id,
+                            url,
+                        )
+                        if r.status == 200:
+                            data = await r.json()
+                except:
+                    data = None
         self.api_url = url
         
         return data, file_override
@@ -543,6 +542,7 @@ class TeamTrackerDataUpdateCoordinator(DataUpdateCoordinator):
             DEFAULT_LOGO,
             team_id,
             lang,
+            self.feed.get_index(data) if self.feed is not None else None,
         )
 
         return values
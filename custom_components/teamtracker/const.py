@@ -190,6 +190,14 @@ DEFAULT_KICKOFF_IN = "{test} days"
 DEFAULT_REFRESH_RATE = timedelta(minutes=10)
 RAPID_REFRESH_RATE = timedelta(seconds=5)
 
+# Attributes that change on most polls without anything meaningful happening,
+#   a change to only these is written at most once per LOW_PRIORITY_REFRESH_RATE
+LOW_PRIORITY_ATTRIBUTES = ("kickoff_in", "last_update")
+# Prefix added to api_message when the data came from the feed cache,
+#   api_message is compared without it so only the prefix itself is low priority
+CACHED_API_MESSAGE = "Cached data"
+LOW_PRIORITY_REFRESH_RATE = DEFAULT_REFRESH_RATE
+
 # Services
 SERVICE_NAME_CALL_API = "call_api"
 
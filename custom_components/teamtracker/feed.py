@@ -0,0 +1,125 @@
+""" League scoreboard feed shared by all sensors following the same league """
+import asyncio
+from datetime import datetime, timezone
+import logging
+import weakref
+
+from .scoreboard import ScoreboardIndex
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LeagueFeed:
+    """Scoreboard for one sport:league:conference:lang key, fetched once for every sensor using it"""
+
+    feeds = {}
+
+    def __init__(self, key):
+        """Initialize."""
+        self.key = key
+        self.data = None
+        self.file_override = False
+        self.api_url = ""
+        self.last_update = None
+        self.api_calls = 0
+        self.api_calls_saved = 0
+        self._fetch = None
+        self._index = None
+        self._coordinators = weakref.WeakSet()
+
+    #
+    #  Return the feed for the key, creating it the first time it is used
+    #
+    @classmethod
+    def get(cls, key):
+        """Return the feed for a key."""
+
+        feed = cls.feeds.get(key)
+        if feed is None:
+            feed = cls.feeds[key] = cls(key)
+        return feed
+
+    def subscribe(self, coordinator):
+        """Add a coordinator using this feed."""
+        self._coordinators.add(coordinator)
+
+    def unsubscribe(self, coordinator):
+        """Remove a coordinator using this feed."""
+        self._coordinators.discard(coordinator)
+
+    def get_index(self, data) -> ScoreboardIndex:
+        """Return the index for the data, built once for all sensors using the feed."""
+
+        if self._index is None or self._index.data is not data:
+            self._index = ScoreboardIndex(data)
+        return self._index
+
+    def invalidate(self):
+        """Force the next request to call the API."""
+        self.last_update = None
+
+    #
+    #  The feed is refreshed at the rate of the fastest sensor following it, so a sensor
+    #    with a game in progress keeps the data fresh for every other sensor in the league
+    #
+    @property
+    def refresh_interval(self):
+        """Return the shortest update interval of the coordinators using this feed."""
+
+        intervals = [
+            coordinator.update_interval
+            for coordinator in self._coordinators
+            if coordinator.update_interval is not None
+        ]
+        return min(intervals) if intervals else None
+
+    def is_expired(self, interval) -> bool:
+        """Return True if the data is older than the interval or the refresh interval."""
+
+        if self.last_update is None:
+            return True
+        if (refresh_interval := self.refresh_interval) is not None:
+            interval = min(interval, refresh_interval)
+        return datetime.now(timezone.utc) >= self.last_update + interval
+
+    #
+    #  Return (data, file_override, cached).  Only one API call is made at a time for the feed,
+    #    sensors asking while it is in flight wait for its result instead of making their own.
+    #
+    async def async_get(self, sensor_name, interval, async_fetch):
+        """Return the scoreboard, calling async_fetch only if it has expired."""
+
+        if self._fetch is None and not self.is_expired(interval):
+            self.api_calls_saved += 1
+            return self.data, self.file_override, True
+
+        if self._fetch is not None:
+            self.api_calls_saved += 1
+            _LOGGER.debug("%s: Waiting for API call in progress for '%s'", sensor_name, self.key)
+            await asyncio.shield(self._fetch)
+            return self.data, self.file_override, True
+
+        # Run the call as its own task so a sensor timing out does not cancel it for the others
+        self._fetch = asyncio.ensure_future(self._async_fetch(async_fetch))
+        await asyncio.shield(self._fetch)
+        _LOGGER.debug(
+            "%s: API calls for '%s': %d, saved by sharing: %d",
+            sensor_name,
+            self.key,
+            self.api_calls,
+            self.api_calls_saved,
+        )
+        return self.data, self.file_override, False
+
+    async def _async_fetch(self, async_fetch):
+        """Call the API and store the result."""
+
+        try:
+            self.api_calls += 1
+            data, file_override, api_url = await async_fetch()
+            self.data = data
+            self.file_override = file_override
+            self.api_url = api_url
+            self.last_update = datetime.now(timezone.utc)
+        finally:
+            self._fetch = None
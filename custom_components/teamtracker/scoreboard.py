@@ -0,0 +1,221 @@
+""" Index of a league scoreboard so each sensor finds its competitions by lookup """
+
+from datetime import datetime
+import logging
+import re
+
+_LOGGER = logging.getLogger(__name__)
+
+# How a competitor was matched, in the order the checks are made for a single competitor
+MATCH_WILDCARD = 0
+MATCH_ABBREVIATION = 1
+MATCH_ID = 2
+MATCH_NAME = 3
+MATCH_ROSTER = 4
+MATCH_EVENT_NAME = 5
+MATCH_ATHLETE = 6
+
+
+class ScoreboardEntry:
+    """A competitor in a competition, with the values used to search for it"""
+
+    __slots__ = (
+        "position",
+        "event",
+        "event_index",
+        "grouping_index",
+        "competition_index",
+        "competitor_index",
+        "type",
+        "abbreviation",
+        "id",
+        "name",
+        "roster",
+        "athlete",
+        "team0_abbreviation",
+        "event_shortname",
+    )
+
+    def __init__(self, position, event, event_index, grouping_index, competition_index, competitor_index, competition, competitor):
+        """Initialize."""
+
+        self.position = position
+        self.event = event
+        self.event_index = event_index
+        self.grouping_index = grouping_index
+        self.competition_index = competition_index
+        self.competitor_index = competitor_index
+        self.type = competitor.get("type")
+
+        team = competitor.get("team") or {}
+        self.abbreviation = team.get("abbreviation", "")
+        self.id = str(team.get("id", ""))
+        self.name = str(team.get("displayName", "")).upper()
+        self.roster = str((competitor.get("roster") or {}).get("displayName", "")).upper()
+        self.athlete = str((competitor.get("athlete") or {}).get("displayName", "")).upper()
+
+        self.team0_abbreviation = ""
+        self.event_shortname = ""
+        if competitor_index == 1:
+            try:
+                self.team0_abbreviation = str(competition["competitors"][0]["team"]["abbreviation"])
+            except (KeyError, IndexError, TypeError):
+                pass
+            self.event_shortname = event.get("shortName", "")
+
+
+class ScoreboardIndex:
+    """Competitors of a scoreboard indexed by team abbreviation, id and name, built once per API response"""
+
+    def __init__(self, data):
+        """Build the index."""
+
+        self.data = data
+        self.entries = []
+        self.first_date = None
+        self.last_date = None
+        self._teams = {}
+        self._athletes = []
+        self._matches = {}
+
+        for event_index, event in enumerate(data.get("events") or []):
+            competitions = [
+                (grouping_index, competition_index, competition)
+                for grouping_index, grouping in enumerate(event.get("groupings") or [])
+                for competition_index, competition in enumerate(grouping.get("competitions") or [])
+            ]
+            if not event.get("groupings"):
+                competitions = [
+                    (-1, competition_index, competition)
+                    for competition_index, competition in enumerate(event.get("competitions") or [])
+                ]
+
+            for grouping_index, competition_index, competition in competitions:
+                self._add_competition_date(event, competition)
+                for competitor_index, competitor in enumerate(competition.get("competitors") or []):
+                    self._add_entry(
+                        ScoreboardEntry(
+                            len(self.entries),
+                            event,
+                            event_index,
+                            grouping_index,
+                            competition_index,
+                            competitor_index,
+                            competition,
+                            competitor,
+                        )
+                    )
+
+    def _add_competition_date(self, event, competition):
+        """Track the first and last competition dates for the not found message"""
+
+        try:
+            competition_date = datetime.strptime(
+                competition.get("date", event.get("date")), "%Y-%m-%dT%H:%Mz"
+            )
+        except (TypeError, ValueError):
+            return
+        if self.first_date is None or competition_date < self.first_date:
+            self.first_date = competition_date
+        if self.last_date is None or competition_date > self.last_date:
+            self.last_date = competition_date
+
+    def _add_entry(self, entry):
+        """Add an entry to the lookups for its competitor type"""
+
+        self.entries.append(entry)
+        if entry.type == "team":
+            for kind, value in (
+                (MATCH_ABBREVIATION, entry.abbreviation),
+                (MATCH_ID, entry.id),
+                (MATCH_NAME, entry.name),
+                (MATCH_ROSTER, entry.roster),
+            ):
+                if value:
+                    self._teams.setdefault((kind, value), []).append(entry)
+            if " " in entry.event_shortname:
+                first = entry.event_shortname.partition(" ")[0]
+                last = entry.event_shortname.rpartition(" ")[2]
+                self._teams.setdefault((MATCH_EVENT_NAME, first), []).append(entry)
+                if last != first:
+                    self._teams.setdefault((MATCH_EVENT_NAME, last), []).append(entry)
+        elif entry.type == "athlete":
+            self._athletes.append(entry)
+
+    #
+    #  Return [(entry, match_kind)] for the search key in scoreboard order.  Results are kept, so
+    #    sensors following the same team on this scoreboard share the search.
+    #
+    def find(self, search_key, sensor_name):
+        """Return the competitors matching the search key"""
+
+        if (matches := self._matches.get(search_key)) is None:
+            matches = self._matches[search_key] = self._find(search_key, sensor_name)
+        return matches
+
+    def _find(self, search_key, sensor_name):
+        """Search the scoreboard for the search key"""
+
+        if search_key == "*":
+            return [(entry, MATCH_WILDCARD) for entry in self.entries]
+
+        found = {}
+
+        def add(entry, kind):
+            if entry.position not in found or kind < found[entry.position][1]:
+                found[entry.position] = (entry, kind)
+
+        for kind in (MATCH_ABBREVIATION, MATCH_ID):
+            for entry in self._teams.get((kind, search_key), ()):
+                add(entry, kind)
+
+        try:
+            pattern = re.compile(search_key)
+        except re.error as e:
+            _LOGGER.warning(
+                "%s: Invalid regular expression '%s' in search key (exception %s)",
+                sensor_name,
+                search_key,
+                e,
+            )
+            pattern = None
+
+        if pattern is not None:
+            if re.escape(search_key) == search_key:
+                # Without regex syntax a full match is an equal string, so look it up
+                for kind in (MATCH_NAME, MATCH_ROSTER):
+                    for entry in self._teams.get((kind, search_key), ()):
+                        add(entry, kind)
+            else:
+                for entry in self.entries:
+                    if entry.type != "team":
+                        continue
+                    if entry.name and pattern.fullmatch(entry.name):
+                        add(entry, MATCH_NAME)
+                    elif entry.roster and pattern.fullmatch(entry.roster):
+                        add(entry, MATCH_ROSTER)
+
+            # Abbreviations in event_name can be different than team_abbr
+            if " " in search_key:
+                candidates = [
+                    entry
+                    for entry in self.entries
+                    if entry.type == "team" and entry.event_shortname
+                ]
+            else:
+                candidates = self._teams.get((MATCH_EVENT_NAME, search_key), ())
+            for entry in candidates:
+                if search_key != entry.team0_abbreviation and (
+                    entry.event_shortname.startswith(search_key + " ")
+                    or entry.event_shortname.endswith(" " + search_key)
+                ):
+                    add(entry, MATCH_EVENT_NAME)
+
+        for entry in self._athletes:
+            if search_key in entry.athlete or (
+                pattern is not None and pattern.fullmatch(entry.athlete)
+            ):
+                add(entry, MATCH_ATHLETE)
+
+        return [found[position] for position in sorted(found)]
+
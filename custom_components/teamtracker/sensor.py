@@ -8,16 +8,17 @@ from homeassistant.components.persistent_notification import async_create
 from homeassistant.components.sensor import PLATFORM_SCHEMA
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_ATTRIBUTION, CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.util import slugify
+from homeassistant.util import dt as dt_util, slugify
 
 from . import TeamTrackerDataUpdateCoordinator
 from .const import (
     ATTRIBUTION,
+    CACHED_API_MESSAGE,
     CONF_API_LANGUAGE,
     CONF_CONFERENCE_ID,
     CONF_LEAGUE_ID,
@@ -33,6 +34,8 @@ from .const import (
     DOMAIN,
     ISSUE_URL,
     LEAGUE_MAP,
+    LOW_PRIORITY_ATTRIBUTES,
+    LOW_PRIORITY_REFRESH_RATE,
     SPORT_ICON_MAP,
     VERSION,
 )
@@ -151,9 +154,19 @@ async def async_setup_entry(
     async_add_entities([TeamTrackerScoresSensor(hass, entry, None)], True)
 
 
+def _uncached_api_message(api_message):
+    """Return the api_message without the cached data prefix."""
+
+    if isinstance(api_message, str) and api_message.startswith(CACHED_API_MESSAGE):
+        api_message = api_message[len(CACHED_API_MESSAGE):].removeprefix(": ")
+    return api_message or None
+
+
 class TeamTrackerScoresSensor(CoordinatorEntity):
     """Representation of a Sensor."""
 
+    total_suppressed_writes = 0
+
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry, config: ConfigType) -> None:
         """Initialize the sensor."""
 
@@ -269,6 +282,10 @@ class TeamTrackerScoresSensor(CoordinatorEntity):
         self._api_message = None
         self._api_url = None
 
+        self._published = None
+        self._published_at = None
+        self.suppressed_writes = 0
+
     @property
     def unique_id(self) -> str:
         """
@@ -396,3 +413,50 @@ class TeamTrackerScoresSensor(CoordinatorEntity):
     def available(self) -> bool:
         """Return if entity is available."""
         return self.coordinator.last_update_success
+
+    #
+    #  Only write the state when something meaningful changed.  During a game the coordinator
+    #    refreshes every few seconds, and writing each refresh fills the recorder with rows
+    #    that differ only in last_update or kickoff_in.
+    #
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+
+        published = (self.available, self.state, self.extra_state_attributes)
+        now = dt_util.utcnow()
+
+        if self._published is not None and not self._has_meaningful_change(published):
+            if now - self._published_at < LOW_PRIORITY_REFRESH_RATE:
+                self.suppressed_writes += 1
+                TeamTrackerScoresSensor.total_suppressed_writes += 1
+                return
+
+        if self.suppressed_writes:
+            _LOGGER.debug(
+                "%s: Writing state, %s writes suppressed so far (%s for all sensors)",
+                self._name,
+                self.suppressed_writes,
+                TeamTrackerScoresSensor.total_suppressed_writes,
+            )
+        self._published = published
+        self._published_at = now
+        super()._handle_coordinator_update()
+
+    def _has_meaningful_change(self, published) -> bool:
+        """Return True if the availability, state or a non low priority attribute changed."""
+
+        available, state, attrs = published
+        prev_available, prev_state, prev_attrs = self._published
+
+        if available != prev_available or state != prev_state or attrs.keys() != prev_attrs.keys():
+            return True
+        if _uncached_api_message(attrs.get("api_message")) != _uncached_api_message(
+            prev_attrs.get("api_message")
+        ):
+            return True
+        return any(
+            attrs[key] != prev_attrs[key]
+            for key in attrs
+            if key not in LOW_PRIORITY_ATTRIBUTES and key != "api_message"
+        )
@@ -42,11 +42,13 @@ from .const import (
     DOMAIN,
     HASS_DATA_CONFIG,
     HASS_DATA_COORDINATORS,
+    HASS_DATA_SYMBOL_REGISTRY,
     MANUAL_SCAN_INTERVAL,
     MINIMUM_SCAN_INTERVAL,
     SERVICE_REFRESH,
 )
 from .coordinator import CrumbCoordinator, YahooSymbolUpdateCoordinator
+from .registry import SymbolRegistry
 
 _LOGGER = logging.getLogger(__name__)
 BASIC_SYMBOL_SCHEMA = vol.All(cv.string, vol.Upper)
@@ -243,6 +245,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             return
 
         coordinators: dict[timedelta, YahooSymbolUpdateCoordinator] = {}
+        registry = SymbolRegistry()
         for key_scan_interval, symbols in symbols_by_scan_interval.items():
             _LOGGER.info(
                 "Creating coordinator with scan_interval %s for symbols %s",
@@ -253,6 +256,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                 symbols, hass, key_scan_interval, crumb_coordinator
             )
             coordinators[key_scan_interval] = coordinator
+            registry.add_coordinator(coordinator)
 
             _LOGGER.info(
                 "Requesting initial data from coordinator with update interval of %s",
@@ -262,13 +266,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
         # Pass down the coordinator to platforms.
         hass.data[DOMAIN][HASS_DATA_COORDINATORS] = coordinators
+        hass.data[DOMAIN][HASS_DATA_SYMBOL_REGISTRY] = registry
 
         async def handle_refresh_symbols(_call) -> None:
             """Refresh symbol data."""
             _LOGGER.info("Processing refresh_symbols")
 
             for coordinator in coordinators.values():
-                await coordinator.async_refresh()
+                await coordinator.async_refresh_all_symbols()
 
         hass.services.async_register(
             DOMAIN,
@@ -22,6 +22,7 @@ ATTR_TRAILING_PE: Final = "trailingPE"
 # Hass data
 HASS_DATA_CONFIG: Final = "config"
 HASS_DATA_COORDINATORS: Final = "coordinators"
+HASS_DATA_SYMBOL_REGISTRY: Final = "symbol_registry"
 
 # JSON data pieces
 DATA_CURRENCY_SYMBOL: Final = "currency"
@@ -30,6 +31,7 @@ DATA_QUOTE_TYPE: Final = "quoteType"
 DATA_QUOTE_SOURCE_NAME: Final = "quoteSourceName"
 DATA_SHORT_NAME: Final = "shortName"
 DATA_MARKET_STATE: Final = "marketState"
+DATA_EXCHANGE: Final = "exchange"
 DATA_DIVIDEND_DATE: Final = "dividendDate"
 DATA_REGULAR_MARKET_TIME: Final = "regularMarketTime"
 DATA_PRE_MARKET_TIME: Final = "preMarketTime"
@@ -133,6 +135,7 @@ STRING_DATA_KEYS: Final = [
     DATA_QUOTE_SOURCE_NAME,
     DATA_SHORT_NAME,
     DATA_MARKET_STATE,
+    DATA_EXCHANGE,
 ]
 
 
@@ -173,6 +176,18 @@ CRUMB_RETRY_DELAY: Final = 15
 CRUMB_RETRY_DELAY_429: Final = 60
 """Duration for crumb re-try when receiving 429 code."""
 
+MAX_SYMBOLS_PER_REQUEST: Final = 40
+"""Symbols are requested in chunks of this size to keep the URLs short."""
+
+MAX_PARALLEL_REQUESTS: Final = 4
+"""Number of chunk requests made at the same time."""
+
+OPEN_MARKET_STATES: Final = ("PRE", "REGULAR", "POST")
+"""Market states in which prices change."""
+
+CLOSED_MARKET_SCAN_INTERVAL: Final = timedelta(minutes=15)
+"""Refresh interval for symbols whose exchange is closed."""
+
 CURRENCY_CODES: Final = {
     "aud": "$",
     "bdt": "৳",
@@ -7,12 +7,12 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, timedelta
 from http import HTTPStatus
 from http.cookies import SimpleCookie
 import logging
 import re
-from typing import Final
+from typing import TYPE_CHECKING, Final
 
 import aiohttp
 
@@ -26,20 +26,29 @@ from homeassistant.util.dt import utcnow
 # from homeassistant.util.file import write_utf8_file
 from .const import (
     BASE,
+    CLOSED_MARKET_SCAN_INTERVAL,
     CONSENT_HOST,
     CRUMB_RETRY_DELAY,
     CRUMB_RETRY_DELAY_429,
+    DATA_EXCHANGE,
+    DATA_MARKET_STATE,
     DATA_REGULAR_MARKET_PRICE,
     GET_CRUMB_URL,
     INITIAL_REQUEST_HEADERS,
     INITIAL_URL,
     MANUAL_SCAN_INTERVAL,
+    MAX_PARALLEL_REQUESTS,
+    MAX_SYMBOLS_PER_REQUEST,
     NUMERIC_DATA_DEFAULTS,
     NUMERIC_DATA_GROUPS,
+    OPEN_MARKET_STATES,
     REQUEST_HEADERS,
     STRING_DATA_KEYS,
 )
 
+if TYPE_CHECKING:
+    from .registry import SymbolRegistry
+
 _LOGGER = logging.getLogger(__name__)
 REQUEST_TIMEOUT: Final = 10
 DELAY_ASYNC_REQUEST_REFRESH: Final = 5
@@ -64,6 +73,9 @@ class CrumbCoordinator:
         self.retry_duration = CRUMB_RETRY_DELAY
         """Crumb retry request delay."""
 
+        self._crumb_lock = asyncio.Lock()
+        """Lock so that parallel requests needing a crumb only get it once."""
+
     @staticmethod
     def getStaticInstance(hass: HomeAssistant) -> CrumbCoordinator:
         """Return the static CrumbCoordinator instance."""
@@ -75,6 +87,17 @@ class CrumbCoordinator:
         """Reset crumb and cookies."""
         self.crumb = self.cookies = None
 
+    async def async_get_crumb(self) -> str | None:
+        """Return the crumb, getting it if needed.
+
+        Parallel requests missing the crumb wait for a single crumb request.
+        """
+        if self.crumb is None:
+            async with self._crumb_lock:
+                if self.crumb is None:
+                    await self.try_get_crumb_cookies()
+        return self.crumb
+
     async def try_get_crumb_cookies(self) -> str | None:
         """Try to get crumb and cookies for data requests."""
 
@@ -351,6 +374,18 @@ class YahooSymbolUpdateCoordinator(DataUpdateCoordinator):
         self.websession = async_get_clientsession(hass)
         self._failure_update_interval = timedelta(seconds=FAILURE_ASYNC_REQUEST_REFRESH)
         self._cc = cc
+        self._fingerprints: dict[str, int] = {}
+
+        self.changed_symbols: set[str] = set()
+        """Symbols whose data changed in the last refresh."""
+
+        self._exchange_refresh: dict[str, datetime] = {}
+        """Time at which the symbols of each exchange are next requested."""
+
+        self._refresh_all = False
+
+        self.registry: SymbolRegistry | None = None
+        """Registry of the symbols of all coordinators, set by SymbolRegistry.add_coordinator."""
 
         if isinstance(update_interval, str) and update_interval == MANUAL_SCAN_INTERVAL:
             update_interval = None
@@ -368,7 +403,10 @@ class YahooSymbolUpdateCoordinator(DataUpdateCoordinator):
     def get_next_update_interval(self) -> timedelta:
         """Get the update interval for the next async_track_point_in_utc_time call."""
         if self.last_update_success:
-            return self._update_interval
+            if self._update_interval is None:
+                return None
+
+            return max(self._update_interval, self.get_next_refresh_delay())
 
         _LOGGER.warning(
             "Error obtaining data, retrying in %d seconds",
@@ -400,6 +438,74 @@ class YahooSymbolUpdateCoordinator(DataUpdateCoordinator):
         """Return symbols tracked by the coordinator."""
         return self._symbols
 
+    def get_exchange(self, symbol: str) -> str | None:
+        """Return the exchange of the symbol, None if it is not known yet."""
+        symbol_data = (self.data or {}).get(symbol)
+        return None if symbol_data is None else symbol_data.get(DATA_EXCHANGE)
+
+    def get_due_symbols(self, now: datetime) -> list[str]:
+        """Return the symbols to request.
+
+        Symbols are grouped by exchange, the symbols of an exchange are requested every
+        update interval while it is open and every CLOSED_MARKET_SCAN_INTERVAL otherwise.
+        Symbols of an unknown exchange are always requested.
+        """
+        if self._refresh_all or self._update_interval is None:
+            return self._symbols.copy()
+
+        due_symbols = []
+        for symbol in self._symbols:
+            next_refresh = self._exchange_refresh.get(self.get_exchange(symbol))
+            if next_refresh is None or next_refresh <= now:
+                due_symbols.append(symbol)
+
+        return due_symbols
+
+    def get_next_refresh_delay(self) -> timedelta:
+        """Return the delay until the symbols of an exchange are due."""
+        next_refresh = None
+        for symbol in self._symbols:
+            exchange_refresh = self._exchange_refresh.get(self.get_exchange(symbol))
+            if exchange_refresh is None:
+                return self._update_interval
+            if next_refresh is None or exchange_refresh < next_refresh:
+                next_refresh = exchange_refresh
+
+        if next_refresh is None:
+            return self._update_interval
+
+        return next_refresh - utcnow().replace(microsecond=0)
+
+    def update_exchange_refresh(
+        self, symbols: list[str], data: dict, now: datetime
+    ) -> None:
+        """Schedule the exchanges of the refreshed symbols based on their market state."""
+        if self._update_interval is None:
+            return
+
+        exchanges_open: dict[str, bool] = {}
+        for symbol in symbols:
+            symbol_data = data.get(symbol)
+            if symbol_data is None or symbol_data[DATA_EXCHANGE] is None:
+                continue
+
+            exchange = symbol_data[DATA_EXCHANGE]
+            is_open = symbol_data[DATA_MARKET_STATE] in OPEN_MARKET_STATES
+            exchanges_open[exchange] = exchanges_open.get(exchange, False) or is_open
+
+        closed_interval = max(self._update_interval, CLOSED_MARKET_SCAN_INTERVAL)
+        for exchange, is_open in exchanges_open.items():
+            self._exchange_refresh[exchange] = now + (
+                self._update_interval if is_open else closed_interval
+            )
+
+        _LOGGER.debug("Exchanges open=%s", exchanges_open)
+
+    async def async_refresh_all_symbols(self) -> None:
+        """Refresh all symbols, including the symbols of closed exchanges."""
+        self._refresh_all = True
+        await self.async_refresh()
+
     async def _async_request_refresh_later(self, _now):
         """Request async_request_refresh."""
         await self.async_request_refresh()
@@ -408,6 +514,8 @@ class YahooSymbolUpdateCoordinator(DataUpdateCoordinator):
         """Add symbol to the symbol list."""
         if symbol not in self._symbols:
             self._symbols.append(symbol)
+            if self.registry is not None:
+                self.registry.add_symbol(symbol, self)
 
             # Request a refresh to get data for the missing symbol.
             # This would have been called while data for sensor was being parsed.
@@ -428,10 +536,20 @@ class YahooSymbolUpdateCoordinator(DataUpdateCoordinator):
 
         return False
 
-    async def get_json(self) -> dict:
-        """Get the JSON data."""
+    def get_symbol_chunks(self, symbols: list[str] | None = None) -> list[list[str]]:
+        """Return the symbols, all symbols if not specified, split into chunks of MAX_SYMBOLS_PER_REQUEST."""
+        if symbols is None:
+            symbols = self._symbols
 
-        url = await self.build_request_url()
+        return [
+            symbols[index : index + MAX_SYMBOLS_PER_REQUEST]
+            for index in range(0, len(symbols), MAX_SYMBOLS_PER_REQUEST)
+        ]
+
+    async def get_json(self, symbols: list[str] | None = None) -> dict:
+        """Get the JSON data for the symbols, all symbols if not specified."""
+
+        url = await self.build_request_url(symbols)
         cookies = self._cc.cookies
         _LOGGER.debug("Requesting data from '%s'", url)
 
@@ -469,7 +587,7 @@ class YahooSymbolUpdateCoordinator(DataUpdateCoordinator):
 
                     # Reset crumb so that it gets recalculated
                     if finance_error_code == "Unauthorized":
-                        _LOGGER.log("Resetting crumbs")
+                        _LOGGER.info("Resetting crumbs")
                         self._cc.reset()
 
                 else:
@@ -487,13 +605,11 @@ class YahooSymbolUpdateCoordinator(DataUpdateCoordinator):
 
         return None
 
-    async def build_request_url(self) -> str:
-        """Build the request url."""
-        url = BASE + ",".join(self._symbols)
+    async def build_request_url(self, symbols: list[str] | None = None) -> str:
+        """Build the request url for the symbols, all symbols if not specified."""
+        url = BASE + ",".join(self._symbols if symbols is None else symbols)
 
-        crumb = self._cc.crumb
-        if crumb is None:
-            crumb = await self._cc.try_get_crumb_cookies()
+        crumb = await self._cc.async_get_crumb()
         if crumb is not None:
             url = url + "&crumb=" + crumb
 
@@ -518,7 +634,74 @@ class YahooSymbolUpdateCoordinator(DataUpdateCoordinator):
         which also updates last_update_success. UpdateFailed is raised if JSON is invalid.
         """
 
-        json = await self.get_json()
+        self.changed_symbols = set()
+
+        # Times are floored like in _schedule_refresh so that a refresh scheduled for
+        # an exchange finds its symbols due.
+        now = utcnow().replace(microsecond=0)
+        due_symbols = self.get_due_symbols(now)
+        self._refresh_all = False
+
+        if self._symbols and not due_symbols:
+            _LOGGER.debug("No symbols due [interval=%s]", self._update_interval)
+            return self.data
+
+        chunks = self.get_symbol_chunks(due_symbols)
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_REQUESTS)
+
+        async def get_chunk_result(symbols: list[str]) -> list | UpdateFailed:
+            async with semaphore:
+                try:
+                    return self.get_result(await self.get_json(symbols))
+                except UpdateFailed as ex:
+                    return ex
+
+        chunk_results = await asyncio.gather(*map(get_chunk_result, chunks))
+
+        result = []
+        failures = []
+        refreshed_symbols = []
+        for symbols, chunk_result in zip(chunks, chunk_results):
+            if isinstance(chunk_result, UpdateFailed):
+                failures.append(chunk_result)
+            else:
+                result.extend(chunk_result)
+                refreshed_symbols.extend(symbols)
+
+        if failures:
+            if len(failures) == len(chunk_results):
+                raise failures[0]
+            # Data from the failed chunks is kept from the previous refresh
+            _LOGGER.warning(
+                "%d of %d requests failed: %s", len(failures), len(chunks), failures
+            )
+
+        (error_encountered, data) = self.process_json_result(result, due_symbols)
+        self.update_exchange_refresh(refreshed_symbols, data, now)
+
+        if self.registry is not None and any(
+            symbol.endswith("=X") for symbol in self.changed_symbols
+        ):
+            self.registry.invalidate_rates()
+
+        if error_encountered:
+            _LOGGER.info("Data = %s", result)
+        else:
+            _LOGGER.debug("Data = %s", result)
+
+        _LOGGER.info(
+            "Data updated [interval=%s, symbols=%d/%d, requests=%d, changed=%d]",
+            self._update_interval,
+            len(due_symbols),
+            len(self._symbols),
+            len(chunks),
+            len(self.changed_symbols),
+        )
+        return data
+
+    @staticmethod
+    def get_result(json: dict | None) -> list:
+        """Return the quote result from the JSON, UpdateFailed is raised if JSON is invalid."""
 
         if json is None:
             raise UpdateFailed("No data received")
@@ -539,25 +722,20 @@ class YahooSymbolUpdateCoordinator(DataUpdateCoordinator):
         if result is None:
             raise UpdateFailed("Data invalid, 'result' is None")
 
-        (error_encountered, data) = self.process_json_result(result)
+        return result
 
-        if error_encountered:
-            _LOGGER.info("Data = %s", result)
-        else:
-            _LOGGER.debug("Data = %s", result)
-
-        _LOGGER.info("Data updated [interval=%s]", self._update_interval)
-        return data
-
-    def process_json_result(self, result) -> tuple[bool, dict]:
-        """Process json result and return (error status, updated data)."""
+    def process_json_result(
+        self, result, symbols: list[str] | None = None
+    ) -> tuple[bool, dict]:
+        """Process json result for the requested symbols, all symbols if not specified, and return (error status, updated data)."""
 
         # Using current data if available. If returned data is missing then we might be
         # able to use previous data.
         data = self.data or {}
 
-        symbols = self._symbols.copy()
+        symbols = (self._symbols if symbols is None else symbols).copy()
         error_encountered = False
+        changed_symbols = set()
 
         for symbol_data in result:
             symbol = symbol_data["symbol"]
@@ -579,6 +757,12 @@ class YahooSymbolUpdateCoordinator(DataUpdateCoordinator):
 
             data[symbol] = self.parse_symbol_data(symbol_data)
 
+            # Only sensors for symbols whose data changed need to be updated
+            fingerprint = hash(tuple(data[symbol].values()))
+            if self._fingerprints.get(symbol) != fingerprint:
+                self._fingerprints[symbol] = fingerprint
+                changed_symbols.add(symbol)
+
             _LOGGER.debug(
                 "Updated %s to %s",
                 symbol,
@@ -589,6 +773,7 @@ class YahooSymbolUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.warning("No data received for %s", symbols)
             error_encountered = True
 
+        self.changed_symbols = changed_symbols
         return (error_encountered, data)
 
 
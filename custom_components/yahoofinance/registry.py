@@ -0,0 +1,116 @@
+"""Symbol registry shared by the Yahoo finance coordinators and sensors."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+import logging
+import re
+from typing import TYPE_CHECKING, Final
+
+from .const import DATA_REGULAR_MARKET_PRICE
+
+if TYPE_CHECKING:
+    from .coordinator import YahooSymbolUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+CONVERSION_SYMBOL_PATTERN: Final = re.compile(r"^([A-Z]{3})([A-Z]{3})=X$")
+"""Conversion symbols have the format FROMTO=X, e.g. USDEUR=X."""
+
+
+class SymbolRegistry:
+    """Index of the symbols of all coordinators and of the currency rates between them.
+
+    Currency rates form a graph with the conversion symbols as edges, so a rate without
+    a conversion symbol can be computed through other currencies (EURJPY via USD). The
+    graph is built once after conversion symbol data changes and shared by all sensors.
+    """
+
+    def __init__(
+        self, coordinators: Iterable[YahooSymbolUpdateCoordinator] = ()
+    ) -> None:
+        """Initialize."""
+        self._coordinators: dict[str, YahooSymbolUpdateCoordinator] = {}
+        self._conversion_symbols: dict[str, tuple[str, str]] = {}
+        self._graph: dict[str, dict[str, float]] | None = None
+        self._rates: dict[tuple[str, str], float | None] = {}
+
+        for coordinator in coordinators:
+            self.add_coordinator(coordinator)
+
+    def add_coordinator(self, coordinator: YahooSymbolUpdateCoordinator) -> None:
+        """Add the symbols of the coordinator, symbols added later are added by the coordinator."""
+        coordinator.registry = self
+        for symbol in coordinator.get_symbols():
+            self.add_symbol(symbol, coordinator)
+
+    def add_symbol(self, symbol: str, coordinator: YahooSymbolUpdateCoordinator) -> None:
+        """Add a symbol tracked by the coordinator."""
+        self._coordinators.setdefault(symbol, coordinator)
+        if match := CONVERSION_SYMBOL_PATTERN.match(symbol):
+            self._conversion_symbols[symbol] = match.groups()
+            self.invalidate_rates()
+
+    def get_coordinator(self, symbol: str) -> YahooSymbolUpdateCoordinator | None:
+        """Return the coordinator tracking the symbol."""
+        return self._coordinators.get(symbol)
+
+    def get_symbol_data(self, symbol: str) -> dict | None:
+        """Return the data for the symbol."""
+        coordinator = self._coordinators.get(symbol)
+        if coordinator is None or coordinator.data is None:
+            return None
+
+        return coordinator.data.get(symbol)
+
+    def invalidate_rates(self) -> None:
+        """Rebuild the currency rates on the next request, called when conversion symbol data changed."""
+        self._graph = None
+        self._rates = {}
+
+    def _build_graph(self) -> dict[str, dict[str, float]]:
+        """Return the rates from each currency to the currencies it has a conversion symbol with."""
+        graph: dict[str, dict[str, float]] = {}
+
+        for symbol, (from_currency, to_currency) in self._conversion_symbols.items():
+            symbol_data = self.get_symbol_data(symbol)
+            if symbol_data is None:
+                continue
+
+            rate = symbol_data[DATA_REGULAR_MARKET_PRICE]
+            if not rate:
+                continue
+
+            graph.setdefault(from_currency, {})[to_currency] = rate
+            # A direct rate takes precedence over the inverse of the opposite symbol
+            graph.setdefault(to_currency, {}).setdefault(from_currency, 1 / rate)
+
+        _LOGGER.debug("Built currency graph for %d currencies", len(graph))
+        return graph
+
+    def get_conversion_rate(self, from_currency: str, to_currency: str) -> float | None:
+        """Return the rate converting from_currency to to_currency, None if it is not known.
+
+        The rate is computed along the path with the fewest conversions.
+        """
+        key = (from_currency.upper(), to_currency.upper())
+        if key in self._rates:
+            return self._rates[key]
+
+        if self._graph is None:
+            self._graph = self._build_graph()
+
+        (from_currency, to_currency) = key
+        rates = {from_currency: 1.0}
+        queue = deque([from_currency])
+        while queue and to_currency not in rates:
+            currency = queue.popleft()
+            for next_currency, rate in self._graph.get(currency, {}).items():
+                if next_currency not in rates:
+                    rates[next_currency] = rates[currency] * rate
+                    queue.append(next_currency)
+
+        rate = rates.get(to_currency)
+        self._rates[key] = rate
+        return rate
@@ -56,10 +56,12 @@ from .const import (
     DOMAIN,
     HASS_DATA_CONFIG,
     HASS_DATA_COORDINATORS,
+    HASS_DATA_SYMBOL_REGISTRY,
     NUMERIC_DATA_GROUPS,
     PERCENTAGE_DATA_KEYS_NEEDING_MULTIPLICATION,
 )
 from .coordinator import YahooSymbolUpdateCoordinator
+from .registry import SymbolRegistry
 
 _LOGGER = logging.getLogger(__name__)
 ENTITY_ID_FORMAT = SENSOR_DOMAIN + "." + DOMAIN + "_{}"
@@ -105,6 +107,9 @@ class YahooFinanceSensor(CoordinatorEntity, SensorEntity):
     _original_currency = None
     _last_available_timer = None
     _waiting_on_conversion = False
+    _conversion_symbol = None
+    _conversion = None
+    _last_update_success = None
 
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_device_class = None
@@ -121,6 +126,7 @@ class YahooFinanceSensor(CoordinatorEntity, SensorEntity):
 
         # Entity.hass is only populated after async_add_entities, use local reference to hass
         self._hass = hass
+        self._registry: SymbolRegistry = hass.data[DOMAIN][HASS_DATA_SYMBOL_REGISTRY]
 
         symbol = symbol_definition.symbol
         self._symbol = symbol
@@ -243,9 +249,35 @@ class YahooFinanceSensor(CoordinatorEntity, SensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if not self._needs_update():
+            _LOGGER.debug("%s unchanged, skipping update", self._symbol)
+            return
+
+        self._last_update_success = self.coordinator.last_update_success
         self.update_properties()
         super()._handle_coordinator_update()
 
+    def _needs_update(self) -> bool:
+        """Return True if the coordinator refresh changed data used by the sensor."""
+        coordinator = self.coordinator
+        if (
+            self._market_price is None
+            or self._waiting_on_conversion
+            or coordinator.last_update_success != self._last_update_success
+        ):
+            return True
+
+        if self._symbol in coordinator.changed_symbols:
+            return True
+
+        if self._conversion_symbol is None:
+            return False
+
+        # The rate can come from conversion symbols of any coordinator
+        return self._conversion != self._registry.get_conversion_rate(
+            self._original_currency, self._target_currency
+        )
+
     def _round(self, value: float | None) -> float | int | None:
         """Return formatted value based on decimal_places."""
         if value is None:
@@ -258,25 +290,10 @@ class YahooFinanceSensor(CoordinatorEntity, SensorEntity):
 
         return round(value, self._decimal_places)
 
-    def _find_symbol_data(self, symbol: str) -> any | None:
-        """Find data for the specified symbol in all coordinators."""
-        coordinators: dict[timedelta, YahooSymbolUpdateCoordinator] = self._hass.data[
-            DOMAIN
-        ][HASS_DATA_COORDINATORS]
-
-        if coordinators:
-            for coordinator in coordinators.values():
-                data = coordinator.data
-                if data is not None:
-                    symbol_data = data.get(symbol)
-                    if symbol_data is not None:
-                        return symbol_data
-
-        return None
-
     def _get_target_currency_conversion(self) -> float | None:
         value = None
         self._waiting_on_conversion = False
+        self._conversion_symbol = None
 
         if self._target_currency and self._original_currency:
             if self._target_currency == self._original_currency:
@@ -286,12 +303,15 @@ class YahooFinanceSensor(CoordinatorEntity, SensorEntity):
             conversion_symbol = (
                 f"{self._original_currency}{self._target_currency}=X".upper()
             )
+            self._conversion_symbol = conversion_symbol
 
-            # Locate conversion symbol in all coordinators
-            symbol_data = self._find_symbol_data(conversion_symbol)
+            # Rate from the conversion symbols of all coordinators, possibly through
+            # other currencies
+            value = self._registry.get_conversion_rate(
+                self._original_currency, self._target_currency
+            )
 
-            if symbol_data is not None:
-                value = symbol_data[DATA_REGULAR_MARKET_PRICE]
+            if value is not None:
                 _LOGGER.debug("%s %s is %s", self._symbol, conversion_symbol, value)
             else:
                 _LOGGER.info(
@@ -342,6 +362,7 @@ class YahooFinanceSensor(CoordinatorEntity, SensorEntity):
 
         self._update_original_currency(symbol_data)
         conversion = self._get_target_currency_conversion()
+        self._conversion = conversion
 
         self._short_name = symbol_data[DATA_SHORT_NAME]
 
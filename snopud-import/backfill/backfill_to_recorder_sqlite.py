@@ -4,6 +4,9 @@ import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
 
+# Both tables have a unique index on (metadata_id, start_ts)
+STATISTICS_TABLES = ("statistics", "statistics_short_term")
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Backfill SnoPUD monthly cumulative kWh and cost into Home Assistant Recorder (SQLite)")
@@ -12,6 +15,10 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--sensor-kwh", required=True, help="Entity ID for cumulative kWh sensor")
     parser.add_argument("--sensor-cost", required=True, help="Entity ID for cumulative USD cost sensor")
     parser.add_argument("--tz", default="America/Los_Angeles", help="Timezone name (for display only; timestamps stored as UTC)")
+    parser.add_argument("--bulk", action="store_true", help="Upsert in batches with one transaction per batch (needs SQLite 3.24+)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per transaction in bulk mode")
+    parser.add_argument("--table", choices=STATISTICS_TABLES, default="statistics", help="Statistics table to write in bulk mode")
+    parser.add_argument("--fast-pragmas", action="store_true", help="Use journal_mode=WAL and synchronous=NORMAL while writing")
     return parser.parse_args()
 
 
@@ -90,6 +97,50 @@ def upsert_statistic_sum(conn: sqlite3.Connection, statistic_id: str, start_ts:
     conn.commit()
 
 
+def get_metadata_id(conn: sqlite3.Connection, statistic_id: str) -> int:
+    cur = conn.execute("SELECT id FROM statistics_meta WHERE statistic_id = ?", (statistic_id,))
+    meta_row = cur.fetchone()
+    if not meta_row:
+        raise ValueError(f"No metadata found for {statistic_id}")
+    return meta_row[0]
+
+
+def set_fast_pragmas(conn: sqlite3.Connection):
+    # WAL keeps readers (a running Core) unblocked and NORMAL only syncs at checkpoints
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+
+
+def bulk_upsert_statistic_sums(conn: sqlite3.Connection, statistic_id: str, sums, table: str = "statistics", batch_size: int = 1000) -> int:
+    """Upsert (start, sum) pairs with one executemany and one transaction per batch, same result as upsert_statistic_sum."""
+    if table not in STATISTICS_TABLES:
+        raise ValueError(f"Unknown statistics table {table}")
+
+    metadata_id = get_metadata_id(conn, statistic_id)
+    sql = f"""
+        INSERT INTO {table} (created, created_ts, metadata_id, start, start_ts, mean, min, max, last_reset, last_reset_ts, state, sum, mean_weight)
+        VALUES (strftime('%Y-%m-%d %H:%M:%f','now'), strftime('%s','now'), ?, ?, ?, NULL, NULL, NULL, NULL, NULL, NULL, ?, NULL)
+        ON CONFLICT(metadata_id, start_ts) DO UPDATE
+        SET sum = excluded.sum, created = excluded.created, created_ts = excluded.created_ts
+        """
+
+    batch = []
+    count = 0
+    for start_ts, sum_value in sums:
+        aligned = start_ts.replace(minute=0, second=0, microsecond=0)
+        batch.append((metadata_id, aligned.isoformat(sep=" "), aligned.timestamp(), float(sum_value)))
+        if len(batch) >= batch_size:
+            with conn:
+                conn.executemany(sql, batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        with conn:
+            conn.executemany(sql, batch)
+        count += len(batch)
+    return count
+
+
 def main():
     args = parse_args()
     db_path = Path(args.db)
@@ -120,6 +171,8 @@ def main():
     # Cumulative sums
     cumulative_kwh = 0.0
     cumulative_usd = 0.0
+    kwh_sums = []
+    usd_sums = []
 
     def monthly_cost(kwh: float, days: int) -> float:
         base = 0.80 * days
@@ -127,17 +180,30 @@ def main():
         total = (base + energy) * 1.05
         return round(total, 2)
 
+    for p in periods:
+        days = (p["end"].date() - p["start"].date()).days or 30
+        cumulative_kwh += p["kwh"]
+        cumulative_usd += monthly_cost(p["kwh"], days)
+        kwh_sums.append((p["end"], cumulative_kwh))
+        usd_sums.append((p["end"], cumulative_usd))
+
+    if args.table != "statistics" and not args.bulk:
+        raise SystemExit("--table is only supported with --bulk")
+
     conn = sqlite3.connect(str(db_path))
     try:
+        if args.fast_pragmas:
+            set_fast_pragmas(conn)
         ensure_meta(conn, args.__dict__["sensor_kwh"], "kWh", "SnoPUD Grid kWh Total")
         ensure_meta(conn, args.__dict__["sensor_cost"], "USD", "SnoPUD Grid kWh Total Cost")
 
-        for p in periods:
-            days = (p["end"].date() - p["start"].date()).days or 30
-            cumulative_kwh += p["kwh"]
-            cumulative_usd += monthly_cost(p["kwh"], days)
-            upsert_statistic_sum(conn, args.__dict__["sensor_kwh"], p["end"], cumulative_kwh)
-            upsert_statistic_sum(conn, args.__dict__["sensor_cost"], p["end"], cumulative_usd)
+        if args.bulk:
+            bulk_upsert_statistic_sums(conn, args.sensor_kwh, kwh_sums, args.table, args.batch_size)
+            bulk_upsert_statistic_sums(conn, args.sensor_cost, usd_sums, args.table, args.batch_size)
+        else:
+            for (end, kwh_sum), (_, usd_sum) in zip(kwh_sums, usd_sums):
+                upsert_statistic_sum(conn, args.__dict__["sensor_kwh"], end, kwh_sum)
+                upsert_statistic_sum(conn, args.__dict__["sensor_cost"], end, usd_sum)
 
     finally:
         conn.close()
@@ -0,0 +1,147 @@
+import argparse
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import backfill_to_recorder_sqlite as backfill
+
+# The statistics tables of the Home Assistant Recorder schema, with the unique index the upserts rely on
+RECORDER_SCHEMA = """
+CREATE TABLE statistics_meta (
+    id INTEGER NOT NULL PRIMARY KEY,
+    statistic_id VARCHAR(255),
+    source VARCHAR(32),
+    unit_of_measurement VARCHAR(255),
+    has_mean BOOLEAN,
+    has_sum BOOLEAN,
+    name VARCHAR(255),
+    mean_type SMALLINT NOT NULL DEFAULT 0,
+    unit_class VARCHAR(255)
+);
+CREATE UNIQUE INDEX ix_statistics_meta_statistic_id ON statistics_meta (statistic_id);
+"""
+for _table in backfill.STATISTICS_TABLES:
+    RECORDER_SCHEMA += f"""
+CREATE TABLE {_table} (
+    id INTEGER NOT NULL PRIMARY KEY,
+    created DATETIME,
+    created_ts FLOAT,
+    metadata_id INTEGER,
+    start DATETIME,
+    start_ts FLOAT,
+    mean FLOAT,
+    mean_weight FLOAT,
+    min FLOAT,
+    max FLOAT,
+    last_reset DATETIME,
+    last_reset_ts FLOAT,
+    state FLOAT,
+    sum FLOAT,
+    FOREIGN KEY(metadata_id) REFERENCES statistics_meta (id) ON DELETE CASCADE
+);
+CREATE INDEX ix_{_table}_start_ts ON {_table} (start_ts);
+CREATE UNIQUE INDEX ix_{_table}_statistic_id_start_ts ON {_table} (metadata_id, start_ts);
+"""
+
+SENSORS = (("sensor.snopud_kwh_total", "kWh"), ("sensor.snopud_cost_total", "USD"))
+
+# Everything but the creation time, which is the time of the write
+COMPARED_COLUMNS = "id, metadata_id, start, start_ts, mean, mean_weight, min, max, last_reset, last_reset_ts, state, sum"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare the per-row and bulk backfill modes on a generated Recorder schema (SQLite)")
+    parser.add_argument("--hours", type=int, default=24 * 365, help="Hourly rows per sensor")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per transaction in bulk mode")
+    parser.add_argument("--dir", help="Directory for the generated databases, a temporary one if not set")
+    return parser.parse_args()
+
+
+def create_db(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(path))
+    conn.executescript(RECORDER_SCHEMA)
+    for statistic_id, unit in SENSORS:
+        backfill.ensure_meta(conn, statistic_id, unit, statistic_id)
+    return conn
+
+
+def generate_runs(hours: int):
+    """Return the (start, sum) pairs of each sensor for a first run and for a re-run over half the rows.
+
+    The re-run changes the sums and starts at half past, like an end time from Usage.csv.
+    """
+    first = datetime(2024, 1, 1)
+    runs = []
+    for offset, step in ((0, 0.75), (30, 0.8)):
+        runs.append(
+            {
+                statistic_id: [
+                    (first + timedelta(hours=hour, minutes=offset), hour * step * (index + 1))
+                    for hour in range(0, hours if offset == 0 else hours // 2)
+                ]
+                for index, (statistic_id, _unit) in enumerate(SENSORS)
+            }
+        )
+    return runs
+
+
+def write_per_row(conn: sqlite3.Connection, runs) -> None:
+    for run in runs:
+        for statistic_id, sums in run.items():
+            for start, sum_value in sums:
+                backfill.upsert_statistic_sum(conn, statistic_id, start, sum_value)
+
+
+def write_bulk(conn: sqlite3.Connection, runs, table: str, batch_size: int) -> None:
+    for run in runs:
+        for statistic_id, sums in run.items():
+            backfill.bulk_upsert_statistic_sums(conn, statistic_id, sums, table, batch_size)
+
+
+def dump(conn: sqlite3.Connection, table: str = "statistics"):
+    return conn.execute(f"SELECT {COMPARED_COLUMNS} FROM {table} ORDER BY id").fetchall()
+
+
+def main():
+    args = parse_args()
+    runs = generate_runs(args.hours)
+    rows = sum(len(sums) for run in runs for sums in run.values())
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_dir = Path(args.dir or temp_dir)
+        db_dir.mkdir(parents=True, exist_ok=True)
+
+        results = {}
+        for label, table in (("per-row", "statistics"), ("bulk", "statistics"), ("bulk short-term", "statistics_short_term")):
+            db_path = db_dir / f"{label.replace(' ', '_')}.db"
+            db_path.unlink(missing_ok=True)
+            conn = create_db(db_path)
+            try:
+                started = time.perf_counter()
+                if label == "per-row":
+                    write_per_row(conn, runs)
+                else:
+                    write_bulk(conn, runs, table, args.batch_size)
+                elapsed = time.perf_counter() - started
+                results[label] = dump(conn, table)
+                # Bulk mode only writes the selected table
+                other_tables = [other for other in backfill.STATISTICS_TABLES if other != table]
+                if any(dump(conn, other) for other in other_tables):
+                    raise SystemExit(f"{label}: rows written outside of {table}")
+            finally:
+                conn.close()
+            print(f"{label:>16}: {rows} upserts, {len(results[label])} rows in {table}, {elapsed:.2f} s")
+
+    expected = results["per-row"]
+    if len(expected) != len(SENSORS) * args.hours:
+        raise SystemExit(f"per-row: expected {len(SENSORS) * args.hours} rows, got {len(expected)}")
+    for label in ("bulk", "bulk short-term"):
+        if results[label] != expected:
+            raise SystemExit(f"{label} rows differ from the per-row rows")
+    print("Bulk rows are identical to the per-row rows in both tables.")
+
+
+if __name__ == "__main__":
+    main()
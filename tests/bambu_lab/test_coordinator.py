@@ -0,0 +1,241 @@
+"""Tests for the coalesced entity updates of the coordinator, replaying printer pushes."""
+
+import asyncio
+import json
+import math
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import EntityDescription
+import pytest
+import pytest_asyncio
+
+from custom_components.bambu_lab import definitions
+from custom_components.bambu_lab.const import DEFAULT_UPDATE_COALESCE_WINDOW
+from custom_components.bambu_lab.coordinator import BambuDataUpdateCoordinator
+from custom_components.bambu_lab.models import BambuLabCoordinatorEntity
+
+MOCK = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "..",
+    "custom_components",
+    "bambu_lab",
+    "pybambu",
+    "tests",
+    "MOCK-X1CMULTIAMS.json",
+)
+PUSH_COUNT = 600  # Ten minutes of printing at one push per second.
+PUSH_INTERVAL = 1.0  # Seconds between pushes.
+# The entity descriptions of definitions.py
+DESCRIPTIONS = [
+    description
+    for value in vars(definitions).values()
+    if isinstance(value, tuple)
+    for description in value
+    if isinstance(description, EntityDescription)
+]
+
+
+def recorded_pushes(count: int) -> list[dict]:
+    """Incremental pushes as sent during a print: temperatures jitter every push, the rest changes slowly."""
+    pushes = []
+    for i in range(count):
+        push = {
+            "command": "push_status",
+            "msg": 1,
+            "sequence_id": str(1000 + i),
+            "nozzle_temper": 220 + (i % 3) * 0.5,
+            "bed_temper": 60 + (i % 2) * 0.25,
+        }
+        if i % 30 == 0:
+            push["mc_percent"] = i // 30
+            push["mc_remaining_time"] = 120 - i // 30
+            push["layer_num"] = i // 30
+        if i % 10 == 0:
+            push["cooling_fan_speed"] = str(15 if (i // 10) % 2 else 10)
+        if i % 20 == 0:
+            push["wifi_signal"] = f"-{40 + (i // 20) % 5}dBm"
+        pushes.append(push)
+    return pushes
+
+
+class VirtualClock:
+    """Stands in for hass.loop.call_later, running the scheduled callbacks when the test advances the time."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.now = 0.0
+        self.handles: list[asyncio.TimerHandle] = []
+
+    def call_later(self, delay, callback, *args) -> asyncio.TimerHandle:
+        handle = asyncio.TimerHandle(self.now + delay, callback, args, self.loop)
+        self.handles.append(handle)
+        return handle
+
+    def advance(self, to: float) -> None:
+        while due := [
+            handle
+            for handle in self.handles
+            if not handle.cancelled() and handle.when() <= to
+        ]:
+            handle = min(due, key=lambda handle: handle.when())
+            self.handles.remove(handle)
+            self.now = handle.when()
+            handle._run()
+        self.now = to
+
+
+class CountingEntity(BambuLabCoordinatorEntity):
+    """Counts its state writes instead of writing to a state machine."""
+
+    def __init__(self, coordinator, description: EntityDescription) -> None:
+        super().__init__(coordinator)
+        self.entity_description = description
+        self.writes = 0
+
+    def async_write_ha_state(self) -> None:
+        self.writes += 1
+
+
+class Printer:
+    """A coordinator loaded with a full push, its listening entities and the flushed changes."""
+
+    def __init__(self, hass: HomeAssistant, window: float) -> None:
+        entry = SimpleNamespace(
+            entry_id="entry",
+            data={"serial": "MOCK-X1CMULTIAMS", "host": "", "device_type": "X1C"},
+            options={"update_coalesce_window": window},
+        )
+        self.coordinator = BambuDataUpdateCoordinator(hass, entry=entry)
+        self.device = self.coordinator.get_model()
+        with open(MOCK, encoding="utf-8") as file:
+            data = json.load(file)
+        self.device.info_update(data["get_version"]["info"])
+        self.device.print_update(data["pushall"]["print"])
+        self.device.pop_changed_parts()
+
+        self.entities = [CountingEntity(self.coordinator, description) for description in DESCRIPTIONS]
+        for entity in self.entities:
+            self.coordinator.async_add_listener(entity._handle_coordinator_update)
+        self.flushes = []
+        self.coordinator.async_add_listener(lambda: self.flushes.append(self.coordinator._changed_parts))
+        # Printer events are dispatched directly rather than through the MQTT thread.
+        self.coordinator.client._callback = self.coordinator.event_handler_internal
+
+    @property
+    def writes(self) -> int:
+        return sum(entity.writes for entity in self.entities)
+
+
+@pytest_asyncio.fixture
+async def hass(tmp_path):
+    """Return a Home Assistant instance."""
+    hass = HomeAssistant(str(tmp_path))
+    yield hass
+    await hass.async_stop(force=True)
+
+
+@pytest.fixture
+def clock(hass):
+    """Return the virtual clock the coordinator schedules its flushes on."""
+    clock = VirtualClock(hass.loop)
+    with patch.object(hass.loop, "call_later", clock.call_later):
+        yield clock
+
+
+@pytest.mark.asyncio
+async def test_pushes_in_window_flush_once(hass, clock) -> None:
+    """Pushes within the window are written together when it ends, by the entities of the changed data only."""
+    printer = Printer(hass, DEFAULT_UPDATE_COALESCE_WINDOW)
+
+    printer.device.print_update({"command": "push_status", "msg": 1, "nozzle_temper": 201})
+    clock.advance(DEFAULT_UPDATE_COALESCE_WINDOW / 2)
+    printer.device.print_update({"command": "push_status", "msg": 1, "cooling_fan_speed": "15"})
+    assert printer.flushes == []
+    assert printer.writes == 0
+
+    clock.advance(DEFAULT_UPDATE_COALESCE_WINDOW)
+
+    assert printer.flushes == [{"temperature", "fans"}]
+    assert printer.writes == sum(
+        1
+        for description in DESCRIPTIONS
+        if description.data_parts is None or {"temperature", "fans"}.intersection(description.data_parts)
+    )
+    assert printer.writes < len(DESCRIPTIONS)
+
+    clock.advance(math.inf)
+    assert len(printer.flushes) == 1
+
+
+@pytest.mark.asyncio
+async def test_direct_update_flushes_pending_pushes(hass, clock) -> None:
+    """An update that isn't coalesced also writes the pending changes, and cancels the pending flush."""
+    printer = Printer(hass, DEFAULT_UPDATE_COALESCE_WINDOW)
+
+    printer.device.print_update({"command": "push_status", "msg": 1, "nozzle_temper": 201})
+    printer.coordinator.event_handler_internal("event_light_update")
+
+    assert printer.flushes == [{"temperature", "lights"}]
+    clock.advance(math.inf)
+    assert len(printer.flushes) == 1
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_pending_flush(hass, clock) -> None:
+    """Pending pushes aren't written once Home Assistant is stopping."""
+    printer = Printer(hass, DEFAULT_UPDATE_COALESCE_WINDOW)
+
+    printer.device.print_update({"command": "push_status", "msg": 1, "nozzle_temper": 201})
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    clock.advance(math.inf)
+
+    assert printer.flushes == []
+    assert printer.writes == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("push_interval", [PUSH_INTERVAL, PUSH_INTERVAL / 2])
+async def test_replay_state_writes(hass, clock, push_interval) -> None:
+    """Replay a print's pushes and count the entity state writes with and without the coalescing window."""
+    pushes = recorded_pushes(PUSH_COUNT)
+    results = {}
+    for label, window in (("diff", 0), ("diff+coalesced", DEFAULT_UPDATE_COALESCE_WINDOW)):
+        clock.now = 0.0
+        printer = Printer(hass, window)
+        changed_pushes = 0
+        start = time.perf_counter()
+        for index, push in enumerate(pushes):
+            clock.advance(index * push_interval)
+            changed_pushes += printer.device.print_update(push)
+        clock.advance(math.inf)
+        elapsed = time.perf_counter() - start
+        results[label] = printer
+
+    # Before: every push wrote every entity.
+    writes_before = len(pushes) * len(DESCRIPTIONS)
+    diff, coalesced = results["diff"], results["diff+coalesced"]
+    print(
+        f"\nReplayed {len(pushes)} pushes, {push_interval}s apart, in {elapsed * 1000:.1f}ms. Entity state writes "
+        f"({len(DESCRIPTIONS)} entities, {DEFAULT_UPDATE_COALESCE_WINDOW}s window): before={writes_before} "
+        f"diff={diff.writes} diff+coalesced={coalesced.writes}"
+    )
+
+    # Without a window every push that changed something is written right away.
+    assert len(diff.flushes) == changed_pushes
+    assert all(parts and parts.issubset({"temperature", "print_job", "fans", "info"}) for parts in diff.flushes)
+    assert diff.writes < writes_before / 2
+    # The window writes the same changes, at most once per window.
+    assert set().union(*coalesced.flushes) == set().union(*diff.flushes)
+    assert len(coalesced.flushes) <= math.ceil(len(pushes) * push_interval / DEFAULT_UPDATE_COALESCE_WINDOW)
+    assert coalesced.coordinator._pending_update is None
+    if push_interval < DEFAULT_UPDATE_COALESCE_WINDOW:
+        assert coalesced.writes < diff.writes
+    else:
+        assert coalesced.writes == diff.writes
@@ -0,0 +1,199 @@
+"""Tests for the parallel content downloader, against a stand-in for raw.githubusercontent.com."""
+
+import asyncio
+import os
+from types import SimpleNamespace
+
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+from homeassistant.core import HomeAssistant
+import pytest
+import pytest_asyncio
+
+from custom_components.hacs.base import HacsBase
+from custom_components.hacs.const import DEFAULT_CONCURRENT_DOWNLOADS
+from custom_components.hacs.repositories.plugin import HacsPluginRepository
+from custom_components.hacs.utils import download
+from custom_components.hacs.utils.download import ContentDownloader, DownloadRequest
+
+FILE_COUNT = 40
+FILE_SIZE = 3 * download.WRITE_BUFFER_SIZE // 2
+# Per request latency of the stand-in server, so parallel downloads overlap.
+LATENCY = 0.05
+
+
+class StandInServer:
+    """Serves /<owner>/<repository>/<ref>/<file> like raw.githubusercontent.com.
+
+    As there, a "tags/<version>" ref doesn't resolve and gets a 404.
+    """
+
+    def __init__(self) -> None:
+        self.files: dict[str, bytes] = {}
+        self.requested: list[str] = []
+        self.active = 0
+        self.max_active = 0
+        app = web.Application()
+        app.router.add_get("/{owner}/{repository}/{ref}/{name}", self._handle_file)
+        app.router.add_get("/broken/{name}", self._handle_broken)
+        self.server = TestServer(app)
+
+    def url(self, path: str) -> str:
+        return str(self.server.make_url(path))
+
+    async def _handle_file(self, request: web.Request) -> web.StreamResponse:
+        self.requested.append(request.path)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(LATENCY)
+            if (content := self.files.get(request.path)) is None:
+                raise web.HTTPNotFound
+            response = web.StreamResponse()
+            response.content_length = len(content)
+            await response.prepare(request)
+            for start in range(0, len(content), download.CHUNK_SIZE):
+                await response.write(content[start : start + download.CHUNK_SIZE])
+            return response
+        finally:
+            self.active -= 1
+
+    async def _handle_broken(self, request: web.Request) -> web.StreamResponse:
+        """Send part of the announced content, then drop the connection."""
+        self.requested.append(request.path)
+        response = web.StreamResponse()
+        response.content_length = 10 * download.WRITE_BUFFER_SIZE
+        await response.prepare(request)
+        await response.write(b"x" * 2 * download.WRITE_BUFFER_SIZE)
+        request.transport.close()
+        return response
+
+
+@pytest_asyncio.fixture
+async def hass(tmp_path):
+    """Return a Home Assistant instance."""
+    hass = HomeAssistant(str(tmp_path))
+    yield hass
+    await hass.async_stop(force=True)
+
+
+@pytest_asyncio.fixture
+async def server(socket_enabled):
+    """Return the running stand-in server."""
+    server = StandInServer()
+    await server.server.start_server()
+    yield server
+    await server.server.close()
+
+
+@pytest_asyncio.fixture
+async def session():
+    """Return a client session."""
+    async with ClientSession() as session:
+        yield session
+
+
+def temp_files(directory) -> list[str]:
+    return [name for name in os.listdir(directory) if name.endswith(".tmp")]
+
+
+@pytest.mark.asyncio
+async def test_download_parallel(hass, server, session, tmp_path) -> None:
+    """Files are streamed in parallel, bounded by the download slots, and renamed into place."""
+    requests = []
+    for number in range(FILE_COUNT):
+        path = f"/owner/repository/1.0.0/file{number}.js"
+        server.files[path] = bytes([number]) * FILE_SIZE
+        requests.append(
+            DownloadRequest(
+                url=server.url(path),
+                local_path=str(tmp_path / "out" / f"file{number}.js"),
+                name=f"file{number}.js",
+            )
+        )
+    progress = []
+    downloader = ContentDownloader(
+        hass,
+        session,
+        on_progress=progress.append,
+        slots=asyncio.Semaphore(DEFAULT_CONCURRENT_DOWNLOADS),
+    )
+
+    errors = await downloader.async_download(requests)
+
+    assert errors == []
+    for number in range(FILE_COUNT):
+        with open(tmp_path / "out" / f"file{number}.js", "rb") as file:
+            assert file.read() == bytes([number]) * FILE_SIZE
+        # .js files get their gzipped companion.
+        assert os.path.isfile(tmp_path / "out" / f"file{number}.js.gz")
+    assert temp_files(tmp_path / "out") == []
+    assert downloader.stats.completed == FILE_COUNT
+    assert downloader.stats.bytes == FILE_COUNT * FILE_SIZE
+    assert len(progress) == FILE_COUNT
+    assert 1 < server.max_active <= DEFAULT_CONCURRENT_DOWNLOADS
+
+    stats = downloader.stats.as_dict()
+    print(
+        f"\nDownloaded {stats['files']} files ({stats['bytes']} bytes) in {stats['elapsed']}s, "
+        f"{stats['throughput']} bytes/s, {server.max_active} at once"
+    )
+
+
+@pytest.mark.asyncio
+async def test_download_failure_discards_temp_file(hass, server, session, tmp_path) -> None:
+    """A failed download leaves no temporary or partial file behind and keeps the old file."""
+    (tmp_path / "out").mkdir()
+    (tmp_path / "out" / "broken.js").write_bytes(b"previous")
+    downloader = ContentDownloader(hass, session, slots=asyncio.Semaphore(1))
+
+    errors = await downloader.async_download(
+        [
+            DownloadRequest(
+                url=server.url("/broken/broken.js"),
+                local_path=str(tmp_path / "out" / "broken.js"),
+                name="broken.js",
+            ),
+            DownloadRequest(
+                url=server.url("/owner/repository/1.0.0/missing.js"),
+                local_path=str(tmp_path / "out" / "missing.js"),
+                name="missing.js",
+            ),
+        ]
+    )
+
+    assert len(errors) == 2
+    assert "Got status code 404" in errors[1]
+    assert (tmp_path / "out" / "broken.js").read_bytes() == b"previous"
+    assert not os.path.exists(tmp_path / "out" / "missing.js")
+    assert temp_files(tmp_path / "out") == []
+    assert downloader.stats.failed == 2
+    assert downloader.stats.bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_download_content_strips_tags_from_urls(hass, server, session, tmp_path) -> None:
+    """Trees fetched for a tags/<version> ref link to URLs that only work without "tags/"."""
+    server.files["/owner/card/1.0.0/card.js"] = b"card"
+    hacs = HacsBase()
+    hacs.hass = hass
+    hacs.session = session
+    hacs.core.config_path = str(tmp_path)
+    repository = HacsPluginRepository(hacs, "owner/card")
+    repository.data.file_name = "card.js"
+    repository.ref = "tags/1.0.0"
+    repository.tree = [
+        SimpleNamespace(
+            path="",
+            filename="card.js",
+            full_path="card.js",
+            is_directory=False,
+            download_url=server.url("/owner/card/tags/1.0.0/card.js"),
+        )
+    ]
+
+    await repository.download_content()
+
+    assert repository.validate.errors == []
+    assert server.requested == ["/owner/card/1.0.0/card.js"]
+    assert (tmp_path / "www" / "community" / "card" / "card.js").read_bytes() == b"card"
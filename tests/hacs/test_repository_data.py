@@ -0,0 +1,43 @@
+"""Tests for the repository data of HACS repositories."""
+
+import pytest
+
+from custom_components.hacs.base import HacsBase
+from custom_components.hacs.repositories import REPOSITORY_CLASSES
+from custom_components.hacs.repositories.base import REPOSITORY_DATA_FIELDS, RepositoryData
+
+
+@pytest.mark.parametrize("category", sorted(REPOSITORY_CLASSES))
+def test_repository_classes_register(category: str) -> None:
+    """Every repository class can be built and registered by its full name."""
+    hacs = HacsBase()
+    repository = REPOSITORY_CLASSES[category](hacs, f"Owner/Repository-{category}")
+    repository.data.id = "1337"
+
+    hacs.repositories.register(repository)
+
+    assert repository.data.full_name_lower == f"owner/repository-{category}"
+    assert hacs.repositories.get_by_full_name(f"owner/repository-{category}") is repository
+    assert hacs.repositories.get_by_id("1337") is repository
+    assert hacs.repositories.list_category(repository.data.category) == [repository]
+
+    hacs.repositories.unregister(repository)
+    assert hacs.repositories.get_by_full_name(f"owner/repository-{category}") is None
+
+
+def test_full_name_lower_not_persisted() -> None:
+    """The registry key is neither exported nor restored."""
+    data = RepositoryData(full_name="Owner/Repository")
+    data.full_name_lower = "owner/repository"
+
+    assert "full_name_lower" not in data.to_json()
+    assert "full_name_lower" not in REPOSITORY_DATA_FIELDS
+    assert RepositoryData.create_from_dict({"full_name_lower": "other"}).full_name_lower == ""
+
+
+def test_slotted() -> None:
+    """Repository data doesn't carry a per-instance dict."""
+    data = RepositoryData()
+    assert not hasattr(data, "__dict__")
+    with pytest.raises(AttributeError):
+        data.not_a_field = True
@@ -0,0 +1,111 @@
+"""Tests for the secondary indexes of the HACS repository registry."""
+
+import random
+
+from custom_components.hacs.base import HacsBase, HacsRepositories
+from custom_components.hacs.repositories import REPOSITORY_CLASSES
+
+CATEGORIES = sorted(REPOSITORY_CLASSES)
+
+
+def assert_indexes_consistent(repositories: HacsRepositories, unregistered: list) -> None:
+    """Compare every index against a full scan of the registered repositories."""
+    registered = repositories.list_all
+    for category in [*CATEGORIES, "unknown"]:
+        for downloaded in (None, True, False):
+            expected = {
+                repository
+                for repository in registered
+                if repository.data.category == category
+                and (downloaded is None or repository.data.installed == downloaded)
+            }
+            listed = repositories.list_category(category, downloaded=downloaded)
+            assert len(listed) == len(expected)
+            assert set(listed) == expected, (category, downloaded)
+        assert repositories.category_downloaded(category) == any(
+            repository.data.category == category and repository.data.installed
+            for repository in registered
+        )
+    assert set(repositories.list_downloaded) == {
+        repository for repository in registered if repository.data.installed
+    }
+    for repository in unregistered:
+        assert repository not in repositories.list_downloaded
+        assert repository not in repositories.list_category(repository.data.category)
+
+
+def test_indexes_follow_every_mutation() -> None:
+    """Randomized registrations and data changes keep the indexes equal to a full scan."""
+    rng = random.Random(1234)
+    hacs = HacsBase()
+    repositories = hacs.repositories
+    unregistered = []
+    next_id = 1
+
+    def new_repository():
+        nonlocal next_id
+        category = rng.choice(CATEGORIES)
+        repository = REPOSITORY_CLASSES[category](hacs, f"owner/repository-{next_id}")
+        repository.data.id = str(next_id)
+        repository.data.installed = rng.random() < 0.3
+        next_id += 1
+        return repository
+
+    for step in range(3000):
+        registered = repositories.list_all
+        action = rng.randrange(8)
+        if action == 0 or not registered:
+            repositories.register(new_repository(), default=rng.random() < 0.5)
+        elif action == 1:
+            repository = rng.choice(registered)
+            repositories.unregister(repository)
+            unregistered.append(repository)
+        elif action == 2:
+            rng.choice(registered).data.installed = rng.random() < 0.5
+        elif action == 3:
+            rng.choice(registered).data.category = rng.choice(CATEGORIES)
+        elif action == 4:
+            rng.choice(registered).data.update_data(
+                {
+                    "installed": rng.random() < 0.5,
+                    "category": rng.choice(CATEGORIES),
+                    "stargazers_count": step,
+                }
+            )
+        elif action == 5:
+            # Unrelated fields don't move the repository.
+            repository = rng.choice(registered)
+            repository.data.update_data({"last_version": f"1.{step}", "new": False})
+        elif action == 6 and unregistered:
+            # Changes to unregistered repositories don't reach the indexes until they are
+            # registered again.
+            repository = rng.choice(unregistered)
+            repository.data.installed = not repository.data.installed
+            repository.data.category = rng.choice(CATEGORIES)
+            if rng.random() < 0.5:
+                unregistered.remove(repository)
+                repositories.register(repository)
+        else:
+            # A repository that was renamed is registered again under the same id.
+            repository = rng.choice(registered)
+            renamed = REPOSITORY_CLASSES[repository.data.category](hacs, f"owner/renamed-{step}")
+            renamed.data.id = repository.data.id
+            repositories.register(renamed)
+
+        assert_indexes_consistent(repositories, unregistered)
+
+
+def test_indexes_keep_registration_order() -> None:
+    """Repositories are listed in the order they were registered."""
+    hacs = HacsBase()
+    created = []
+    for number in range(20):
+        repository = REPOSITORY_CLASSES["integration"](hacs, f"owner/repository-{number}")
+        repository.data.id = str(number + 1)
+        repository.data.installed = number % 2 == 0
+        hacs.repositories.register(repository)
+        created.append(repository)
+
+    assert hacs.repositories.list_category("integration") == created
+    assert hacs.repositories.list_category("integration", downloaded=True) == created[::2]
+    assert hacs.repositories.list_downloaded == created[::2]
@@ -0,0 +1,86 @@
+"""Tests for finding a sensor's competition through the scoreboard index.
+
+expected_values.json holds the values the nested scoreboard walk in event.py set for each
+search key, before the index replaced it.  ncaaf_scoreboard.json is a 100 event college
+football scoreboard, mma_scoreboard.json has athlete competitors whose names start the
+event short name.
+"""
+
+import json
+import os
+
+import pytest
+
+from custom_components.teamtracker.clear_values import async_clear_values
+from custom_components.teamtracker.event import async_process_event
+from custom_components.teamtracker.scoreboard import MATCH_ATHLETE, ScoreboardIndex
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+SCOREBOARDS = {
+    "ncaa": ("ncaaf_scoreboard.json", "football", "NCAAF"),
+    "mma": ("mma_scoreboard.json", "mma", "UFC"),
+}
+# Relative to the time of the test run
+VOLATILE_VALUES = ("kickoff_in", "last_update")
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as file:
+        return json.load(file)
+
+
+EXPECTED_VALUES = load_fixture("expected_values.json")
+CASES = [
+    (scoreboard, search_key)
+    for scoreboard, expected in EXPECTED_VALUES.items()
+    for search_key in expected
+]
+
+
+async def process_event(scoreboard, search_key, index=None):
+    file_name, sport_path, league_id = SCOREBOARDS[scoreboard]
+    data = index.data if index is not None else load_fixture(file_name)
+    values = await async_clear_values()
+    values["state"] = "NOT_FOUND"
+    values = await async_process_event(
+        values, "sensor", data, sport_path, league_id, "logo", search_key, "en", index
+    )
+    for key in VOLATILE_VALUES:
+        values.pop(key, None)
+    # Compare as stored in the fixture
+    return json.loads(json.dumps(values, sort_keys=True, default=str))
+
+
+def test_fixture_covers_search_keys():
+    """The expected values cover the 29 college football search keys."""
+    assert len(EXPECTED_VALUES["ncaa"]) == 29
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("scoreboard", "search_key"), CASES)
+async def test_values_unchanged(scoreboard, search_key):
+    """Each search key sets the same values as the nested scoreboard walk."""
+    assert (
+        await process_event(scoreboard, search_key)
+        == EXPECTED_VALUES[scoreboard][search_key]
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("scoreboard", sorted(SCOREBOARDS))
+async def test_shared_index_values_unchanged(scoreboard):
+    """Sensors sharing a league's index get the same values as with their own index."""
+    index = ScoreboardIndex(load_fixture(SCOREBOARDS[scoreboard][0]))
+    for search_key, expected in EXPECTED_VALUES[scoreboard].items():
+        assert await process_event(scoreboard, search_key, index) == expected
+
+
+def test_athlete_not_matched_by_event_name():
+    """Athletes are found by name even when their name starts the event short name."""
+    index = ScoreboardIndex(load_fixture("mma_scoreboard.json"))
+
+    matches = index.find("NOVAK DJOKOVIC", "sensor")
+
+    assert [(entry.athlete, kind) for entry, kind in matches] == [
+        ("NOVAK DJOKOVIC", MATCH_ATHLETE)
+    ]
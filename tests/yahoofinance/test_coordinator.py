@@ -0,0 +1,208 @@
+"""Tests for the chunked quote requests, against a stand-in for the Yahoo quote API."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+from homeassistant.core import HomeAssistant
+import pytest
+import pytest_asyncio
+
+from custom_components.yahoofinance import coordinator as coordinator_module
+from custom_components.yahoofinance.const import (
+    DATA_REGULAR_MARKET_PRICE,
+    MANUAL_SCAN_INTERVAL,
+    MAX_PARALLEL_REQUESTS,
+    MAX_SYMBOLS_PER_REQUEST,
+)
+from custom_components.yahoofinance.coordinator import (
+    CrumbCoordinator,
+    YahooSymbolUpdateCoordinator,
+)
+
+SYMBOL_COUNT = 150
+# Latency of the stand-in server per request and per requested symbol, so chunks overlap.
+LATENCY = 0.05
+SYMBOL_LATENCY = 0.002
+
+
+class StandInQuoteServer:
+    """Serves /v7/finance/quote?symbols=<symbols>&crumb=<crumb> like the Yahoo quote API."""
+
+    def __init__(self) -> None:
+        self.prices: dict[str, float] = {}
+        self.failing: set[str] = set()
+        """Requests including any of these symbols fail."""
+        self.requests: list[list[str]] = []
+        self.active = 0
+        self.max_active = 0
+        app = web.Application()
+        app.router.add_get("/v7/finance/quote", self._handle_quote)
+        self.server = TestServer(app)
+
+    def url(self, path: str) -> str:
+        return str(self.server.make_url(path))
+
+    async def _handle_quote(self, request: web.Request) -> web.Response:
+        symbols = request.query["symbols"].split(",")
+        assert request.query["crumb"] == "crumb"
+        self.requests.append(symbols)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(LATENCY + SYMBOL_LATENCY * len(symbols))
+            if self.failing.intersection(symbols):
+                return web.json_response(
+                    {"finance": {"result": None, "error": {"code": "Internal Server Error"}}},
+                    status=500,
+                )
+            return web.json_response(
+                {
+                    "quoteResponse": {
+                        "result": [
+                            {
+                                "symbol": symbol,
+                                "shortName": symbol,
+                                "exchange": "NMS",
+                                "marketState": "REGULAR",
+                                DATA_REGULAR_MARKET_PRICE: self.prices[symbol],
+                            }
+                            for symbol in symbols
+                        ],
+                        "error": None,
+                    }
+                }
+            )
+        finally:
+            self.active -= 1
+
+
+@pytest_asyncio.fixture
+async def hass(tmp_path):
+    """Return a Home Assistant instance."""
+    hass = HomeAssistant(str(tmp_path))
+    yield hass
+    await hass.async_stop(force=True)
+
+
+@pytest_asyncio.fixture
+async def server(socket_enabled):
+    """Return the running stand-in server with a price for every symbol."""
+    server = StandInQuoteServer()
+    server.prices = {f"SYM{number}": float(number) for number in range(SYMBOL_COUNT)}
+    await server.server.start_server()
+    yield server
+    await server.server.close()
+
+
+@pytest_asyncio.fixture
+async def session():
+    """Return a client session."""
+    async with ClientSession() as session:
+        yield session
+
+
+@pytest.fixture
+def make_coordinator(hass, server, session):
+    """Return a function building a coordinator for the symbols of the stand-in server."""
+
+    def make_coordinator() -> YahooSymbolUpdateCoordinator:
+        crumb_coordinator = CrumbCoordinator(hass)
+        crumb_coordinator.crumb = "crumb"
+        with patch.object(coordinator_module, "async_get_clientsession", return_value=session):
+            return YahooSymbolUpdateCoordinator(
+                list(server.prices), hass, MANUAL_SCAN_INTERVAL, crumb_coordinator
+            )
+
+    with patch.object(coordinator_module, "BASE", server.url("/v7/finance/quote?symbols=")):
+        yield make_coordinator
+
+
+def prices(coordinator: YahooSymbolUpdateCoordinator) -> dict[str, float]:
+    return {
+        symbol: symbol_data[DATA_REGULAR_MARKET_PRICE]
+        for symbol, symbol_data in coordinator.data.items()
+    }
+
+
+@pytest.mark.asyncio
+async def test_refresh_parallel_chunks(server, make_coordinator) -> None:
+    """Symbols are requested in parallel chunks, and only changed symbols are reported."""
+    coordinator = make_coordinator()
+
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert prices(coordinator) == server.prices
+    assert [len(symbols) for symbols in server.requests] == [
+        MAX_SYMBOLS_PER_REQUEST,
+        MAX_SYMBOLS_PER_REQUEST,
+        MAX_SYMBOLS_PER_REQUEST,
+        SYMBOL_COUNT - 3 * MAX_SYMBOLS_PER_REQUEST,
+    ]
+    assert 1 < server.max_active <= MAX_PARALLEL_REQUESTS
+    assert coordinator.changed_symbols == set(server.prices)
+
+    await coordinator.async_refresh()
+    assert coordinator.changed_symbols == set()
+
+    server.prices["SYM7"] = 7.5
+    await coordinator.async_refresh()
+    assert coordinator.changed_symbols == {"SYM7"}
+    assert prices(coordinator) == server.prices
+
+
+@pytest.mark.asyncio
+async def test_partial_chunk_failure_keeps_previous_data(server, make_coordinator) -> None:
+    """Symbols of a failed chunk keep their previous data, the other chunks are updated."""
+    coordinator = make_coordinator()
+    await coordinator.async_refresh()
+    previous_prices = dict(server.prices)
+
+    # SYM0 is in the first chunk
+    server.failing = {"SYM0"}
+    server.prices = {symbol: price + 1 for symbol, price in server.prices.items()}
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    first_chunk = set(coordinator.get_symbol_chunks()[0])
+    for symbol, price in prices(coordinator).items():
+        expected = previous_prices if symbol in first_chunk else server.prices
+        assert price == expected[symbol]
+    assert coordinator.changed_symbols == set(server.prices) - first_chunk
+
+    # The refresh fails only if every chunk fails, the data is kept
+    server.failing = set(server.prices)
+    await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    assert {symbol: prices(coordinator)[symbol] for symbol in first_chunk} == {
+        symbol: previous_prices[symbol] for symbol in first_chunk
+    }
+
+
+@pytest.mark.asyncio
+async def test_benchmark_refresh(server, make_coordinator) -> None:
+    """Time a refresh of all symbols in a single request and in parallel chunks."""
+    timings = {}
+    for label, symbols_per_request in (
+        ("single request", SYMBOL_COUNT),
+        ("parallel chunks", MAX_SYMBOLS_PER_REQUEST),
+    ):
+        server.requests = []
+        with patch.object(coordinator_module, "MAX_SYMBOLS_PER_REQUEST", symbols_per_request):
+            coordinator = make_coordinator()
+            start = time.perf_counter()
+            await coordinator.async_refresh()
+            timings[label] = time.perf_counter() - start
+
+        assert coordinator.last_update_success
+        assert prices(coordinator) == server.prices
+        assert len(server.requests) == -(-SYMBOL_COUNT // symbols_per_request)
+
+    print(
+        f"\nRefresh of {SYMBOL_COUNT} symbols: "
+        + ", ".join(f"{label} {timing * 1000:.0f} ms" for label, timing in timings.items())
+    )